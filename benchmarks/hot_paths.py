@@ -0,0 +1,332 @@
+"""
+Microbenchmarks of the local hot paths of jiraclui.
+
+Every benchmark runs on synthetic datasets of 1k to 100k tickets and never
+touches the network. Results can be saved as a JSON baseline and later compared
+against it; the comparison fails when a budget from budgets.json is exceeded.
+Timings are taken relative to a calibration workload and as the median of several
+rounds, so that a baseline stays comparable on a busy machine.
+
+Usage:
+    python benchmarks/hot_paths.py --save benchmarks/baseline.json
+    python benchmarks/hot_paths.py --compare benchmarks/baseline.json
+"""
+import argparse
+import contextlib
+import gc
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from rich.console import Console  # noqa: E402
+from jiraclui.filter_engine import FilterIndex  # noqa: E402
+from jiraclui.helper import Helper  # noqa: E402
+from jiraclui.jira_board import JiraBoard  # noqa: E402
+from jiraclui.offline import OfflineClient  # noqa: E402
+from jiraclui.ticket import Ticket  # noqa: E402
+from jiraclui.ticket_store import TicketStore  # noqa: E402
+
+DEFAULT_SIZES = (1000, 10000, 100000)
+# Shortest timed sample; faster operations are run several times per sample.
+MIN_SAMPLE_MS = 20
+# Samples of the calibration workload timed before and after every benchmark.
+CALIBRATION_REPEAT = 5
+DEFAULT_BUDGETS = os.path.join(os.path.dirname(os.path.abspath(__file__)), "budgets.json")
+# Queries typed in filter mode, in order; '+' refines the previous result.
+FILTER_QUERIES = ("alice", "alic", "in progress", "+pra", "deploy pipeline", "PRB-12", "")
+# Structured queries, answered from the column indexes of the filter index.
+STRUCTURED_QUERIES = ('status:"In Progress" assignee:"Alice Smith" -reporter:"Bob Jones"', "status:open OR status:blocked",
+                      "type:bug title:deploy", "key:PRA-100..PRA-5000", "-status:done -status:closed", "assignee:/^carol/")
+WORDS = ("deploy", "pipeline", "login", "fails", "update", "docs", "cache", "timeout", "report", "export",
+         "migrate", "database", "dashboard", "flaky", "test", "release", "notes", "upgrade", "api", "error")
+PEOPLE = tuple(f"{first} {last}" for first in ("Alice", "Bob", "Carol", "Dave", "Erin", "Frank", "Grace")
+               for last in ("Smith", "Jones", "Brown", "Miller", "Davis", "Wilson", "Moore"))
+STATUSES = ("Open", "In Progress", "In Review", "Blocked", "Done", "Closed")
+PROJECTS = (("PRA", "Project A"), ("PRB", "Project B"), ("PRC", "Project C"))
+
+
+def make_raw_issues(size, seed=0):
+    """
+    Build a reproducible synthetic search result.
+
+    Args:
+        size (int): Number of issues.
+        seed (int): Random seed.
+
+    Returns:
+        list: Raw issue dictionaries shaped like the JSON of a Jira search.
+    """
+    rng = random.Random(seed)
+    issues = []
+    for number in range(size):
+        project_key, project_name = PROJECTS[number % len(PROJECTS)]
+        assignee = rng.choice(PEOPLE + (None,))
+        timestamp = f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}T10:00:00.000+0000"
+        issues.append({
+            'key': f"{project_key}-{number + 1}",
+            'fields': {
+                'project': {'key': project_key, 'name': project_name},
+                'summary': " ".join(rng.sample(WORDS, 5)),
+                'assignee': {'displayName': assignee} if assignee else None,
+                'reporter': {'displayName': rng.choice(PEOPLE)},
+                'status': {'name': rng.choice(STATUSES)},
+                'issuetype': {'name': rng.choice(("Bug", "Task", "Story"))},
+                'created': timestamp,
+                'updated': timestamp,
+            },
+        })
+    return issues
+
+
+class Benchmarks:
+    """
+    The benchmarked operations. Every bench_* method receives a dataset and returns
+    the callable to time, after doing its setup.
+    """
+
+    def __init__(self):
+        self.app_options = {'cache_dir': tempfile.mkdtemp(prefix="jiraclui-bench-")}
+        self.helper = Helper(self.app_options)
+        self.null_output = open(os.devnull, 'w', encoding='utf-8')
+        self.menu_measured = False
+        self.client = OfflineClient(TicketStore(os.path.join(self.app_options['cache_dir'], "tickets.db")),
+                                    "https://jira.example.com", "token", self.app_options)
+
+    def new_board(self, tickets):
+        with contextlib.redirect_stdout(self.null_output):
+            return JiraBoard(list(tickets), "https://jira.example.com", "token", [key for key, _ in PROJECTS], [],
+                             False, self.app_options, render=False, jira_client=self.client)
+
+    def bench_to_tickets(self, raw_issues, tickets):
+        return lambda: [Ticket.from_json(raw_issue) for raw_issue in raw_issues]
+
+    def bench_filter_index(self, raw_issues, tickets):
+        return lambda: FilterIndex(tickets)
+
+    def bench_build_table(self, raw_issues, tickets):
+        board = self.new_board(tickets)
+        return lambda: board.build_table(print_table=False)
+
+    def bench_update_filter_text(self, raw_issues, tickets):
+        board = self.new_board(tickets)
+        board.filter_data("warm up the index")
+
+        def filter_queries():
+            with contextlib.redirect_stdout(self.null_output):
+                for query in FILTER_QUERIES:
+                    board.update_filter_text(query)
+        return filter_queries
+
+    def bench_filter_query(self, raw_issues, tickets):
+        index = FilterIndex(tickets)
+
+        def run_queries():
+            for query in STRUCTURED_QUERIES:
+                index.search(query)
+        return run_queries
+
+    def bench_render(self, raw_issues, tickets):
+        board = self.new_board(tickets)
+        board.build_table(print_table=False)
+        console = Console(file=self.null_output, width=160)
+        return lambda: console.print(board.table)
+
+    def bench_print_menu(self, raw_issues, tickets):
+        # The menu does not depend on the dataset, so it is measured with the first size only.
+        if self.menu_measured:
+            return None
+        self.menu_measured = True
+
+        def print_menu():
+            with contextlib.redirect_stdout(self.null_output):
+                self.helper.print_menu()
+        return print_menu
+
+    def names(self):
+        return [name[len("bench_"):] for name in dir(self) if name.startswith("bench_")]
+
+
+def calibration_workload():
+    """
+    A fixed pure Python workload, timed next to every benchmark to measure the current
+    speed of the machine.
+    """
+    values = {}
+    for number in range(2000):
+        values[f"key{number}"] = (number, str(number).upper(), [number])
+    return sorted(values, key=len)
+
+
+def time_call(function, repeat):
+    """
+    Time a callable.
+
+    Fast operations are looped so that every timed sample lasts at least MIN_SAMPLE_MS,
+    as timer resolution and scheduling noise would otherwise dominate sub-millisecond
+    timings, and the garbage collector is paused while sampling.
+
+    Args:
+        function (callable): The operation to time.
+        repeat (int): Number of timed samples, after one warm-up run.
+
+    Returns:
+        dict: 'min_ms', 'trimmed_ms' (mean of the middle half) and 'median_ms' per call.
+    """
+    start = time.perf_counter()
+    function()
+    warm_up_ms = (time.perf_counter() - start) * 1000
+    number = max(1, int(MIN_SAMPLE_MS / warm_up_ms)) if warm_up_ms else 1000
+    timings = []
+    # As in timeit, collections triggered by the garbage of other benchmarks are kept out of the timings.
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for _ in range(number):
+                function()
+            timings.append((time.perf_counter() - start) * 1000 / number)
+    finally:
+        gc.enable()
+    timings.sort()
+    middle = timings[len(timings) // 4:len(timings) - len(timings) // 4]
+    return {'min_ms': round(timings[0], 4), 'trimmed_ms': round(statistics.mean(middle), 4),
+            'median_ms': round(statistics.median(timings), 4)}
+
+
+def run_benchmarks(sizes, repeat, selected=None, rounds=3):
+    """
+    Run every benchmark on every dataset size.
+
+    The benchmarks of a size are run in several interleaved rounds, and the median of
+    every measure over the rounds is kept, so that a slow spell of the machine during
+    one benchmark does not decide its result.
+
+    Args:
+        sizes (list): Dataset sizes.
+        repeat (int): Number of timed samples per benchmark and round.
+        selected (list, optional): Names of the benchmarks to run, all by default.
+        rounds (int): Number of rounds.
+
+    Returns:
+        dict: Results by 'name[size]'.
+    """
+    benchmarks = Benchmarks()
+    results = {}
+    for size in sizes:
+        raw_issues = make_raw_issues(size)
+        tickets = [Ticket.from_json(raw_issue) for raw_issue in raw_issues]
+        functions = {}
+        for name in benchmarks.names():
+            if selected and name not in selected:
+                continue
+            function = getattr(benchmarks, f"bench_{name}")(raw_issues, tickets)
+            if function is not None:
+                functions[f"{name}[{size}]"] = function
+        measures = {key: [] for key in functions}
+        for _ in range(rounds):
+            for key, function in functions.items():
+                before = time_call(calibration_workload, CALIBRATION_REPEAT)['trimmed_ms']
+                result = time_call(function, repeat)
+                after = time_call(calibration_workload, CALIBRATION_REPEAT)['trimmed_ms']
+                result['relative'] = result['trimmed_ms'] * 2 / (before + after)
+                measures[key].append(result)
+        for key, runs in measures.items():
+            results[key] = result = {measure: round(statistics.median(run[measure] for run in runs), 4)
+                                     for measure in runs[0]}
+            print(f"{key}: min {result['min_ms']:.3f} ms, trimmed mean {result['trimmed_ms']:.3f} ms, "
+                  f"median {result['median_ms']:.3f} ms, {result['relative']:.3f}x calibration")
+    return results
+
+
+def compare(results, baseline, budgets):
+    """
+    Compare results with a baseline.
+
+    Runs are compared by their trimmed mean, the mean of their middle samples, relative
+    to the calibration workload timed around them, so that neither outliers nor the
+    machine getting faster or slower between the baseline and the run count as a
+    change. A benchmark exceeds its budget when it is more than 'max_ratio' times slower
+    than the baseline, unless it takes less than 'min_ms', below which ratios are noise;
+    or when it takes more than 'max_ms'. Budgets are looked up by 'name[size]', then by
+    name, then under 'default'.
+
+    Args:
+        results (dict): Current results.
+        baseline (dict): Baseline results.
+        budgets (dict): Budgets as loaded from budgets.json.
+
+    Returns:
+        list: Messages describing every exceeded budget.
+    """
+    failures = []
+    for key, result in sorted(results.items()):
+        name = key.split("[")[0]
+        budget = {}
+        for budget_key in ('default', name, key):
+            budget.update(budgets.get(budget_key, {}))
+        measured = result['trimmed_ms']
+        base = baseline.get(key)
+        if base and base.get('relative'):
+            ratio = result['relative'] / base['relative']
+        else:
+            # Baselines saved without calibration are compared by their median time.
+            ratio = measured / base['median_ms'] if base and base.get('median_ms') else None
+        line = f"{key}: {measured:.3f} ms"
+        if ratio is not None:
+            line += f" ({ratio:.2f}x baseline)"
+        print(line)
+        if ratio is not None and 'max_ratio' in budget and ratio > budget['max_ratio'] \
+                and measured >= budget.get('min_ms', 0):
+            failures.append(f"{key} is {ratio:.2f}x its baseline, budget {budget['max_ratio']}x")
+        if 'max_ms' in budget and measured > budget['max_ms']:
+            failures.append(f"{key} takes {measured:.3f} ms, budget {budget['max_ms']} ms")
+    return failures
+
+
+def parse_args(args):
+    """Parse command line parameters"""
+    parser = argparse.ArgumentParser(description="jiraclui hot path benchmarks")
+    parser.add_argument("--sizes", default=",".join(str(size) for size in DEFAULT_SIZES),
+                        help="comma separated dataset sizes")
+    parser.add_argument("--repeat", type=int, default=15, help="timed samples per benchmark and round")
+    parser.add_argument("--rounds", type=int, default=3, help="interleaved rounds, whose median is kept")
+    parser.add_argument("--only", help="comma separated benchmark names to run")
+    parser.add_argument("--save", help="write the results as a JSON baseline to this file")
+    parser.add_argument("--compare", help="compare with this JSON baseline and fail if a budget is exceeded")
+    parser.add_argument("--budgets", default=DEFAULT_BUDGETS, help="JSON file of budgets")
+    return parser.parse_args(args)
+
+
+def main(args):
+    """Run the benchmarks, then save or compare the results"""
+    args = parse_args(args)
+    sizes = [int(size) for size in args.sizes.split(",")]
+    results = run_benchmarks(sizes, args.repeat, args.only.split(",") if args.only else None, args.rounds)
+
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as file:
+            json.dump({'python': platform.python_version(), 'machine': platform.machine(), 'results': results},
+                      file, indent=2, sort_keys=True)
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as file:
+            baseline = json.load(file)['results']
+        with open(args.budgets, 'r', encoding='utf-8') as file:
+            budgets = json.load(file)
+        failures = compare(results, baseline, budgets)
+        if failures:
+            print("\nBudget exceeded:\n  " + "\n  ".join(failures))
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,51 @@
+import random
+import threading
+from jiraclui.logger import get_logger
+logger = get_logger(__name__)
+
+
+class AutoRefresher(threading.Thread):
+    """
+    Background worker polling Jira for changed tickets at a jittered interval.
+
+    Every poll asks only for tickets updated since the previous one; the
+    change callback is invoked only when the poll returned something.
+    """
+
+    def __init__(self, poll, on_change, interval, jitter):
+        """
+        Initialize the worker. Call start() to begin polling.
+
+        Args:
+            poll (callable): Returns the tickets changed since the previous call.
+            on_change (callable): Called with the changed tickets when there are any.
+            interval (float): Seconds between two polls.
+            jitter (float): Maximum random number of seconds added to every interval.
+        """
+        super().__init__(name="jiraclui-auto-refresh", daemon=True)
+        self.poll = poll
+        self.on_change = on_change
+        self.interval = interval
+        self.jitter = jitter
+        self.stop_event = threading.Event()
+
+    def next_delay(self):
+        """
+        Return the number of seconds to wait before the next poll.
+        """
+        return self.interval + random.uniform(0, self.jitter)
+
+    def run(self):
+        while not self.stop_event.wait(self.next_delay()):
+            try:
+                changed = self.poll()
+                if changed:
+                    self.on_change(changed)
+            except Exception as e:
+                logger.warning(f"Auto refresh failed, retrying in the next poll: {e}")
+
+    def stop(self):
+        """
+        Stop polling. The worker exits after the current poll, if any.
+        """
+        self.stop_event.set()
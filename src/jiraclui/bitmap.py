@@ -0,0 +1,39 @@
+def bitmap_from_slots(slots):
+    """
+    Build a bitmap with the bits of the given slots set.
+
+    Bitmaps are plain integers, one bit per slot, so that AND, OR and NOT of row
+    sets run in C.
+
+    Args:
+        slots (iterable): Slot numbers.
+
+    Returns:
+        int: The bitmap.
+    """
+    slots = list(slots)
+    if not slots:
+        return 0
+    bits = bytearray(max(slots) // 8 + 1)
+    for slot in slots:
+        bits[slot >> 3] |= 1 << (slot & 7)
+    return int.from_bytes(bits, 'little')
+
+
+def slots_from_bitmap(bitmap):
+    """
+    Return the slots set in a bitmap, in increasing order.
+
+    Args:
+        bitmap (int): The bitmap.
+
+    Returns:
+        list: Slot numbers.
+    """
+    binary = bin(bitmap)[:1:-1]
+    slots = []
+    slot = binary.find('1')
+    while slot != -1:
+        slots.append(slot)
+        slot = binary.find('1', slot + 1)
+    return slots
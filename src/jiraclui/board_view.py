@@ -0,0 +1,196 @@
+from collections import OrderedDict
+from rich import box
+from rich.cells import cell_len
+from rich.segment import Segment
+from rich.style import Style
+from rich.text import Text
+
+# Column headers and justification, as in Helper.new_ticket_table.
+COLUMNS = (("Ticket #", "center"), ("Title", "left"), ("Assignee", "left"), ("Reporter", "left"), ("status", "center"))
+# Columns are never truncated below this width.
+MIN_COLUMN_WIDTH = 4
+
+
+def row_values(ticket):
+    """
+    Return the cell values of a ticket row.
+
+    Args:
+        ticket (Ticket): The ticket.
+
+    Returns:
+        tuple: Key, title, assignee, reporter and status, with None shown as empty.
+    """
+    return tuple("" if value is None else str(value)
+                 for value in (ticket.ticket_no, ticket.title, ticket.assignee, ticket.reporter, ticket.status))
+
+
+class BoardView:
+    """
+    Rich renderable drawing a page of tickets as a one-line-per-row table.
+
+    It looks like the table of Helper.new_ticket_table, but keeps what it computed
+    between redraws: the cell widths and the rendered cells of every ticket are
+    cached per ticket version, whatever the column layout. A redraw, of the same
+    page or of another one, only lays out the columns and pads the cells again;
+    only rows that changed or were never shown are measured and rendered. Values
+    too wide for the terminal are truncated with an ellipsis instead of wrapped.
+    """
+
+    def __init__(self, color, cache_size=2048):
+        """
+        Initialize the view.
+
+        Args:
+            color (str): Style of the cells, e.g. the 'table' app color.
+            cache_size (int): Number of rows whose measurements and segments are kept.
+        """
+        self.style = Style.parse(color)
+        self.highlight_style = self.style + Style(reverse=True)
+        self.cache_size = cache_size
+        self.measures = OrderedDict()
+        self.rendered = OrderedDict()
+        self.header = None
+        self.tickets = []
+        self.caption = None
+        self.highlight_key = None
+
+    def set_page(self, tickets, caption=None, highlight_key=None):
+        """
+        Set the rows drawn by the next render.
+
+        Args:
+            tickets (list): Tickets of the visible page.
+            caption (str, optional): Caption drawn under the table.
+            highlight_key (str, optional): Key of a ticket to highlight.
+        """
+        self.tickets = tickets
+        self.caption = caption
+        self.highlight_key = highlight_key
+
+    def remember(self, cache, key, value):
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > self.cache_size:
+            cache.popitem(last=False)
+
+    def measure(self, values):
+        """
+        Return the cell widths of a row, cached per row values.
+        """
+        widths = self.measures.get(values)
+        if widths is None:
+            widths = tuple(cell_len(value) for value in values)
+            self.remember(self.measures, values, widths)
+        return widths
+
+    def column_widths(self, max_width):
+        """
+        Lay out the columns of the current page within a width.
+
+        Every column is as wide as its widest value; if the table does not fit, the
+        widest columns are narrowed first.
+
+        Args:
+            max_width (int): Available width in cells.
+
+        Returns:
+            tuple: Content width of every column, without padding.
+        """
+        widths = [cell_len(header) for header, _ in COLUMNS]
+        for ticket in self.tickets:
+            widths = [max(width, cell_width) for width, cell_width in zip(widths, self.measure(row_values(ticket)))]
+        # One border per column plus the last one, and one space of padding on both sides of every cell.
+        excess = sum(widths) + 3 * len(widths) + 1 - max_width
+        while excess > 0:
+            widest = max(range(len(widths)), key=widths.__getitem__)
+            if widths[widest] <= MIN_COLUMN_WIDTH:
+                break
+            widths[widest] -= 1
+            excess -= 1
+        return tuple(widths)
+
+    @staticmethod
+    def render_cells(console, values, style):
+        """
+        Render the cells of a line at their natural width.
+
+        Returns:
+            list: Value, segments and cell width of every cell.
+        """
+        return [(value, list(Text(value, style=style, end="").render(console)), cell_len(value)) for value in values]
+
+    @staticmethod
+    def render_line(console, cells, widths, style, left, vertical, right, border_style):
+        """
+        Lay out rendered cells as one table line, padding them to the column widths and
+        truncating those too wide with an ellipsis.
+
+        Returns:
+            list: Segments of the line, ending with a new line.
+        """
+        segments = [Segment(left, border_style)]
+        for index, ((value, cell_segments, length), width, (_, justify)) in enumerate(zip(cells, widths, COLUMNS)):
+            if length > width:
+                text = Text(value, style=style, no_wrap=True, overflow="ellipsis", end="")
+                text.truncate(width, overflow="ellipsis")
+                cell_segments, length = text.render(console), text.cell_len
+            gap = width - length
+            before = gap // 2 if justify == "center" else 0
+            segments.append(Segment(" " * (before + 1), style))
+            segments.extend(cell_segments)
+            segments.append(Segment(" " * (gap - before + 1), style))
+            segments.append(Segment(vertical if index < len(cells) - 1 else right, border_style))
+        segments.append(Segment.line())
+        return segments
+
+    def render_header(self, console, widths):
+        """
+        Return the segments of the top border, the header and the header separator, cached per layout.
+        """
+        if self.header is None or self.header[0] != widths:
+            padded = [width + 2 for width in widths]
+            header_style = console.get_style("table.header") + self.style
+            segments = [Segment(box.HEAVY_HEAD.get_top(padded)), Segment.line()]
+            cells = self.render_cells(console, [header for header, _ in COLUMNS], header_style)
+            segments += self.render_line(console, cells, widths, header_style,
+                                         box.HEAVY_HEAD.head_left, box.HEAVY_HEAD.head_vertical,
+                                         box.HEAVY_HEAD.head_right, None)
+            segments += [Segment(box.HEAVY_HEAD.get_row(padded, level="head")), Segment.line()]
+            self.header = (widths, segments)
+        return self.header[1]
+
+    def render_row(self, console, ticket, widths):
+        """
+        Return the segments of a ticket row.
+
+        The cells of every row are rendered once per ticket version and kept whatever
+        the layout, so a page with other column widths only pads them again.
+        """
+        highlighted = ticket.ticket_no == self.highlight_key
+        values = row_values(ticket)
+        style = self.highlight_style if highlighted else self.style
+        cached = self.rendered.get(ticket.ticket_no)
+        if cached is not None and cached[0] == (values, highlighted):
+            self.rendered.move_to_end(ticket.ticket_no)
+            cells = cached[1]
+        else:
+            cells = self.render_cells(console, values, style)
+            self.remember(self.rendered, ticket.ticket_no, ((values, highlighted), cells))
+        return self.render_line(console, cells, widths, style,
+                                box.HEAVY_HEAD.mid_left, box.HEAVY_HEAD.mid_vertical, box.HEAVY_HEAD.mid_right, None)
+
+    def __rich_console__(self, console, options):
+        widths = self.column_widths(options.max_width)
+        yield from self.render_header(console, widths)
+        for ticket in self.tickets:
+            yield from self.render_row(console, ticket, widths)
+        yield Segment(box.HEAVY_HEAD.get_bottom([width + 2 for width in widths]))
+        yield Segment.line()
+        if self.caption:
+            table_width = sum(widths) + 3 * len(widths) + 1
+            caption = Text(self.caption, style=console.get_style("table.caption"), end="")
+            caption.truncate(table_width, overflow="ellipsis")
+            yield Segment(" " * ((table_width - caption.cell_len) // 2))
+            yield from caption.render(console)
+            yield Segment.line()
@@ -0,0 +1,159 @@
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+
+class TTLCache:
+    """
+    Thread-safe in-memory cache with a bounded size, LRU eviction and a per-entry TTL.
+    """
+
+    def __init__(self, maxsize, ttl):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize (int): Maximum number of entries; the least recently used entry is evicted beyond it.
+            ttl (float): Number of seconds an entry stays valid.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """
+        Return a cached value and mark it as recently used.
+
+        Args:
+            key: Cache key.
+            default: Value returned when the key is missing or expired.
+
+        Returns:
+            The cached value, or default.
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self.entries[key]
+                return default
+            self.entries.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        """
+        Store a value, evicting the least recently used entries if the cache is full.
+
+        Args:
+            key: Cache key.
+            value: Value to store.
+        """
+        if self.maxsize <= 0:
+            return
+        with self.lock:
+            self.entries[key] = (time.monotonic() + self.ttl, value)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+    def invalidate(self, key):
+        """
+        Remove an entry, typically after writing to the cached object.
+
+        Args:
+            key: Cache key.
+        """
+        with self.lock:
+            self.entries.pop(key, None)
+
+    def clear(self):
+        """
+        Remove every entry.
+        """
+        with self.lock:
+            self.entries.clear()
+
+    def __len__(self):
+        return len(self.entries)
+
+
+class JsonFileCache:
+    """
+    Thread-safe on-disk cache of JSON values with a per-entry TTL, kept in a single JSON file.
+
+    Entries are stored as {'saved_at': epoch seconds, value_name: value}; subclasses name
+    their values and build their keys.
+    """
+
+    value_name = 'value'
+
+    def __init__(self, path, ttl):
+        """
+        Initialize the cache from its file, empty if the file is missing or unreadable.
+
+        Args:
+            path (str): Path of the JSON cache file.
+            ttl (int): Number of seconds a cached entry stays valid.
+        """
+        self.path = path
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        try:
+            with open(path, 'r', encoding='utf-8') as file:
+                self.entries = json.load(file)
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def get(self, key):
+        """
+        Return a cached value.
+
+        Args:
+            key (str): Cache key.
+
+        Returns:
+            The cached value, or None if not cached or expired.
+        """
+        with self.lock:
+            entry = self.entries.get(key)
+        if entry is None or time.time() - entry['saved_at'] > self.ttl:
+            return None
+        return entry[self.value_name]
+
+    def put(self, key, value):
+        """
+        Store a value and persist the cache.
+
+        Args:
+            key (str): Cache key.
+            value: JSON serialisable value.
+        """
+        with self.lock:
+            self.entries[key] = {'saved_at': time.time(), self.value_name: value}
+            self.save()
+
+    def invalidate(self, key):
+        """
+        Remove an entry and persist the cache.
+
+        Args:
+            key (str): Cache key.
+        """
+        with self.lock:
+            if self.entries.pop(key, None) is not None:
+                self.save()
+
+    def save(self):
+        """
+        Write the cache file atomically. Callers hold the lock.
+        """
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            json.dump(self.entries, file)
+        os.replace(temp_path, self.path)
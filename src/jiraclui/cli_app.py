@@ -1,10 +1,14 @@
 import yaml
-from jiraclui.jira_board import JiraBoard
-from jiraclui.jira_client import JiraClient
-from jiraclui import __version__
 from jiraclui.logger import get_logger
 logger = get_logger(__name__)
 class Cli:
+    """
+    Direct command handlers.
+
+    The Jira client and rich are imported inside the handlers, so that commands such as
+    --version or --generate-config never load them, and one-shot commands skip the
+    interactive board entirely.
+    """
     @staticmethod
     def generate_sample_config(config_file):
         """Generate a sample config.yaml file"""
@@ -27,42 +31,113 @@ class Cli:
         with open(config_file, 'w', encoding='utf-8') as file:
             yaml.dump(sample_config, file, default_flow_style=False)
 
+    @staticmethod
+    def open_client(api_url, api_token, app_options):
+        """Return the Jira client, or the offline client serving the local snapshot with the 'offline' app option"""
+        if app_options.get("offline"):
+            from jiraclui.offline import OfflineClient
+            return OfflineClient.open(api_url, api_token, app_options)
+        from jiraclui.jira_client import JiraClient
+        return JiraClient(api_url, api_token, app_options)
+
     @staticmethod
     def handle_issue_number(issue_number, api_url, api_token, project_names, users, app_options):
-        jira_client = JiraClient(api_url, api_token, app_options)
-        data = jira_client.get_ticket_details(issue_number)
-        if "error" not in data and data is not None:
-            jira_board = JiraBoard(data, api_url, api_token, project_names, users, False, app_options)
-            jira_board.display_ticket_details(issue_number, False, True)
+        jira_client = Cli.open_client(api_url, api_token, app_options)
+        with jira_client.track('issue'):
+            data = jira_client.get_ticket_details(issue_number)
+        if not isinstance(data, dict):
+            jira_client.helper.print_tickets([data])
+            jira_client.console.print(jira_client.helper.details_table(issue_number, data))
             exit(0)
         else:
             logger.error(data.get("error", ""))
             exit(0)
 
     @staticmethod
-    def handle_update_issue(issue_number, api_url, api_token, app_options):
-        jira_client = JiraClient(api_url, api_token, app_options)
-        data = jira_client.get_ticket_details(issue_number)
-        if "error" not in data and data is not None:
-            jira_client.update_ticket_status(data)
+    def handle_update_issue(issue_number, api_url, api_token, app_options, target_status=None):
+        jira_client = Cli.open_client(api_url, api_token, app_options)
+        with jira_client.track('update'):
+            data = jira_client.get_ticket_details(issue_number)
+            if not isinstance(data, dict):
+                jira_client.update_ticket_status(data, target_status)
+        if not isinstance(data, dict):
             exit(0)
         else:
             logger.error(data.get("error", ""))
             exit(0)
 
+    @staticmethod
+    def handle_bulk_update(issue_numbers, jql_query, target_status, api_url, api_token, app_options):
+        """Move comma separated issues, or the issues matching a JQL query, to a status concurrently"""
+        if not target_status:
+            logger.error("Updating several issues needs the target status, given with --to.")
+            exit(1)
+        jira_client = Cli.open_client(api_url, api_token, app_options)
+        with jira_client.track('bulk'):
+            if jql_query:
+                if app_options.get("offline"):
+                    logger.error("JQL queries cannot be run offline.")
+                    exit(1)
+                tickets, missing = list(jira_client.iter_tickets(jql_query)), []
+            else:
+                tickets, missing = jira_client.get_tickets(issue_numbers.split(','))
+            updated = jira_client.bulk_update_status(tickets, target_status, missing)
+        exit(0 if len(updated) == len(tickets) + len(missing) else 1)
+
     @staticmethod
     def handle_today_issues(project_names, api_url, api_token, users, app_options):
-        jira_client = JiraClient(api_url, api_token, app_options)
-        data = jira_client.get_opened_or_updated_tickets_today(project_names)
+        jira_client = Cli.open_client(api_url, api_token, app_options)
+        with jira_client.track('today'):
+            data = jira_client.get_opened_or_updated_tickets_today(project_names)
         if "error" not in data and data is not None:
-            JiraBoard(data, api_url, api_token, project_names, users, False, app_options)
+            jira_client.helper.print_tickets(data)
             exit(0)
         elif not isinstance(data, list):
             logger.error(data.get("error", []))
             exit(0)
 
     @staticmethod
-    def handle_create_issue(api_url, api_token, app_options):
+    def handle_export(export_format, jql_query, fields, output_path, project_names, users, api_url, api_token, app_options):
+        """Stream the issues of a JQL query, by default those of the board's projects, to stdout or a file"""
+        import sys
+        from jiraclui.exporter import DEFAULT_EXPORT_FIELDS, open_writer
+        if app_options.get("offline"):
+            logger.error("Exports read Jira and cannot be run offline.")
+            exit(1)
+        from jiraclui.jira_client import JiraClient
         jira_client = JiraClient(api_url, api_token, app_options)
-        jira_client.create_ticket_interactively()
+        if not jql_query:
+            # Oldest first, so that issues created during a long export are appended to its end.
+            jql_query = jira_client.build_projects_query(project_names, users) + ' ORDER BY created ASC'
+        fields = [field.strip() for field in fields.split(',') if field.strip()] if fields else list(DEFAULT_EXPORT_FIELDS)
+        file = open(output_path, 'w', encoding='utf-8', newline='') if output_path else sys.stdout
+        try:
+            writer = open_writer(export_format, file, fields)
+            with jira_client.track('export'):
+                count = jira_client.export_tickets(jql_query, writer, fields)
+            writer.close()
+        finally:
+            if output_path:
+                file.close()
+        logger.info(f"Exported {count} issues")
+        exit(0)
+
+    @staticmethod
+    def handle_create_from(manifest_path, api_url, api_token, app_options):
+        """Create the issues of a manifest and print the created keys by issue reference as JSON"""
+        import json
+        jira_client = Cli.open_client(api_url, api_token, app_options)
+        with jira_client.track('create'):
+            mapping = jira_client.create_tickets_from_manifest(manifest_path)
+        if 'error' in mapping:
+            logger.error(mapping['error'])
+            exit(1)
+        print(json.dumps(mapping['keys'], indent=2))
+        exit(1 if mapping['failed'] else 0)
+
+    @staticmethod
+    def handle_create_issue(api_url, api_token, app_options):
+        jira_client = Cli.open_client(api_url, api_token, app_options)
+        with jira_client.track('create'):
+            jira_client.create_ticket_interactively()
         exit(0)
\ No newline at end of file
@@ -0,0 +1,153 @@
+import hashlib
+import os
+import threading
+from jira import JIRA
+from jiraclui.cache import TTLCache
+from jiraclui.helper import Helper
+from jiraclui.profiler import PROFILER
+from jiraclui.session_cache import SessionCache
+from jiraclui.transport import create_transport
+
+# Seconds to wait for a connection and for a response, so an unreachable server fails fast.
+DEFAULT_TIMEOUT = (5, 30)
+
+
+class JiraConnection:
+    """
+    Process-wide Jira connection shared by every component.
+
+    One connection is kept per server URL and API key. It owns a single
+    keep-alive HTTP session with a sized connection pool, so boards, clients
+    and CLI handlers never pay for a new session or TLS handshake. Server info
+    and the current user are cached on disk between runs (see SessionCache).
+
+    The session's transport counts requests per command and can record Jira's
+    responses into a cassette or replay them offline (see transport).
+    """
+
+    _connections = {}
+    _lock = threading.Lock()
+
+    def __init__(self, server_url, api_key, app_options):
+        """
+        Create the Jira session. Use JiraConnection.get instead to share it.
+
+        Args:
+            server_url (str): Jira server URL.
+            api_key (str): API key for authentication.
+            app_options (dict): Application options.
+        """
+        self.server_url = server_url
+        self.options = {
+            'server': server_url,
+            'headers': {
+                'Authorization': f'Bearer {api_key}',
+                'Accept-Encoding': 'gzip, deflate',
+                'Connection': 'keep-alive',
+            }
+        }
+        cache_dir = Helper(app_options).get_cache_dir()
+        self.session_cache = SessionCache(cache_dir, server_url, api_key, app_options.get("session_cache_ttl", 86400))
+        if app_options.get("refresh_session"):
+            self.session_cache.clear()
+        self.session_facts = self.session_cache.load()
+        self.lock = threading.Lock()
+        self.detail_cache = TTLCache(app_options.get("detail_cache_size", 256), app_options.get("detail_cache_ttl", 300))
+        self.app_options = app_options
+        self.cache_dir = cache_dir
+        self.server_id = hashlib.sha1(server_url.encode('utf-8')).hexdigest()[:12]
+        self._transition_cache = None
+        self._create_meta_cache = None
+
+        with PROFILER.phase('connect'):
+            # Retries are left to the transport's scheduler, which honours Retry-After for every request.
+            timeout = app_options.get("timeout", DEFAULT_TIMEOUT)
+            self.jira = JIRA(options=self.options, timeout=tuple(timeout) if isinstance(timeout, list) else timeout,
+                             get_server_info=False, max_retries=0)
+            self.session = self.jira._session
+            self.transport = create_transport(app_options)
+            self.session.mount('https://', self.transport)
+            self.session.mount('http://', self.transport)
+            self.apply_server_info()
+
+    def apply_server_info(self):
+        """
+        Set the server version and deployment type on the Jira client, from the session
+        cache when possible instead of a server info request.
+        """
+        server_info = self.session_facts.get('server_info')
+        if server_info is None:
+            server_info = self.jira.server_info()
+            self.session_facts['server_info'] = server_info
+            self.session_cache.save(self.session_facts)
+        self.jira._version = tuple(server_info["versionNumbers"])
+        self.jira.deploymentType = server_info.get("deploymentType")
+        if 'myself' in self.session_facts:
+            self.jira._myself = self.session_facts['myself']
+
+    def current_user(self):
+        """
+        Return the identifier of the authenticated user, cached between runs.
+
+        Returns:
+            str: The account id on Jira Cloud, the user name on Jira Server and Data Center.
+        """
+        with self.lock:
+            current_user = self.jira.current_user()
+            if 'myself' not in self.session_facts:
+                self.session_facts['myself'] = self.jira._myself
+                self.session_cache.save(self.session_facts)
+        return current_user
+
+    @property
+    def transition_cache(self):
+        """
+        The on-disk transition cache, loaded on first use so that one-shot commands never read it.
+        """
+        with self.lock:
+            if self._transition_cache is None:
+                from jiraclui.transition_cache import TransitionCache
+                self._transition_cache = TransitionCache(os.path.join(self.cache_dir, f"transitions-{self.server_id}.json"),
+                                                         self.app_options.get("transition_cache_ttl", 86400))
+            return self._transition_cache
+
+    @property
+    def create_meta_cache(self):
+        """
+        The on-disk create metadata cache, loaded on first use.
+        """
+        with self.lock:
+            if self._create_meta_cache is None:
+                from jiraclui.create_meta import CreateMetaCache
+                self._create_meta_cache = CreateMetaCache(os.path.join(self.cache_dir, f"createmeta-{self.server_id}.json"),
+                                                          self.app_options.get("create_meta_cache_ttl", 86400))
+            return self._create_meta_cache
+
+    @classmethod
+    def get(cls, server_url, api_key, app_options):
+        """
+        Return the shared connection for a server, creating it on first use.
+
+        Args:
+            server_url (str): Jira server URL.
+            api_key (str): API key for authentication.
+            app_options (dict): Application options.
+
+        Returns:
+            JiraConnection: The shared connection.
+        """
+        key = (server_url, api_key)
+        with cls._lock:
+            if key not in cls._connections:
+                cls._connections[key] = cls(server_url, api_key, app_options)
+            return cls._connections[key]
+
+    @classmethod
+    def close_all(cls):
+        """
+        Close every shared connection.
+        """
+        with cls._lock:
+            for connection in cls._connections.values():
+                connection.session.close()
+            cls._connections.clear()
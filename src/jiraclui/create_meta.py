@@ -0,0 +1,37 @@
+from jiraclui.cache import JsonFileCache
+
+
+class CreateMetaCache(JsonFileCache):
+    """
+    On-disk cache of the create metadata of Jira projects.
+
+    It holds the issue types of every project, keyed by project key, and the fields
+    of every issue type, keyed by 'project key|issue type id', so that validating and
+    creating many tickets costs no metadata request once they are cached.
+    """
+
+    value_name = 'meta'
+
+
+def field_meta(raw_field):
+    """
+    Keep the parts of a field's create metadata that manifests are validated against.
+
+    Args:
+        raw_field (dict): Field metadata as returned by Jira.
+
+    Returns:
+        dict: 'name', 'required' (required without a default), 'type', 'items' and
+            'allowed', the names of the allowed values or None.
+    """
+    schema = raw_field.get('schema', {})
+    allowed = raw_field.get('allowedValues')
+    if allowed is not None:
+        allowed = [value.get('name') or value.get('value') or value.get('key') for value in allowed]
+    return {
+        'name': raw_field.get('name'),
+        'required': bool(raw_field.get('required')) and not raw_field.get('hasDefaultValue'),
+        'type': schema.get('type'),
+        'items': schema.get('items'),
+        'allowed': allowed,
+    }
@@ -0,0 +1,178 @@
+import csv
+import json
+
+EXPORT_FORMATS = ('jsonl', 'csv', 'columnar')
+DEFAULT_EXPORT_FIELDS = ('key', 'project', 'summary', 'status', 'issuetype', 'assignee', 'reporter', 'created', 'updated')
+# Rows buffered per row group of the columnar format, bounding the memory of an export.
+ROW_GROUP_SIZE = 10000
+COLUMNAR_FORMAT = 'jiraclui-columnar'
+
+
+def simple_value(value):
+    """
+    Reduce a Jira field value to a string, number or list of them.
+
+    Objects such as users, statuses and options are reduced to their display name,
+    name, value or key.
+
+    Args:
+        value: Field value from the JSON of a search.
+
+    Returns:
+        The simple value, or None.
+    """
+    if isinstance(value, dict):
+        for name in ('displayName', 'name', 'value', 'key'):
+            if value.get(name) is not None:
+                return value[name]
+        return json.dumps(value, sort_keys=True)
+    if isinstance(value, list):
+        return [simple_value(item) for item in value]
+    return value
+
+
+def field_value(raw_issue, field):
+    """
+    Return the simple value of a field of a raw issue; 'key' is the issue key.
+    """
+    if field == 'key':
+        return raw_issue['key']
+    return simple_value(raw_issue['fields'].get(field))
+
+
+class JsonLinesWriter:
+    """
+    Writes one JSON object per issue and line.
+    """
+
+    def __init__(self, file, fields):
+        self.file = file
+        self.fields = fields
+
+    def write_rows(self, rows):
+        for row in rows:
+            self.file.write(json.dumps(dict(zip(self.fields, row)), ensure_ascii=False) + "\n")
+
+    def close(self):
+        self.file.flush()
+
+
+class CsvWriter:
+    """
+    Writes a header and one CSV row per issue; lists are joined with ', '.
+    """
+
+    def __init__(self, file, fields):
+        self.file = file
+        self.writer = csv.writer(file)
+        self.writer.writerow(fields)
+
+    def write_rows(self, rows):
+        self.writer.writerows(
+            [", ".join(map(str, value)) if isinstance(value, list) else value for value in row] for row in rows
+        )
+
+    def close(self):
+        self.file.flush()
+
+
+class ColumnarWriter:
+    """
+    Writes a compact columnar JSON format, one row group per line.
+
+    The first line is a header naming the format and the fields. Every following line
+    is a row group of up to ROW_GROUP_SIZE issues holding one column per field; columns
+    with repeated values (statuses, people, projects, ...) are dictionary encoded as
+    'dictionary' and 'indices', others are stored as 'values'. Only one row group is
+    held in memory. See read_columnar.
+    """
+
+    def __init__(self, file, fields, row_group_size=ROW_GROUP_SIZE):
+        self.file = file
+        self.fields = fields
+        self.row_group_size = row_group_size
+        self.rows = []
+        file.write(json.dumps({'format': COLUMNAR_FORMAT, 'version': 1, 'fields': list(fields)}) + "\n")
+
+    def write_rows(self, rows):
+        self.rows.extend(rows)
+        while len(self.rows) >= self.row_group_size:
+            self.write_row_group(self.rows[:self.row_group_size])
+            del self.rows[:self.row_group_size]
+
+    def write_row_group(self, rows):
+        columns = {}
+        for field, values in zip(self.fields, zip(*rows)):
+            positions = {}
+            dictionary = []
+            indices = []
+            for value in values:
+                # Lists are not hashable, they are told apart by their JSON.
+                position = positions.setdefault(json.dumps(value) if isinstance(value, list) else value, len(positions))
+                if position == len(dictionary):
+                    dictionary.append(value)
+                indices.append(position)
+            if len(dictionary) * 2 <= len(values):
+                columns[field] = {'dictionary': dictionary, 'indices': indices}
+            else:
+                columns[field] = {'values': list(values)}
+        self.file.write(json.dumps({'rows': len(rows), 'columns': columns}, ensure_ascii=False) + "\n")
+
+    def close(self):
+        if self.rows:
+            self.write_row_group(self.rows)
+            self.rows = []
+        self.file.flush()
+
+
+WRITERS = {'jsonl': JsonLinesWriter, 'csv': CsvWriter, 'columnar': ColumnarWriter}
+
+
+def open_writer(export_format, file, fields):
+    """
+    Create the writer of an export format.
+
+    Args:
+        export_format (str): One of EXPORT_FORMATS.
+        file: Text file to write to.
+        fields (list): Exported fields, in column order.
+
+    Returns:
+        The writer, with write_rows(rows) and close().
+
+    Raises:
+        ValueError: If the format is unknown.
+    """
+    if export_format not in WRITERS:
+        raise ValueError(f"Unknown export format '{export_format}', use one of: {', '.join(EXPORT_FORMATS)}")
+    return WRITERS[export_format](file, fields)
+
+
+def read_columnar(file):
+    """
+    Read a columnar export back, one row group at a time.
+
+    Args:
+        file: Text file written by ColumnarWriter.
+
+    Yields:
+        dict: One issue, by field.
+
+    Raises:
+        ValueError: If the file is not a columnar export.
+    """
+    header = json.loads(file.readline() or 'null')
+    if not isinstance(header, dict) or header.get('format') != COLUMNAR_FORMAT:
+        raise ValueError("Not a jiraclui columnar export")
+    fields = header['fields']
+    for line in file:
+        row_group = json.loads(line)
+        columns = []
+        for field in fields:
+            column = row_group['columns'][field]
+            if 'dictionary' in column:
+                columns.append([column['dictionary'][index] for index in column['indices']])
+            else:
+                columns.append(column['values'])
+        for values in zip(*columns):
+            yield dict(zip(fields, values))
@@ -0,0 +1,263 @@
+import bisect
+import re
+from collections import defaultdict
+from operator import attrgetter
+from jiraclui.bitmap import bitmap_from_slots, slots_from_bitmap
+from jiraclui.filter_query import compile_query, is_structured
+
+TOKEN_PATTERN = re.compile(r'\w+')
+# Joins the fields of a ticket so that a match can never span two fields.
+FIELD_SEPARATOR = '\x00'
+# Low-cardinality ticket attributes with a value -> rows bitmap index.
+INDEXED_COLUMNS = ('project', 'project_key', 'assignee', 'reporter', 'status', 'issue_type')
+KEY_PATTERN = re.compile(r'^(.+)-(\d+)$')
+
+
+def search_string(ticket):
+    """
+    Return the lower-cased string a ticket is matched against.
+
+    Args:
+        ticket (Ticket): The ticket.
+
+    Returns:
+        str: The field values joined by FIELD_SEPARATOR.
+    """
+    return FIELD_SEPARATOR.join(str(value).lower() for value in ticket.search_values() if value is not None)
+
+
+class FilterIndex:
+    """
+    Case-insensitive substring search over a list of tickets.
+
+    The index is built once per dataset: every ticket gets a lower-cased search
+    string of its field values, and every word token points to the tickets
+    containing it. A query only verifies the tickets whose tokens contain the
+    longest word of the query instead of scanning every field of every ticket.
+
+    Rows are numbered in dataset order. Tickets inserted later at the top of the
+    dataset get decreasing negative row numbers, so sorting rows keeps dataset
+    order without renumbering the index.
+
+    For structured queries (see filter_query) every ticket also has a slot, a bit
+    position in bitmaps: the low-cardinality columns map each lower-cased value to
+    the bitmap of its tickets, and issue keys are indexed by project prefix and
+    number for key ranges.
+    """
+
+    def __init__(self, tickets):
+        """
+        Build the index.
+
+        Args:
+            tickets (list): List of Ticket records.
+        """
+        self.tickets = dict(enumerate(tickets))
+        self.haystacks = {}
+        self.row_of = {}
+        self.first_row = 0
+        postings = defaultdict(list)
+        for row, ticket in self.tickets.items():
+            haystack = search_string(ticket)
+            self.haystacks[row] = haystack
+            self.row_of[ticket.ticket_no] = row
+            for token in set(TOKEN_PATTERN.findall(haystack)):
+                postings[token].append(row)
+        self.postings = postings
+        # Built by the first structured query, see build_columns.
+        self.columns = None
+        self.last_query = ""
+        self.last_rows = None
+
+    def build_columns(self):
+        """
+        Build the slots, the column bitmaps and the key number index.
+
+        Plain text filters never need them, so they are only built for the first
+        structured query and then kept up to date by upsert.
+        """
+        column_values = attrgetter(*INDEXED_COLUMNS)
+        column_slots = [defaultdict(list) for _ in INDEXED_COLUMNS]
+        self.key_numbers = defaultdict(list)
+        self.row_of_slot = self.all_rows()
+        self.slot_of_row = {row: slot for slot, row in enumerate(self.row_of_slot)}
+        for slot, row in enumerate(self.row_of_slot):
+            ticket = self.tickets[row]
+            # Column values are interned, so they are grouped as is and lower-cased once per distinct value below.
+            for values, value in zip(column_slots, column_values(ticket)):
+                values[value].append(slot)
+            match = KEY_PATTERN.match(ticket.ticket_no.upper())
+            if match:
+                self.key_numbers[match.group(1)].append((int(match.group(2)), slot))
+        for numbers in self.key_numbers.values():
+            numbers.sort()
+        self.all_slots = (1 << len(self.row_of_slot)) - 1
+        self.columns = {}
+        for column, values in zip(INDEXED_COLUMNS, column_slots):
+            lowered = defaultdict(list)
+            for value, slots in values.items():
+                lowered[value.lower() if value else ''].extend(slots)
+            self.columns[column] = defaultdict(int, {value: bitmap_from_slots(slots) for value, slots in lowered.items()})
+
+    def evaluate(self, text, current_user):
+        """
+        Compile a structured query and return the bitmap of the matching slots.
+        """
+        plan = compile_query(text)
+        if self.columns is None:
+            self.build_columns()
+        return plan.evaluate(self, current_user)
+
+    @staticmethod
+    def column_value(ticket, column):
+        """
+        Return the lower-cased value of an indexed column, '' if unset.
+        """
+        value = getattr(ticket, column)
+        return value.lower() if value else ''
+
+    def rows_of(self, bitmap):
+        """
+        Return the rows of the slots set in a bitmap, in dataset order.
+        """
+        return sorted(self.row_of_slot[slot] for slot in slots_from_bitmap(bitmap))
+
+    def candidate_rows(self, text):
+        """
+        Return the rows that may contain the text, in dataset order.
+
+        Args:
+            text (str): Lower-cased query.
+
+        Returns:
+            list: Row numbers to verify, or None if every row has to be checked.
+        """
+        tokens = TOKEN_PATTERN.findall(text)
+        if not tokens:
+            return None
+        longest = max(tokens, key=len)
+        rows = set()
+        for token, token_rows in self.postings.items():
+            if longest in token:
+                rows.update(token_rows)
+        return sorted(rows)
+
+    def all_rows(self):
+        """
+        Return every row, in dataset order.
+        """
+        return sorted(self.tickets)
+
+    def search(self, text, current_user=None):
+        """
+        Return the tickets matching a filter, searching the full dataset.
+
+        A plain text matches tickets containing it in any field; a query using the
+        filter_query syntax is compiled and answered from the column indexes. A plain
+        text extending the previous one is answered from the previous matches only.
+
+        Args:
+            text (str): Text or query to search for.
+            current_user (callable, optional): Returns the display name 'me' stands for.
+
+        Returns:
+            list: Matching tickets, in dataset order.
+
+        Raises:
+            ValueError: If the query is invalid.
+        """
+        if is_structured(text):
+            rows = self.rows_of(self.evaluate(text, current_user))
+            self.last_query, self.last_rows = None, rows
+            return [self.tickets[row] for row in rows]
+        text = text.lower()
+        if not text:
+            self.last_query, self.last_rows = "", None
+            return [self.tickets[row] for row in self.all_rows()]
+        if self.last_query is not None and self.last_rows is not None and self.last_query in text:
+            candidates = self.last_rows
+        else:
+            candidates = self.candidate_rows(text)
+            if candidates is None:
+                candidates = self.all_rows()
+        rows = [row for row in candidates if text in self.haystacks[row]]
+        self.last_query, self.last_rows = text, rows
+        return [self.tickets[row] for row in rows]
+
+    def refine(self, text, current_user=None):
+        """
+        Narrow the previous matches down to the tickets that also match a text or query.
+
+        Args:
+            text (str): Text or query to search for.
+            current_user (callable, optional): Returns the display name 'me' stands for.
+
+        Returns:
+            list: Matching tickets, in dataset order.
+
+        Raises:
+            ValueError: If the query is invalid.
+        """
+        rows = self.all_rows() if self.last_rows is None else self.last_rows
+        if is_structured(text):
+            matches = self.evaluate(text, current_user)
+            rows = [row for row in rows if matches >> self.slot_of_row[row] & 1]
+        else:
+            text = text.lower()
+            rows = [row for row in rows if text in self.haystacks[row]]
+        self.last_query, self.last_rows = None, rows
+        return [self.tickets[row] for row in rows]
+
+    def upsert(self, ticket):
+        """
+        Replace a ticket with the same key in place, or add it at the top of the dataset.
+
+        Only the postings of that ticket are touched. Previous matches are forgotten.
+
+        Args:
+            ticket (Ticket): The new or updated ticket.
+        """
+        row = self.row_of.get(ticket.ticket_no)
+        if row is None:
+            self.first_row -= 1
+            row = self.first_row
+            self.row_of[ticket.ticket_no] = row
+        else:
+            for token in set(TOKEN_PATTERN.findall(self.haystacks[row])):
+                self.postings[token].remove(row)
+                if not self.postings[token]:
+                    del self.postings[token]
+        if self.columns is not None:
+            self.upsert_columns(ticket, row)
+        haystack = search_string(ticket)
+        self.tickets[row] = ticket
+        self.haystacks[row] = haystack
+        for token in set(TOKEN_PATTERN.findall(haystack)):
+            self.postings[token].append(row)
+        self.last_query, self.last_rows = "", None
+
+    def upsert_columns(self, ticket, row):
+        """
+        Move a ticket between column bitmaps, giving it the next free slot if it is new.
+
+        Args:
+            ticket (Ticket): The new or updated ticket.
+            row (int): Its row.
+        """
+        slot = self.slot_of_row.get(row)
+        if slot is None:
+            slot = len(self.row_of_slot)
+            self.slot_of_row[row] = slot
+            self.row_of_slot.append(row)
+            self.all_slots |= 1 << slot
+            match = KEY_PATTERN.match(ticket.ticket_no.upper())
+            if match:
+                bisect.insort(self.key_numbers[match.group(1)], (int(match.group(2)), slot))
+        else:
+            for column, values in self.columns.items():
+                value = self.column_value(self.tickets[row], column)
+                values[value] &= ~(1 << slot)
+                if not values[value]:
+                    del values[value]
+        for column, values in self.columns.items():
+            values[self.column_value(ticket, column)] |= 1 << slot
@@ -0,0 +1,468 @@
+import bisect
+import functools
+import re
+from jiraclui.bitmap import bitmap_from_slots
+
+# Query fields and the Ticket attribute each of them matches.
+FIELDS = {
+    'key': 'ticket_no',
+    'project': 'project',
+    'title': 'title',
+    'summary': 'title',
+    'assignee': 'assignee',
+    'reporter': 'reporter',
+    'status': 'status',
+    'type': 'issue_type',
+}
+TOKEN_PATTERN = re.compile(r'''\s*(?:
+    (?P<lparen>\() |
+    (?P<rparen>\)) |
+    (?P<neg>-)(?=[^\s)]) |
+    (?P<field>[A-Za-z_]+): |
+    "(?P<quoted>[^"]*)" |
+    /(?P<regex>(?:\\.|[^/\\])+)/ |
+    (?P<word>[^\s()"]+)
+)''', re.VERBOSE)
+# A known field, which always makes a filter a query.
+FIELD_PATTERN = re.compile(r'(?:^|[\s(-])(?:' + '|'.join(FIELDS) + r'):', re.IGNORECASE)
+# Other query syntax: quotes, a regex, parentheses, negation or OR. Pasted text may contain it too.
+STRUCTURE_PATTERN = re.compile(r'"|(?:^|\s)(?:-(?=\S)|/)|[()]|\sOR\s')
+KEY_BOUND_PATTERN = re.compile(r'^(?:(.+)-)?(\d+)$')
+# JQL field of every Ticket attribute, for pushing a filter down to Jira.
+JQL_FIELDS = {
+    'ticket_no': 'key',
+    'project': 'project',
+    'title': 'summary',
+    'assignee': 'assignee',
+    'reporter': 'reporter',
+    'status': 'status',
+    'issue_type': 'issuetype',
+}
+# Fields that may be empty, which JQL's negated comparisons never match.
+NULLABLE_ATTRIBUTES = ('assignee', 'reporter')
+WORD_PATTERN = re.compile(r'^\w+$')
+
+
+def is_structured(text):
+    """
+    Tell whether a filter text uses the query syntax rather than being a plain substring.
+
+    A text naming a known field (status:, assignee:, ...) is a query. A text only using
+    other query syntax is a query if it parses, so that e.g. 'error: timeout (retry' is
+    still matched as a substring.
+
+    Args:
+        text (str): Filter text.
+
+    Returns:
+        bool: True for a query.
+    """
+    text = text.strip()
+    if FIELD_PATTERN.search(text):
+        return True
+    if not STRUCTURE_PATTERN.search(text):
+        return False
+    try:
+        compile_query(text)
+    except ValueError:
+        return False
+    return True
+
+
+def tokenize(text):
+    """
+    Split a query into (kind, value) tokens.
+
+    Args:
+        text (str): Query.
+
+    Returns:
+        list: Tokens, kind being one of lparen, rparen, neg, field, quoted, regex and word.
+
+    Raises:
+        ValueError: On an unterminated quote.
+    """
+    tokens = []
+    position = 0
+    text = text.rstrip()
+    while position < len(text):
+        match = TOKEN_PATTERN.match(text, position)
+        if match is None:
+            raise ValueError(f"Unterminated quote at: {text[position:].strip()}")
+        tokens.append((match.lastgroup, match.group(match.lastgroup)))
+        position = match.end()
+    return tokens
+
+
+def wildcard_pattern(value):
+    """
+    Compile a value with '*' wildcards into a pattern matching whole lower-cased values.
+    """
+    return re.compile('^' + '.*'.join(re.escape(part) for part in value.lower().split('*')) + '$')
+
+
+def compile_regex(pattern):
+    try:
+        return re.compile(pattern, re.IGNORECASE)
+    except re.error as e:
+        raise ValueError(f"Invalid regex /{pattern}/: {e}") from e
+
+
+def jql_string(value):
+    """
+    Quote a value as a JQL string.
+    """
+    return '"' + value.replace('\\', '\\\\').replace('"', '\\"') + '"'
+
+
+def jql_text_search(field, text):
+    """
+    Build a JQL text search approximating a substring match: a single word also matches as a prefix.
+    """
+    if WORD_PATTERN.match(text):
+        text += '*'
+    return f'{field} ~ {jql_string(text)}'
+
+
+def index_columns(attribute):
+    """
+    Return the indexed columns holding a ticket attribute; a project matches its name or key.
+    """
+    return ('project', 'project_key') if attribute == 'project' else (attribute,)
+
+
+class TextTerm:
+    """
+    Tickets containing a text in any field, like a plain filter.
+    """
+
+    def __init__(self, text):
+        self.text = text.lower()
+
+    def evaluate(self, index, current_user):
+        rows = index.candidate_rows(self.text)
+        if rows is None:
+            rows = index.all_rows()
+        return bitmap_from_slots(index.slot_of_row[row] for row in rows if self.text in index.haystacks[row])
+
+    def jql(self, cloud=False):
+        return jql_text_search('text', self.text), False
+
+
+class FieldTerm:
+    """
+    Tickets whose field matches a value.
+
+    Indexed columns (project, assignee, reporter, status and type) match whole values,
+    ignoring case, with '*' wildcards; they are answered from the column bitmaps. The
+    value 'me' stands for the current user in assignee and reporter. Keys match whole
+    keys with wildcards, and titles contain the value.
+    """
+
+    def __init__(self, attribute, value, quoted=False):
+        self.attribute = attribute
+        self.value = value
+        self.quoted = quoted
+
+    def evaluate(self, index, current_user):
+        value = self.value
+        if not self.quoted and value.lower() == 'me' and self.attribute in ('assignee', 'reporter'):
+            value = current_user() if current_user else None
+            if not value:
+                return 0
+        if self.attribute in index.columns:
+            bitmap = 0
+            for column in index_columns(self.attribute):
+                values = index.columns[column]
+                if '*' in value:
+                    pattern = wildcard_pattern(value)
+                    for column_value, column_bitmap in values.items():
+                        if pattern.match(column_value):
+                            bitmap |= column_bitmap
+                else:
+                    bitmap |= values.get(value.lower(), 0)
+            return bitmap
+        if self.attribute == 'ticket_no':
+            if '*' in value:
+                pattern = wildcard_pattern(value)
+                return bitmap_from_slots(index.slot_of_row[row] for key, row in index.row_of.items() if pattern.match(key.lower()))
+            row = index.row_of.get(value.upper())
+            return 0 if row is None else 1 << index.slot_of_row[row]
+        text = value.lower()
+        rows = index.candidate_rows(text)
+        if rows is None:
+            rows = index.all_rows()
+        return bitmap_from_slots(
+            index.slot_of_row[row] for row in rows
+            if text in (getattr(index.tickets[row], self.attribute) or '').lower()
+        )
+
+    def jql(self, cloud=False):
+        field = JQL_FIELDS[self.attribute]
+        if self.attribute == 'title':
+            return jql_text_search(field, self.value), False
+        if '*' in self.value:
+            return None, False
+        if not self.quoted and self.value.lower() == 'me' and self.attribute in ('assignee', 'reporter'):
+            return f'{field} = currentUser()', True
+        if not self.value:
+            return f'{field} is EMPTY', True
+        if cloud and self.attribute in ('assignee', 'reporter'):
+            # Jira Cloud only accepts account ids for people, the display name is matched locally.
+            return None, False
+        return f'{field} = {jql_string(self.value)}', True
+
+
+class RegexTerm:
+    """
+    Tickets with a field, or any field, matching a regular expression, ignoring case.
+    """
+
+    def __init__(self, attribute, pattern):
+        self.attributes = (attribute,) if attribute else tuple(dict.fromkeys(FIELDS.values()))
+        self.pattern = compile_regex(pattern)
+
+    def evaluate(self, index, current_user):
+        bitmap = 0
+        scanned = []
+        for attribute in self.attributes:
+            if attribute in index.columns:
+                for column in index_columns(attribute):
+                    for column_value, column_bitmap in index.columns[column].items():
+                        if self.pattern.search(column_value):
+                            bitmap |= column_bitmap
+            else:
+                scanned.append(attribute)
+        if scanned:
+            bitmap |= bitmap_from_slots(
+                index.slot_of_row[row] for row, ticket in index.tickets.items()
+                if any(self.pattern.search(getattr(ticket, attribute) or '') for attribute in scanned)
+            )
+        return bitmap
+
+    def jql(self, cloud=False):
+        return None, False
+
+
+class KeyRange:
+    """
+    Tickets of one project whose key number is within a range, e.g. key:PRA-100..PRA-200.
+    """
+
+    def __init__(self, prefix, low, high):
+        self.prefix = prefix
+        self.low = low
+        self.high = high
+
+    @classmethod
+    def parse(cls, value):
+        """
+        Parse 'PRA-10..PRA-20', 'PRA-10..20', 'PRA-10..' or '..PRA-20'.
+
+        Raises:
+            ValueError: If the bounds are not keys of one project.
+        """
+        low_text, high_text = value.upper().split('..', 1)
+        bounds = []
+        prefixes = set()
+        for text in (low_text, high_text):
+            match = KEY_BOUND_PATTERN.match(text)
+            if text and not match:
+                raise ValueError(f"Invalid key range bound '{text}'")
+            bounds.append(int(match.group(2)) if match else None)
+            if match and match.group(1):
+                prefixes.add(match.group(1))
+        if len(prefixes) != 1:
+            raise ValueError(f"Key range '{value}' needs keys of exactly one project")
+        low, high = bounds
+        return cls(prefixes.pop(), low if low is not None else 0, high if high is not None else float('inf'))
+
+    def evaluate(self, index, current_user):
+        numbers = index.key_numbers.get(self.prefix, [])
+        start = bisect.bisect_left(numbers, (self.low, -1))
+        end = bisect.bisect_right(numbers, (self.high, float('inf')))
+        return bitmap_from_slots(slot for _, slot in numbers[start:end])
+
+    def jql(self, cloud=False):
+        conditions = [f'project = {jql_string(self.prefix)}']
+        if self.low:
+            conditions.append(f'key >= {jql_string(f"{self.prefix}-{self.low}")}')
+        if self.high != float('inf'):
+            conditions.append(f'key <= {jql_string(f"{self.prefix}-{self.high}")}')
+        return f'({" AND ".join(conditions)})', True
+
+
+class Not:
+    def __init__(self, child):
+        self.child = child
+
+    def evaluate(self, index, current_user):
+        return index.all_slots & ~self.child.evaluate(index, current_user)
+
+    def jql(self, cloud=False):
+        # Only an exact condition can be negated: negating a broader one would drop matches.
+        jql, exact = self.child.jql(cloud)
+        if not jql or not exact or isinstance(self.child, (And, Or)):
+            # The operands of AND and OR may be empty fields, which NOT would leave out.
+            return None, False
+        if isinstance(self.child, FieldTerm) and self.child.attribute in NULLABLE_ATTRIBUTES and self.child.value:
+            return f'NOT ({jql}) OR {JQL_FIELDS[self.child.attribute]} is EMPTY', True
+        return f'NOT ({jql})', True
+
+
+class And:
+    def __init__(self, children):
+        self.children = children
+
+    def evaluate(self, index, current_user):
+        bitmap = index.all_slots
+        for child in self.children:
+            bitmap &= child.evaluate(index, current_user)
+            if not bitmap:
+                break
+        return bitmap
+
+    def jql(self, cloud=False):
+        # Conditions that cannot be pushed down are left out, which only broadens the query.
+        parts = [child.jql(cloud) for child in self.children]
+        conditions = [f'({jql})' for jql, _ in parts if jql]
+        if not conditions:
+            return None, False
+        return " AND ".join(conditions), all(jql and exact for jql, exact in parts)
+
+
+class Or:
+    def __init__(self, children):
+        self.children = children
+
+    def evaluate(self, index, current_user):
+        bitmap = 0
+        for child in self.children:
+            bitmap |= child.evaluate(index, current_user)
+        return bitmap
+
+    def jql(self, cloud=False):
+        parts = [child.jql(cloud) for child in self.children]
+        if not all(jql for jql, _ in parts):
+            return None, False
+        return " OR ".join(f'({jql})' for jql, _ in parts), all(exact for _, exact in parts)
+
+
+class QueryParser:
+    """
+    Recursive descent parser of the filter query grammar:
+
+        query   := and ('OR' and)*
+        and     := unary+
+        unary   := '-' unary | '(' query ')' | term
+        term    := field ':' (word | "quoted" | /regex/) | word | "quoted" | /regex/
+    """
+
+    def __init__(self, text):
+        self.tokens = tokenize(text)
+        self.position = 0
+
+    def peek(self):
+        return self.tokens[self.position] if self.position < len(self.tokens) else (None, None)
+
+    def take(self):
+        token = self.peek()
+        self.position += 1
+        return token
+
+    def parse(self):
+        node = self.parse_or()
+        if self.position < len(self.tokens):
+            raise ValueError("Unbalanced ')'")
+        return node
+
+    def parse_or(self):
+        nodes = [self.parse_and()]
+        while self.peek() == ('word', 'OR'):
+            self.take()
+            nodes.append(self.parse_and())
+        return nodes[0] if len(nodes) == 1 else Or(nodes)
+
+    def parse_and(self):
+        nodes = []
+        while self.peek()[0] not in (None, 'rparen') and self.peek() != ('word', 'OR'):
+            nodes.append(self.parse_unary())
+        if not nodes:
+            raise ValueError("Expected a term")
+        return nodes[0] if len(nodes) == 1 else And(nodes)
+
+    def parse_unary(self):
+        kind, value = self.take()
+        if kind == 'neg':
+            return Not(self.parse_unary())
+        if kind == 'lparen':
+            node = self.parse_or()
+            if self.take()[0] != 'rparen':
+                raise ValueError("Missing ')'")
+            return node
+        if kind == 'field':
+            return self.parse_field(value)
+        if kind == 'regex':
+            return RegexTerm(None, value)
+        return TextTerm(value)
+
+    def parse_field(self, field):
+        attribute = FIELDS.get(field.lower())
+        if attribute is None:
+            raise ValueError(f"Unknown field '{field}', use one of: {', '.join(FIELDS)} (quote text to search it as is)")
+        kind, value = self.take()
+        if kind not in ('word', 'quoted', 'regex'):
+            raise ValueError(f"Missing value after '{field}:'")
+        if kind == 'regex':
+            return RegexTerm(attribute, value)
+        if attribute == 'ticket_no' and kind == 'word' and '..' in value:
+            return KeyRange.parse(value)
+        return FieldTerm(attribute, value, kind == 'quoted')
+
+
+@functools.lru_cache(maxsize=128)
+def compile_query(text):
+    """
+    Compile a filter query into a predicate plan, once per distinct query.
+
+    The plan is evaluated against a FilterIndex with plan.evaluate(index, current_user)
+    and returns the bitmap of the matching slots.
+
+    Examples: status:"In Progress" assignee:me -reporter:bot, (status:open OR status:blocked),
+    title:/time ?out/, key:PRA-100..PRA-200, type:bug*.
+
+    Args:
+        text (str): Query.
+
+    Returns:
+        The root node of the plan.
+
+    Raises:
+        ValueError: If the query is invalid.
+    """
+    return QueryParser(text).parse()
+
+
+def to_jql(text, cloud=False):
+    """
+    Translate a filter text or query into a JQL condition for searching Jira.
+
+    The condition selects the server-side candidates of the filter: regular expressions
+    and wildcards cannot be expressed in JQL and are left out, and text terms use
+    Jira's word search. The candidates must therefore be filtered locally again.
+
+    Args:
+        text (str): Filter text or query.
+        cloud (bool): True for Jira Cloud, where people cannot be searched by name.
+
+    Returns:
+        str: JQL condition, or None if no part of the filter can be pushed down.
+
+    Raises:
+        ValueError: If the query is invalid.
+    """
+    text = text.strip()
+    if not text:
+        return None
+    node = compile_query(text) if is_structured(text) else TextTerm(text)
+    return node.jql(cloud)[0]
@@ -1,4 +1,7 @@
+import os
 from rich.console import Console
+from rich.table import Table
+from jiraclui.board_view import BoardView
 class Helper:
     def __init__(self, app_options):
         self.app_options = app_options
@@ -16,7 +19,10 @@ class Helper:
                     f"3. [{menu_color}]Enter Filter mode[/{menu_color}]",
                     f"4. [{menu_color}]Display Ticket Details[/{menu_color}]",
                     f"5. [{menu_color}]Update Ticket Status[/{menu_color}] ",
-                    f"6. [{menu_color}]Create Ticket[/{menu_color}] "
+                    f"6. [{menu_color}]Create Ticket[/{menu_color}] ",
+                    f"7. [{menu_color}]Next Page[/{menu_color}]",
+                    f"8. [{menu_color}]Previous Page[/{menu_color}]",
+                    f"9. [{menu_color}]Jump to Ticket[/{menu_color}]"
                  )
             ]
         else:
@@ -28,7 +34,10 @@ class Helper:
                     f"f. [{menu_color}]Enter Filter mode[/{menu_color}]",
                     f"d. [{menu_color}]Display Ticket Details[/{menu_color}]",
                     f"u. [{menu_color}]Update Ticket Status[/{menu_color}] ",
-                    f"c. [{menu_color}]Create Ticket[/{menu_color}]")
+                    f"c. [{menu_color}]Create Ticket[/{menu_color}]",
+                    f"n. [{menu_color}]Next Page[/{menu_color}]",
+                    f"p. [{menu_color}]Previous Page[/{menu_color}]",
+                    f"j. [{menu_color}]Jump to Ticket[/{menu_color}]")
             ]
 
         for item in menu_items:
@@ -36,3 +45,85 @@ class Helper:
 
     def get_color(self, component_name):
         return self.app_options.get("app_colors", {}).get(component_name, "white")
+
+    def new_ticket_table(self):
+        """
+        Create an empty table with the board columns.
+
+        Returns:
+            Table: The empty table.
+        """
+        table = Table()
+        table.add_column("Ticket #", style=self.get_color("table"), justify="center")
+        table.add_column("Title", style=self.get_color("table"), justify="left")
+        table.add_column("Assignee", style=self.get_color("table"), justify="left")
+        table.add_column("Reporter", style=self.get_color("table"), justify="left")
+        table.add_column("status", style=self.get_color("table"), justify="center")
+        return table
+
+    def new_board_view(self):
+        """
+        Create the view drawing the board pages, with the board columns and colors.
+
+        Returns:
+            BoardView: The view.
+        """
+        return BoardView(self.get_color("table"))
+
+    @staticmethod
+    def add_ticket_row(table, ticket):
+        """
+        Add one ticket as a row of a board table.
+
+        Args:
+            table (Table): Board table.
+            ticket (Ticket): The ticket.
+        """
+        table.add_row(
+            str(ticket.ticket_no),
+            ticket.title if ticket.title is not None else "",
+            ticket.assignee if ticket.assignee is not None else "",
+            ticket.reporter if ticket.reporter is not None else "",
+            ticket.status if ticket.status is not None else ""
+        )
+
+    def print_tickets(self, tickets):
+        """
+        Print tickets as a board table, without any of the interactive board machinery.
+
+        Args:
+            tickets (list): List of Ticket records.
+        """
+        table = self.new_ticket_table()
+        for ticket in tickets:
+            self.add_ticket_row(table, ticket)
+        self.console.print(table)
+
+    def details_table(self, ticket_number, ticket_details):
+        """
+        Build the details table of a ticket.
+
+        Args:
+            ticket_number (str): Jira ticket number.
+            ticket_details (Ticket): The ticket, or a dictionary with an 'error' message.
+
+        Returns:
+            Table: The details table.
+        """
+        form_color = self.get_color("details_form")
+        details_table = Table(title=f"Details for Ticket #{ticket_number}")
+        details_table.add_column("Field", style=form_color, justify="left")
+        details_table.add_column("Value", style=form_color, justify="left")
+
+        rows = ticket_details.items() if isinstance(ticket_details, dict) else ticket_details.details()
+        for field, value in rows:
+            details_table.add_row(str(field), str(value) if value is not None else "")
+        return details_table
+
+
+    def get_cache_dir(self):
+        """
+        Return the directory used for local caches, honouring the 'cache_dir' app option.
+        """
+        default_dir = os.path.join(os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")), "jiraclui")
+        return os.path.expanduser(self.app_options.get("cache_dir") or default_dir)
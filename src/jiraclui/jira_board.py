@@ -1,67 +1,308 @@
+import threading
+from collections import Counter
 from rich.console import Console
-from rich.table import Table
+from rich.live import Live
+from jiraclui.cache import TTLCache
+from jiraclui.filter_engine import FilterIndex
+from jiraclui.filter_query import to_jql
 from jiraclui.jira_client import JiraClient
 from jiraclui.helper import Helper
+from jiraclui.profiler import PROFILER
+
+# Terminal lines taken by the table borders, header, caption, menu and prompt.
+RESERVED_LINES = 10
+
+
 class JiraBoard:
     """
     Represents a  board for displaying Jira ticket information.
+
+    The board is windowed: only the page of rows fitting the terminal is laid out
+    and rendered, so drawing costs the same for 50 or 50,000 tickets.
+
+    When a project holds more tickets than the board downloaded ('max_table_entry'),
+    filters are also pushed down to Jira as JQL, and the matching tickets that were
+    never downloaded are shown after the local matches.
     """
 
-    def __init__(self, data, api_url, api_token,project_names,users, filter_mode, app_options):
+    def __init__(self, data, api_url, api_token,project_names,users, filter_mode, app_options, render=True, ticket_store=None, jira_client=None, caption=None):
         """
         Initialize the JiraBoard instance.
 
         Args:
-            data (list): List of dictionaries containing Jira ticket information.
+            data (list): List of Ticket records, or a single Ticket.
             api_url (str): Jira server URL.
             api_token (str): API key for authentication.
+            render (bool): False to skip printing the board, e.g. before load_progressively.
+            ticket_store (TicketStore, optional): Local store kept in step with edits made on the board.
+            jira_client (JiraClient, optional): Client to use, e.g. an OfflineClient. A JiraClient is created otherwise.
+            caption (str, optional): Caption shown under the table, e.g. the age of offline data.
         """
         self.helper = Helper(app_options)
+        self.app_options = app_options
+        self.page = 0
+        self.highlight_key = None
+        self.me = None
+        self.view = self.helper.new_board_view()
         self.original_data = data
         self.filtered_data = data
         self.filter_text = ""
+        self.filter_refinements = []
+        self.filter_index = None
+        self.remote_matches = []
+        self.pushdown_cache = TTLCache(app_options.get("pushdown_cache_size", 32), app_options.get("pushdown_cache_ttl", 300))
+        self.ticket_store = ticket_store
+        self.lock = threading.RLock()
         self.console = Console()
         self.api_url = api_url
         self.api_token = api_token
         self.filter_mode = filter_mode
         self.project_names = project_names
         self.users = users
-        self.jira_client = JiraClient(self.api_url, self.api_token, app_options)
+        self.jira_client = jira_client or JiraClient(self.api_url, self.api_token, app_options)
+        self.caption = caption
+        if render:
+            self.build_table()
+
+    def build_table(self, print_table=True):
+        """
+        Build the table of the current page of Jira ticket information.
+
+        Args:
+            print_table (bool): False to only build the table, e.g. from a background thread.
+        """
+        with self.lock:
+            captions = [self.caption]
+
+            if isinstance(self.filtered_data, list):
+                page_size = self.page_size()
+                self.page = max(0, min(self.page, self.page_count() - 1))
+                start = self.page * page_size
+                tickets = self.filtered_data[start:start + page_size]
+                if len(self.filtered_data) > page_size:
+                    end = min(start + page_size, len(self.filtered_data))
+                    captions.append(f"Rows {start + 1}-{end} of {len(self.filtered_data)}, page {self.page + 1}/{self.page_count()}")
+            else:
+                tickets = [self.original_data]
+            if self.remote_matches:
+                captions.append(f"{len(self.remote_matches)} more from Jira")
+            self.view.set_page(tickets, " | ".join(caption for caption in captions if caption) or None, self.highlight_key)
+            self.table = self.view
+        if print_table:
+            self.display_board()
+
+    def page_size(self):
+        """
+        Return the number of rows per page: the 'board_page_size' app option, or what fits the terminal.
+        """
+        return self.app_options.get("board_page_size") or max(5, self.console.size.height - RESERVED_LINES)
+
+    def page_count(self):
+        """
+        Return the number of pages of the filtered tickets, at least one.
+        """
+        if not isinstance(self.filtered_data, list):
+            return 1
+        return max(1, -(-len(self.filtered_data) // self.page_size()))
+
+    def show_page(self, page):
+        """
+        Show a page of the filtered tickets, clamped to the existing pages.
+
+        Args:
+            page (int): Zero-based page number.
+        """
+        self.page = page
+        self.highlight_key = None
         self.build_table()
 
-    def build_table(self):
+    def next_page(self):
+        """
+        Show the next page of the filtered tickets.
+        """
+        self.show_page(self.page + 1)
+
+    def previous_page(self):
         """
-        Build the table for displaying Jira ticket information.
+        Show the previous page of the filtered tickets.
         """
+        self.show_page(self.page - 1)
 
-        self.table = Table()
-        self.table.add_column("Ticket #", style=self.helper.get_color("table"), justify="center")
-        self.table.add_column("Title", style=self.helper.get_color("table"), justify="left")
-        self.table.add_column("Assignee", style=self.helper.get_color("table"), justify="left")
-        self.table.add_column("Reporter", style=self.helper.get_color("table"), justify="left")
-        self.table.add_column("status", style=self.helper.get_color("table"), justify="center")
+    def jump_to_key(self, ticket_no):
+        """
+        Show the page holding a ticket, with the ticket highlighted.
 
-        if isinstance(self.filtered_data, list):
-            for ticket in self.filtered_data:
-                self.table.add_row(
-                    str(ticket['ticketNo']),
-                    ticket['title'] if ticket['title'] is not None else "",
-                    ticket['assignee'] if ticket['assignee'] is not None else "",
-                    ticket['reporter'] if ticket['reporter'] is not None else "",
-                    ticket['status'] if ticket['status'] is not None else ""
+        Args:
+            ticket_no (str): Jira ticket number, in any case.
 
-                )
-        else:
-            self.table.add_row(
-                str(self.original_data['ticketNo']),
-                self.original_data['title'] if self.original_data['title'] is not None else "",
-                self.original_data['assignee'] if self.original_data['assignee'] is not None else "",
-                self.original_data['reporter'] if self.original_data['reporter'] is not None else "",
-                self.original_data['status'] if self.original_data['status'] is not None else ""
+        Returns:
+            bool: False if the ticket is not among the filtered tickets.
+        """
+        ticket_no = ticket_no.strip().upper()
+        if not isinstance(self.filtered_data, list):
+            return False
+        for position, ticket in enumerate(self.filtered_data):
+            if ticket.ticket_no.upper() == ticket_no:
+                self.page = position // self.page_size()
+                self.highlight_key = ticket.ticket_no
+                self.build_table()
+                return True
+        return False
+
+    def load_progressively(self, load_tickets, cached_data=None):
+        """
+        Load the board data while rendering rows and progress as pages arrive.
+
+        The first page is shown as soon as it is received instead of after every project
+        has been fetched. When cached data is given it is shown right away and only the
+        progress is updated until the refreshed data replaces it.
+
+        Args:
+            load_tickets (callable): Loader taking an on_page(project, tickets, done) callback
+                and returning the final list of tickets.
+            cached_data (list, optional): Previously stored tickets to show while loading.
+
+        Returns:
+            list: The loaded tickets, now shown on the board.
+        """
+        lock = threading.Lock()
+        table = self.helper.new_ticket_table()
+        page_size = self.page_size()
+        for ticket in (cached_data or [])[:page_size]:
+            self.helper.add_ticket_row(table, ticket)
+        progress = {'tickets': 0, 'projects': 0}
+        total_projects = len(self.project_names)
+        table.caption = "Loading tickets..."
+
+        with Live(table, console=self.console, auto_refresh=False, transient=True) as live:
+            def on_page(project, tickets, done):
+                with lock:
+                    progress['tickets'] += len(tickets)
+                    if done:
+                        progress['projects'] += 1
+                    if not cached_data:
+                        for ticket in tickets[:page_size - table.row_count]:
+                            self.helper.add_ticket_row(table, ticket)
+                    table.caption = (
+                        f"Loading tickets... {progress['tickets']} received, "
+                        f"{min(progress['projects'], total_projects)}/{total_projects} projects done"
+                    )
+                    live.refresh()
+
+            live.refresh()
+            data = load_tickets(on_page)
+
+        self.set_data(data)
+        self.build_table()
+        return data
+
+    def set_data(self, data, jira_client=None, caption=None):
+        """
+        Replace the tickets of the board, clearing its filter, without printing it.
+
+        The board view is kept, so the rows of tickets that did not change are not
+        rendered again.
+
+        Args:
+            data (list): List of Ticket records, or a single Ticket.
+            jira_client (JiraClient, optional): New client, e.g. an OfflineClient after losing Jira.
+            caption (str, optional): New caption; the current one is kept if not given.
+        """
+        with self.lock:
+            self.original_data = data
+            self.filtered_data = data
+            self.filter_text = ""
+            self.filter_refinements = []
+            self.filter_index = None
+            self.remote_matches = []
+            self.pushdown_cache.clear()
+            self.page = 0
+            self.highlight_key = None
+            if jira_client is not None:
+                self.jira_client = jira_client
+            if caption is not None:
+                self.caption = caption
+
+    def upsert_ticket(self, ticket):
+        """
+        Patch a ticket in place after a write, or insert it at the top if it is new, and show the board.
+
+        The dataset, filter index and ticket store are updated for this ticket only,
+        without fetching the board again. A ticket that is not on the board is only
+        inserted if the board's query would return it (see belongs_on_board).
 
-            )
-        console = Console()
-        console.print(self.table)
+        Args:
+            ticket (Ticket): The updated or created ticket.
+        """
+        if isinstance(self.original_data, list):
+            with self.lock:
+                on_board = any(existing.ticket_no == ticket.ticket_no for existing in self.original_data)
+            if on_board or self.belongs_on_board(ticket):
+                self.merge_tickets([ticket])
+        self.build_table()
+
+    def belongs_on_board(self, ticket):
+        """
+        Tell whether a ticket is of one of the board's projects and involves one of its users.
+
+        Users are configured as user names or email addresses while tickets hold display
+        names, so a user matches a display name equal to it, or to the user part of its
+        email address with dots read as spaces, ignoring case.
+
+        Args:
+            ticket (Ticket): The ticket.
+
+        Returns:
+            bool: True if the board's query would return the ticket.
+        """
+        project_key = ticket.project_key or ticket.ticket_no.rsplit('-', 1)[0]
+        projects = {project.lower() for project in self.project_names}
+        if project_key.lower() not in projects and (ticket.project or '').lower() not in projects:
+            return False
+        if not self.users:
+            return True
+        people = {(name or '').lower() for name in (ticket.assignee, ticket.reporter)} - {''}
+        return any(user.lower() in people or user.lower().split('@')[0].replace('.', ' ') in people
+                   for user in self.users)
+
+    def merge_tickets(self, tickets):
+        """
+        Merge changed tickets into the board without printing it. Safe to call from a
+        background thread.
+
+        Args:
+            tickets (list): Updated or new Ticket records.
+
+        Returns:
+            bool: True if any ticket differed from the board's copy.
+        """
+        with self.lock:
+            positions = {existing.ticket_no: position for position, existing in enumerate(self.original_data)}
+            changed = []
+            for ticket in tickets:
+                position = positions.get(ticket.ticket_no)
+                if position is None:
+                    self.original_data.insert(0, ticket)
+                    positions = {existing.ticket_no: index for index, existing in enumerate(self.original_data)}
+                elif self.original_data[position].search_values() != ticket.search_values():
+                    self.original_data[position] = ticket
+                else:
+                    continue
+                changed.append(ticket)
+                if self.filter_index is not None:
+                    self.filter_index.upsert(ticket)
+            if not changed:
+                return False
+            if self.ticket_store:
+                for ticket in changed:
+                    self.ticket_store.update_ticket(ticket)
+            board_keys = {ticket.ticket_no for ticket in changed}
+            self.remote_matches = [ticket for ticket in self.remote_matches if ticket.ticket_no not in board_keys]
+            self.filtered_data = self.filter_data(self.filter_text, self.filter_refinements)
+            if self.remote_matches:
+                self.filtered_data = self.filtered_data + self.remote_matches
+            self.build_table(print_table=False)
+        return True
 
     def refresh_terminal(self):
         """
@@ -74,28 +315,151 @@ class JiraBoard:
         Display the Kanban board table.
         """
         self.refresh_terminal()
-        self.console.print(self.table)
+        with self.lock, PROFILER.phase('render'):
+            self.console.print(self.table)
 
     def update_filter_text(self, filter_text):
         """
         Update the filter text and refresh the board accordingly.
 
+        The filter is always applied to the full dataset. A filter text starting with '+'
+        refines the current result instead of replacing the filter; with no active
+        filter, it is searched as a new filter. Besides plain text,
+        filters may use the query syntax of filter_query, e.g.
+        status:"In Progress" assignee:me -reporter:bot. An invalid query is reported and
+        leaves the board unchanged.
+
         Args:
             filter_text (str): Text to filter the board.
         """
-        self.filter_text = filter_text
-        if self.filter_text:
-            self.filtered_data = [
-                ticket for ticket in self.filtered_data
-                if any(
-                    str(value).lower().find(self.filter_text.lower()) != -1 if value is not None else False
-                    for value in ticket.values()
-                )
-            ]
+        if filter_text.startswith('+') and self.filter_text:
+            new_filter = (self.filter_text, self.filter_refinements + [filter_text[1:].strip()])
+        elif filter_text.startswith('+'):
+            # Without a previous result there is nothing to refine, the text is a new filter.
+            new_filter = (filter_text[1:].strip(), [])
         else:
-            self.filtered_data = self.original_data
+            new_filter = (filter_text, [])
+        try:
+            filtered_data = self.filter_data(*new_filter)
+            remote_matches = self.pushdown_filter(*new_filter) if isinstance(filtered_data, list) else []
+        except ValueError as e:
+            self.console.print(f"[bold red]Invalid filter: {e}[/bold red]")
+            return
+        self.filter_text, self.filter_refinements = new_filter
+        self.filtered_data = filtered_data + remote_matches if remote_matches else filtered_data
+        self.remote_matches = remote_matches
+        self.page = 0
+        self.highlight_key = None
         self.build_table()
 
+    def filter_data(self, filter_text, refinements=()):
+        """
+        Return the tickets matching a filter text, using the board's filter index.
+
+        Args:
+            filter_text (str): Text to filter the board.
+            refinements (list): Further texts every matching ticket must also contain.
+
+        Returns:
+            list: Matching tickets, or the whole dataset if the filter text is empty.
+
+        Raises:
+            ValueError: If a filter is an invalid query.
+        """
+        if not filter_text or not isinstance(self.original_data, list):
+            return self.original_data
+        with self.lock, PROFILER.phase('filter'):
+            if self.filter_index is None:
+                self.filter_index = FilterIndex(self.original_data)
+            tickets = self.filter_index.search(filter_text, self.current_user_name)
+            for text in refinements:
+                tickets = self.filter_index.refine(text, self.current_user_name)
+        return tickets
+
+    def truncated_projects(self):
+        """
+        Return the projects whose tickets may not all be on the board.
+
+        A project is truncated when the board holds 'max_table_entry' of its tickets,
+        the most that are downloaded per project.
+
+        Returns:
+            list: Project names.
+        """
+        max_table_entry = self.app_options.get("max_table_entry", 100)
+        if not max_table_entry or not isinstance(self.original_data, list):
+            return []
+        counts = Counter()
+        for ticket in self.original_data:
+            # Tickets synced before the store kept project keys only have their key's prefix.
+            project_key = ticket.project_key or ticket.ticket_no.rsplit('-', 1)[0]
+            counts[project_key.lower()] += 1
+            if ticket.project and ticket.project.lower() != project_key.lower():
+                counts[ticket.project.lower()] += 1
+        return [project for project in self.project_names if counts[project.lower()] >= max_table_entry]
+
+    def pushdown_filter(self, filter_text, refinements=()):
+        """
+        Search Jira for the tickets matching a filter that were never downloaded.
+
+        The filter is translated to JQL (see filter_query.to_jql) and searched in the
+        truncated projects only. Jira's results are cached per query and filtered
+        locally again, so they match exactly like the board's own tickets.
+
+        Args:
+            filter_text (str): Text to filter the board.
+            refinements (list): Further texts every matching ticket must also match.
+
+        Returns:
+            list: Matching tickets that are not on the board, most recently created first.
+
+        Raises:
+            ValueError: If a filter is an invalid query.
+        """
+        projects = self.truncated_projects() if filter_text else []
+        cloud = self.jira_client.is_cloud()
+        conditions = [to_jql(text, cloud) for text in [filter_text, *refinements]]
+        conditions = [f'({condition})' for condition in conditions if condition]
+        if not projects or not conditions:
+            return []
+        condition = " AND ".join(conditions)
+        cache_key = (tuple(projects), condition)
+        candidates = self.pushdown_cache.get(cache_key)
+        if candidates is None:
+            try:
+                with self.jira_client.track('filter'), PROFILER.phase('pushdown'):
+                    candidates = self.jira_client.search_tickets(projects, self.users, condition,
+                                                                 self.app_options.get("pushdown_limit", 500))
+            except Exception as e:
+                self.console.print(f"[bold red]Error searching Jira: {str(e)}[/bold red]")
+                return []
+            self.pushdown_cache.put(cache_key, candidates)
+        with self.lock:
+            board_keys = {ticket.ticket_no for ticket in self.original_data}
+        candidates = [ticket for ticket in candidates if ticket.ticket_no not in board_keys]
+        if not candidates:
+            return []
+        index = FilterIndex(candidates)
+        tickets = index.search(filter_text, self.current_user_name)
+        for text in refinements:
+            tickets = index.refine(text, self.current_user_name)
+        return tickets
+
+    def current_user_name(self):
+        """
+        Return the display name 'me' stands for in filter queries, looked up once.
+
+        Returns:
+            str: The display name, or None if it cannot be found.
+        """
+        if self.me is None:
+            try:
+                self.me = self.jira_client.current_user_name() or ''
+            except Exception as e:
+                self.console.print(f"[bold red]Error retrieving the current user: {str(e)}[/bold red]")
+                self.me = ''
+        return self.me or None
+
     def display_ticket_details(self, ticket_number, filter_mode, direct_search=False):
         """
         Display details for a specific Jira ticket and provide an option to update its status.
@@ -104,39 +468,21 @@ class JiraBoard:
             ticket_number (str): Jira ticket number.
             filter_mode (bool): True if currently in filter mode, False otherwise.
         """
-        form_color = self.helper.get_color("details_form")
         ticket_details = self.jira_client.get_ticket_details(ticket_number)
-        details_table = Table(title=f"Details for Ticket #{ticket_number}")
-        details_table.add_column("Field", style=form_color, justify="left")
-        details_table.add_column("Value", style=form_color, justify="left")
-
-        for field, value in ticket_details.items():
-            details_table.add_row(str(field), str(value) if value is not None else "")
-
+        details_table = self.helper.details_table(ticket_number, ticket_details)
 
         if not direct_search:
             self.refresh_terminal()
             self.console.print(details_table)
             update_choice = input("Do you want to update the ticket status? Type 'y' to proceed: ").strip().lower()
             if update_choice == 'y':
-                self.jira_client.update_ticket_status(ticket_details)
-
-                # Update the existing instance with the latest Jira tickets
-                self.original_data = self.jira_client.get_jira_tickets(self.project_names, self.users)
-                self.filtered_data = self.original_data if not self.filter_text else [
-                    ticket for ticket in self.original_data
-                    if any(
-                        str(value).lower().find(self.filter_text.lower()) != -1 if value is not None else False
-                        for value in ticket.values()
-                    )
-                ]
-                self.build_table()
-                self.display_board()
-            else:
-                if filter_mode:
-                    self.update_filter_text(self.filter_text)
+                updated_ticket = self.jira_client.update_ticket_status(ticket_details)
+                if updated_ticket:
+                    self.upsert_ticket(updated_ticket)
                 else:
                     self.display_board()
+            else:
+                self.display_board()
         else:
             self.console.print(details_table)
             exit(0)
@@ -146,7 +492,7 @@ class JiraBoard:
         Automatically display details for a single ticket if only one is present in the filtered list.
         """
         if len(self.filtered_data) == 1:
-            ticket_number = str(self.filtered_data[0].get('ticketNo', ''))
+            ticket_number = str(self.filtered_data[0].ticket_no)
             show_ticket = input(f"There is only one ticket in the filtered list (Ticket #{ticket_number}). Type 'y' to display details: ")
             if show_ticket.lower() == 'y':
                 self.display_ticket_details(ticket_number, self.filter_mode)
@@ -1,63 +1,414 @@
-from jira import JIRA
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from jira.exceptions import JIRAError
+from requests.exceptions import RequestException
 from rich.console import Console
-from questionary import prompt
+from jiraclui.connection import JiraConnection
 from jiraclui.helper import Helper
+from jiraclui.profiler import PROFILER
+from jiraclui.ticket import Ticket
+
+# Extra minutes added to every delta query so that clock skew and JQL's minute
+# resolution can never hide an update between two syncs.
+SYNC_OVERLAP_MINUTES = 2
+TICKET_FIELDS = 'key,project,summary,assignee,reporter,status,issuetype'
+SYNC_FIELDS = TICKET_FIELDS + ',created,updated'
+# Keys looked up per search request by get_tickets.
+KEYS_PER_QUERY = 100
+# Statuses of a failed bulk create request meaning the server has no bulk create endpoint.
+BULK_CREATE_UNSUPPORTED = (404, 405, 501)
+# Message of a 400 response to a transition that the issue's workflow does not offer (any more).
+STALE_TRANSITION_PATTERN = re.compile(r'(transition|workflow operation).*\b(not valid|invalid)\b', re.IGNORECASE | re.DOTALL)
+
+
 class JiraClient:
     def __init__(self, server_url, api_key, app_options):
         """
         Initialize JiraClient with server URL and API key.
 
+        The underlying Jira session is shared by every client of the same server.
+
         Args:
             server_url (str): Jira server URL.
             api_key (str): API key for authentication.
         """
-        self.options = {
-            'server': server_url,
-            'headers': {
-                'Authorization': f'Bearer {api_key}'
-            }
-        }
         self.app_options = app_options
         self.helper = Helper(app_options)
-        self.jira = JIRA(self.options)
+        self.connection = JiraConnection.get(server_url, api_key, app_options)
+        self.jira = self.connection.jira
         self.console = Console()
 
-    def get_jira_tickets(self, project_names, users):
+    def track(self, command):
+        """
+        Count the Jira requests sent inside a with block under a command name.
+
+        Args:
+            command (str): Command name, e.g. 'issue', 'today' or 'refresh'.
+
+        Returns:
+            A context manager.
+        """
+        return self.connection.transport.track(command)
+
+    def is_cloud(self):
+        """
+        Tell whether the server is Jira Cloud, from the cached server info.
+        """
+        return self.jira._is_cloud
+
+    def get_jira_tickets(self, project_names, users, on_page=None):
         """
         Retrieve Jira tickets based on project names and user assignments.
 
+        Every project is paged up to 'max_table_entry' tickets. With 'max_table_entry'
+        set to 0 there is no per-project cap and all projects are read with one query.
+
         Args:
             project_names (list): List of project names.
             users (list): List of user names or email addresses.
+            on_page (callable, optional): Called as on_page(project, tickets, done) for every
+                page as it arrives, and with done=True once a project is complete.
 
         Returns:
-            list: List of dictionaries containing ticket details.
+            list: List of Ticket records.
         """
-        results = []
+        max_table_entry = self.app_options.get("max_table_entry", 100)
+        if not max_table_entry:
+            jql_query = self.build_projects_query(project_names, users) + ' ORDER BY created DESC'
+            tickets = []
+            with PROFILER.phase('fetch', 'all projects'):
+                for page in self.iter_search_pages(jql_query):
+                    page_tickets = self.convert_page(page, 'all projects')
+                    tickets.extend(page_tickets)
+                    self.notify_page(on_page, None, page_tickets)
+            self.notify_page(on_page, None, [], True)
+            return tickets
+
+        def fetch_project(project):
+            jql_query = self.build_project_query(project, users) + ' ORDER BY created DESC'
+            tickets = []
+            with PROFILER.phase('fetch', project):
+                for page in self.iter_search_pages(jql_query, limit=max_table_entry):
+                    page_tickets = self.convert_page(page, project)
+                    tickets.extend(page_tickets)
+                    self.notify_page(on_page, project, page_tickets)
+            self.notify_page(on_page, project, [], True)
+            return tickets
+
+        return self.fetch_projects(fetch_project, project_names)
+
+    def sync_jira_tickets(self, ticket_store, project_names, users, on_page=None):
+        """
+        Refresh the local ticket store and return the tickets it holds.
+
+        Only tickets updated since the last sync of a project are downloaded, with one
+        query covering all projects. A full download happens on the first sync of a
+        project and then every 'full_sync_hours'.
+
+        Args:
+            ticket_store (TicketStore): Local ticket store to refresh.
+            project_names (list): List of project names.
+            users (list): List of user names or email addresses.
+
+        Returns:
+            list: List of Ticket records.
+        """
+        max_table_entry = self.app_options.get("max_table_entry", 100)
+        full_sync_seconds = self.app_options.get("full_sync_hours", 24) * 3600
+        synced_at = time.time()
+        full_projects = []
+        delta_minutes = {}
 
         for project in project_names:
-            if not users:
-                jql_query = f'project={project}'
+            last_sync, last_full_sync = ticket_store.get_sync_state(ticket_store.scope_for(project, users))
+            if last_sync is None or last_full_sync is None or synced_at - last_full_sync > full_sync_seconds:
+                full_projects.append(project)
             else:
-                user_queries = [f'(assignee={user} OR reporter={user})' for user in users]
-                jql_query = f'project={project} AND {" OR ".join(user_queries)}'
-            jql_query += ' ORDER BY created DESC'
-
-            issues = self.jira.search_issues(jql_query, maxResults=self.app_options.get("max_table_entry", 100), fields='key,project,summary,assignee,reporter,status')
-
-            for issue in issues:
-                result = {
-                    'ticketNo': issue.key,
-                    'project': issue.fields.project.name,
-                    'title': issue.fields.summary,
-                    'assignee': issue.fields.assignee.displayName if issue.fields.assignee else None,
-                    'reporter': issue.fields.reporter.displayName if issue.fields.reporter else None,
-                    'status': issue.fields.status.name
-                }
-                results.append(result)
+                delta_minutes[project] = int((synced_at - last_sync) // 60) + SYNC_OVERLAP_MINUTES
+
+        def full_sync_project(project):
+            jql_query = self.build_project_query(project, users) + ' ORDER BY created DESC'
+            tickets = []
+            with PROFILER.phase('fetch', project):
+                for page in self.iter_search_pages(jql_query, SYNC_FIELDS, max_table_entry or None):
+                    page_tickets = self.convert_page(page, project)
+                    tickets.extend(page_tickets)
+                    self.notify_page(on_page, project, page_tickets)
+            with PROFILER.phase('store', project):
+                ticket_store.merge_tickets(ticket_store.scope_for(project, users), tickets, synced_at, full_sync=True)
+            self.notify_page(on_page, project, [], True)
+            return []
 
-        return results
+        self.fetch_projects(full_sync_project, full_projects)
+
+        if delta_minutes:
+            conditions = [f'(project={project} AND updated >= "-{minutes}m")' for project, minutes in delta_minutes.items()]
+            jql_query = f'({" OR ".join(conditions)})'
+            if users:
+                jql_query += f' AND {self.build_user_query(users)}'
+            changed = {project: [] for project in delta_minutes}
+            with PROFILER.phase('fetch', 'delta'):
+                for page in self.iter_search_pages(jql_query, SYNC_FIELDS):
+                    page_tickets = self.convert_page(page, 'delta')
+                    for raw_issue, ticket in zip(page, page_tickets):
+                        project_fields = raw_issue['fields']['project']
+                        project = project_fields['key'] if project_fields['key'] in changed else project_fields['name']
+                        changed.setdefault(project, []).append(ticket)
+                    self.notify_page(on_page, None, page_tickets)
+            for project, tickets in changed.items():
+                if project in delta_minutes:
+                    with PROFILER.phase('store', project):
+                        ticket_store.merge_tickets(ticket_store.scope_for(project, users), tickets, synced_at)
+                    self.notify_page(on_page, project, [], True)
+
+        return [
+            ticket
+            for project in project_names
+            for ticket in ticket_store.get_tickets(ticket_store.scope_for(project, users), max_table_entry)
+        ]
+
+    def get_updated_tickets(self, project_names, users, since):
+        """
+        Retrieve the tickets of all projects updated since a point in time, with one query.
+
+        Args:
+            project_names (list): List of project names.
+            users (list): List of user names or email addresses.
+            since (float): Epoch seconds of the previous check.
+
+        Returns:
+            list: List of Ticket records, most recently updated first.
+        """
+        minutes = int((time.time() - since) // 60) + SYNC_OVERLAP_MINUTES
+        jql_query = f'{self.build_projects_query(project_names, users)} AND updated >= "-{minutes}m" ORDER BY updated DESC'
+        return list(self.iter_tickets(jql_query))
+
+    def search_tickets(self, project_names, users, condition, limit=None):
+        """
+        Search the tickets of the board's projects matching a JQL condition, e.g. a pushed down filter.
+
+        Args:
+            project_names (list): List of project names.
+            users (list): List of user names or email addresses.
+            condition (str): JQL condition.
+            limit (int, optional): Maximum number of tickets to read, or None for all.
+
+        Returns:
+            list: List of Ticket records, most recently created first.
+        """
+        jql_query = f'{self.build_projects_query(project_names, users)} AND ({condition}) ORDER BY created DESC'
+        return list(self.iter_tickets(jql_query, limit))
+
+    def get_tickets(self, ticket_numbers):
+        """
+        Retrieve several tickets by key, with one search per KEYS_PER_QUERY keys.
+
+        Args:
+            ticket_numbers (list): Jira ticket numbers.
+
+        Returns:
+            tuple: The found Ticket records in the given order, and the keys that were not found.
+        """
+        ticket_numbers = list(dict.fromkeys(key.strip().upper() for key in ticket_numbers if key.strip()))
+        found = {}
+        for start in range(0, len(ticket_numbers), KEYS_PER_QUERY):
+            chunk = ticket_numbers[start:start + KEYS_PER_QUERY]
+            # Unknown keys only make Jira warn instead of failing the whole search.
+            for page in self.iter_search_pages(f'key in ({", ".join(chunk)})', validate_query=False):
+                for raw_issue in page:
+                    ticket = Ticket.from_json(raw_issue)
+                    found[ticket.ticket_no] = ticket
+        return ([found[key] for key in ticket_numbers if key in found],
+                [key for key in ticket_numbers if key not in found])
+
+    def iter_search_pages(self, jql_query, fields=TICKET_FIELDS, limit=None, validate_query=True):
+        """
+        Run a JQL search page by page, yielding the raw issues of each page as it arrives.
+
+        Pages of 'page_size' issues are requested by walking startAt on Jira Server, and
+        by following nextPageToken until the last page on Jira Cloud, where the search
+        returns no total and rejects startAt. Results are not truncated by the server's
+        maximum page size and only one page is held at a time.
+
+        Args:
+            jql_query (str): JQL query.
+            fields (str): Comma separated list of fields to return.
+            limit (int, optional): Maximum number of issues to read, or None for all.
+            validate_query (bool): False to have Jira only warn about invalid values, e.g. unknown keys.
+                Ignored on Jira Cloud.
+
+        Yields:
+            list: Raw issue dictionaries of one page.
+        """
+        page_size = self.app_options.get("page_size", 100)
+        cloud = self.jira._is_cloud
+        start_at = 0
+        next_page_token = None
+        while limit is None or start_at < limit:
+            max_results = page_size if limit is None else min(page_size, limit - start_at)
+            if cloud:
+                page = self.jira.enhanced_search_issues(jql_query, nextPageToken=next_page_token, maxResults=max_results,
+                                                        fields=fields, json_result=True)
+            else:
+                page = self.jira.search_issues(jql_query, startAt=start_at, maxResults=max_results, fields=fields,
+                                               json_result=True, validate_query=validate_query)
+            issues = page.get('issues', [])
+            if not issues:
+                return
+            yield issues
+            start_at += len(issues)
+            if cloud:
+                next_page_token = page.get('nextPageToken')
+                if page.get('isLast', True) or not next_page_token:
+                    return
+            elif start_at >= page.get('total', 0):
+                return
+
+    def iter_tickets(self, jql_query, limit=None):
+        """
+        Run a JQL search and yield board tickets as their pages arrive.
+
+        Args:
+            jql_query (str): JQL query.
+            limit (int, optional): Maximum number of tickets to read, or None for all.
+
+        Yields:
+            Ticket: The next ticket.
+        """
+        for page in self.iter_search_pages(jql_query, TICKET_FIELDS, limit):
+            for raw_issue in page:
+                yield Ticket.from_json(raw_issue)
+
+    def export_tickets(self, jql_query, writer, fields=None):
+        """
+        Stream the issues matching a JQL query to an export writer, page by page.
+
+        Each page is written as soon as it arrives and is then dropped, so memory does
+        not grow with the number of issues exported. The caller closes the writer.
+
+        Args:
+            jql_query (str): JQL query.
+            writer: Export writer, see exporter.open_writer.
+            fields (list, optional): Exported fields; 'key' or Jira field ids. DEFAULT_EXPORT_FIELDS by default.
+
+        Returns:
+            int: Number of issues exported.
+        """
+        from jiraclui.exporter import DEFAULT_EXPORT_FIELDS, field_value
+        fields = fields or DEFAULT_EXPORT_FIELDS
+        count = 0
+        for page in self.iter_search_pages(jql_query, ",".join(fields)):
+            with PROFILER.phase('export'):
+                writer.write_rows([field_value(raw_issue, field) for field in fields] for raw_issue in page)
+            count += len(page)
+        return count
+
+    @staticmethod
+    def convert_page(page, label):
+        """
+        Convert a page of raw issues to tickets, timed as the 'convert' phase.
+
+        Args:
+            page (list): Raw issue dictionaries.
+            label (str): Profiler label, e.g. the project.
+
+        Returns:
+            list: List of Ticket records.
+        """
+        with PROFILER.phase('convert', label):
+            return [Ticket.from_json(raw_issue) for raw_issue in page]
+
+    @staticmethod
+    def notify_page(on_page, project, tickets, done=False):
+        """
+        Report a page of tickets to an optional progress callback.
 
+        Args:
+            on_page (callable): Progress callback, or None.
+            project (str): Project the page belongs to, or None for a multi-project query.
+            tickets (list): Tickets of the page.
+            done (bool): True once the project is complete.
+        """
+        if on_page:
+            on_page(project, tickets, done)
+
+    def fetch_projects(self, fetch_project, project_names):
+        """
+        Run a per-project fetch for every project concurrently and merge the results.
+
+        At most 'fetch_workers' projects are fetched at the same time. The merged list
+        keeps the order of project_names, whatever order the fetches complete in.
+
+        Args:
+            fetch_project (callable): Function taking a project name and returning a list of Ticket records.
+            project_names (list): List of project names.
+
+        Returns:
+            list: List of Ticket records.
+        """
+        workers = max(1, min(self.app_options.get("fetch_workers", 8), len(project_names)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            per_project = list(executor.map(fetch_project, project_names))
+        return [ticket for tickets in per_project for ticket in tickets]
+
+    @staticmethod
+    def build_project_query(project, users):
+        """
+        Build the JQL selecting the tickets of a project, optionally restricted to users.
+
+        Args:
+            project (str): Project key.
+            users (list): List of user names or email addresses.
+
+        Returns:
+            str: JQL query without ordering.
+        """
+        if not users:
+            return f'project={project}'
+        return f'project={project} AND {JiraClient.build_user_query(users)}'
+
+    @staticmethod
+    def build_projects_query(project_names, users):
+        """
+        Build a single JQL selecting the tickets of several projects.
+
+        Args:
+            project_names (list): List of project names.
+            users (list): List of user names or email addresses.
+
+        Returns:
+            str: JQL query without ordering.
+        """
+        jql_query = f'project in ({", ".join(project_names)})'
+        if users:
+            jql_query += f' AND {JiraClient.build_user_query(users)}'
+        return jql_query
+
+    @staticmethod
+    def build_user_query(users):
+        """
+        Build the JQL condition matching tickets assigned to or reported by any of the users.
+
+        Args:
+            users (list): List of user names or email addresses.
+
+        Returns:
+            str: Parenthesised JQL condition.
+        """
+        user_queries = [f'(assignee={user} OR reporter={user})' for user in users]
+        return f'({" OR ".join(user_queries)})'
+
+    def current_user_name(self):
+        """
+        Return the display name of the authenticated user, cached between runs.
+
+        Returns:
+            str: The display name, or None if Jira did not return one.
+        """
+        self.connection.current_user()
+        return (getattr(self.jira, '_myself', None) or {}).get('displayName')
 
     def get_ticket_details(self, ticket_no):
         """
@@ -67,56 +418,251 @@ class JiraClient:
             ticket_no (str): Jira ticket number.
 
         Returns:
-            dict: Dictionary containing ticket details.
+            Ticket: The ticket with its description, or a dictionary with an 'error' message.
         """
+        # Cached under the canonical key, the one transitions invalidate, whatever the user typed.
+        ticket_no = ticket_no.strip().upper()
+        ticket = self.connection.detail_cache.get(ticket_no)
+        if ticket is not None:
+            return ticket
         try:
-            issue = self.jira.issue(ticket_no)
-            content = {
-                'ticketNo': issue.key,
-                'project': issue.fields.project.name,
-                'title': issue.fields.summary,
-                'description': issue.fields.description,
-                'assignee': issue.fields.assignee.displayName if issue.fields.assignee else None,
-                'reporter': issue.fields.reporter.displayName if issue.fields.reporter else None,
-                'status': issue.fields.status.name
-            }
-            return content
+            ticket = Ticket.from_issue(self.jira.issue(ticket_no))
+            self.connection.detail_cache.put(ticket_no, ticket)
+            return ticket
         except Exception as e:
             if "Issue Does Not Exist" in str(e):
                 return {'error': "Issue Does Not Exist"}
             else:
                 return {'error': str(e)}
 
-    def update_ticket_status(self, ticket_details):
+    def get_transitions(self, ticket, refresh=False):
+        """
+        Return the transitions available to a ticket.
+
+        Transitions are cached per project, issue type and status, so tickets sharing
+        them are resolved locally without another transitions request.
+
+        Args:
+            ticket (Ticket): The ticket.
+            refresh (bool): True to ignore the cache and ask Jira again.
+
+        Returns:
+            list: Transitions as dictionaries with 'id', 'name' and 'to' (target status name).
+        """
+        transition_cache = self.connection.transition_cache
+        cache_key = transition_cache.key_for(ticket)
+        transitions = None if refresh or cache_key is None else transition_cache.get(cache_key)
+        if transitions is None:
+            transitions = [
+                {'id': transition['id'], 'name': transition['name'], 'to': transition.get('to', {}).get('name')}
+                for transition in self.jira.transitions(ticket.ticket_no)
+            ]
+            if cache_key is not None:
+                transition_cache.put(cache_key, transitions)
+        return transitions
+
+    @staticmethod
+    def find_transition(transitions, target):
+        """
+        Find a transition by its name or by the name of its target status, ignoring case.
+
+        Args:
+            transitions (list): Transitions as returned by get_transitions.
+            target (str): Transition or status name.
+
+        Returns:
+            dict: The matching transition, or None.
+        """
+        target = target.strip().lower()
+        for transition in transitions:
+            if transition['name'].lower() == target:
+                return transition
+        for transition in transitions:
+            if (transition['to'] or '').lower() == target:
+                return transition
+        return None
+
+    def transition_ticket(self, ticket, target):
+        """
+        Move a ticket to a status by name, resolving the transition locally when cached.
+
+        A cached transition that Jira reports as missing or invalid is looked up again
+        once, in case the workflow changed since it was cached. If that lookup fails,
+        the cached transitions are dropped rather than served again. Other errors, such
+        as permission or field validation errors, are raised unchanged.
+
+        Args:
+            ticket (Ticket): The ticket to update.
+            target (str): Transition or status name.
+
+        Returns:
+            dict: The applied transition.
+
+        Raises:
+            ValueError: If no transition matches the target.
+        """
+        transition_cache = self.connection.transition_cache
+        cache_key = transition_cache.key_for(ticket)
+        cached = cache_key is not None and transition_cache.get(cache_key) is not None
+        attempts = (False, True) if cached else (False,)
+        for refresh in attempts:
+            try:
+                transitions = self.get_transitions(ticket, refresh)
+            except JIRAError:
+                if refresh:
+                    transition_cache.invalidate(cache_key)
+                raise
+            transition = self.find_transition(transitions, target)
+            if transition is None:
+                continue
+            try:
+                self.jira.transition_issue(ticket.ticket_no, transition['id'])
+            except JIRAError as e:
+                if refresh == attempts[-1] or not self.is_stale_transition_error(e):
+                    raise
+                continue
+            self.connection.detail_cache.invalidate(ticket.ticket_no)
+            return transition
+        names = ", ".join(transition['name'] for transition in transitions)
+        raise ValueError(f"No transition to '{target}' for {ticket.ticket_no}. Available: {names}")
+
+    @staticmethod
+    def is_stale_transition_error(error):
+        """
+        Tell whether Jira rejected a transition because the workflow no longer offers it.
+
+        Args:
+            error (JIRAError): The error of the transition request.
+
+        Returns:
+            bool: True for a 404, or a 400 saying the transition is not valid.
+        """
+        return error.status_code == 404 or (
+            error.status_code == 400 and bool(STALE_TRANSITION_PATTERN.search(error.text or '')))
+
+    def update_ticket_status(self, ticket_details, target_status=None):
         """
         Update the status of a Jira ticket.
 
         Args:
-            ticket_details (dict): Dictionary containing ticket details.
+            ticket_details (Ticket): The ticket to update.
+            target_status (str, optional): Transition or status name to apply without
+                prompting. The user picks from the available transitions otherwise.
+
+        Returns:
+            Ticket: The ticket with its new status, or None if it was not updated.
         """
         try:
             prompt_color = self.helper.get_color("prompts")
-            ticket_no = ticket_details['ticketNo']
-            issue = self.jira.issue(ticket_no)
+            ticket_no = ticket_details.ticket_no
+
+            if target_status:
+                transition = self.transition_ticket(ticket_details, target_status)
+                self.console.print(f"[{prompt_color}]Ticket {ticket_no} status updated to '{transition['name']}'[/{prompt_color}]")
+                return ticket_details.replace(status=transition['to'] or ticket_details.status)
 
-            transitions = self.jira.transitions(issue)
-            available_transitions = {str(index + 1): transition['name'] for index, transition in enumerate(transitions)}
+            transitions = self.get_transitions(ticket_details)
+            available_transitions = {str(index + 1): transition for index, transition in enumerate(transitions)}
 
             self.console.print(f"[{prompt_color}]Available status options:[/{prompt_color}]")
-            for index, transition_name in available_transitions.items():
-                self.console.print(f"[{prompt_color}]{index}. {transition_name}[/{prompt_color}]")
+            for index, transition in available_transitions.items():
+                self.console.print(f"[{prompt_color}]{index}. {transition['name']}[/{prompt_color}]")
 
             selected_option = input("Enter the number corresponding to the desired status:")
 
             selected_transition = available_transitions.get(selected_option)
             if selected_transition:
-                self.jira.transition_issue(issue, selected_transition)
-                self.console.print(f"[{prompt_color}]Ticket {ticket_no} status updated to '{selected_transition}'[/{prompt_color}]")
-            else:
-                self.console.print("[bold red]Invalid option. Ticket status not updated.[/bold red]")
+                transition = self.transition_ticket(ticket_details, selected_transition['name'])
+                self.console.print(f"[{prompt_color}]Ticket {ticket_no} status updated to '{transition['name']}'[/{prompt_color}]")
+                return ticket_details.replace(status=transition['to'] or ticket_details.status)
+            self.console.print("[bold red]Invalid option. Ticket status not updated.[/bold red]")
 
         except Exception as e:
             self.console.print(f"[bold red]Error updating ticket status: {str(e)}[/bold red]")
+        return None
+
+    def bulk_transition(self, tickets, target, on_result=None):
+        """
+        Move many tickets to a status concurrently.
+
+        Transitions are applied by at most 'bulk_workers' workers (default 8), whose
+        requests are paced by the connection's request scheduler like any other. The
+        transitions of every distinct project, issue type and status are looked up once
+        before the tickets are moved, so most tickets cost a single request.
+
+        Args:
+            tickets (list): Tickets to update.
+            target (str): Transition or status name.
+            on_result (callable, optional): Called with every result as soon as it is known,
+                from the worker threads.
+
+        Returns:
+            list: Results in the order of the tickets, dictionaries with 'ticket_no' and either
+                'ticket' (the updated ticket) and 'transition', or 'error'.
+        """
+        if not tickets:
+            return []
+        workers = max(1, min(self.app_options.get("bulk_workers", 8), len(tickets)))
+        transition_cache = self.connection.transition_cache
+        workflow_states = {}
+        for ticket in tickets:
+            cache_key = transition_cache.key_for(ticket)
+            if cache_key is not None and transition_cache.get(cache_key) is None:
+                workflow_states.setdefault(cache_key, ticket)
+
+        def look_up_transitions(ticket):
+            try:
+                self.get_transitions(ticket)
+            except Exception:
+                # The error is reported with the ticket's own result.
+                pass
+
+        def transition(ticket):
+            try:
+                applied = self.transition_ticket(ticket, target)
+                result = {'ticket_no': ticket.ticket_no, 'transition': applied['name'],
+                          'ticket': ticket.replace(status=applied['to'] or ticket.status)}
+            except Exception as e:
+                result = {'ticket_no': ticket.ticket_no, 'error': str(e)}
+            if on_result:
+                on_result(result)
+            return result
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(look_up_transitions, workflow_states.values()))
+            return list(executor.map(transition, tickets))
+
+    def bulk_update_status(self, tickets, target_status, missing=()):
+        """
+        Move many tickets to a status concurrently, printing every result and a summary of the failures.
+
+        Args:
+            tickets (list): Tickets to update.
+            target_status (str): Transition or status name.
+            missing (list): Keys that were asked for but not found, reported as failures.
+
+        Returns:
+            list: The updated Ticket records.
+        """
+        prompt_color = self.helper.get_color("prompts")
+        print_lock = threading.Lock()
+
+        def print_result(result):
+            with print_lock:
+                if 'error' in result:
+                    self.console.print(f"[bold red]{result['ticket_no']}: {result['error']}[/bold red]")
+                else:
+                    self.console.print(f"[{prompt_color}]{result['ticket_no']}: status updated to '{result['transition']}'[/{prompt_color}]")
+
+        results = [{'ticket_no': key, 'error': "Issue Does Not Exist"} for key in missing]
+        for result in results:
+            print_result(result)
+        results += self.bulk_transition(tickets, target_status, print_result)
+        failures = [result for result in results if 'error' in result]
+        self.console.print(f"[{prompt_color}]{len(results) - len(failures)} of {len(results)} tickets updated to '{target_status}'.[/{prompt_color}]")
+        if failures:
+            self.console.print(f"[bold red]Failed: {', '.join(result['ticket_no'] for result in failures)}[/bold red]")
+        return [result['ticket'] for result in results if 'ticket' in result]
 
     def get_opened_or_updated_tickets_today(self, project_names):
         """
@@ -126,52 +672,274 @@ class JiraClient:
             project_names (list): List of project names.
 
         Returns:
-            list: List of dictionaries containing ticket details.
+            list: List of Ticket records, or a dictionary with an 'error' message if Jira
+                failed even after the scheduler's retries.
+        """
+        try:
+            current_user_name = self.connection.current_user()
+
+            jql_query = (
+                f'{self.build_projects_query(project_names, [])} AND (created >= startOfDay() OR updated >= startOfDay()) '
+                f'AND (assignee="{current_user_name}" OR reporter="{current_user_name}") ORDER BY updated DESC'
+            )
+            return list(self.iter_tickets(jql_query))
+        except JIRAError as e:
+            return {'error': f"Error retrieving opened or updated tickets: {e.status_code} {e.text}"}
+        except RequestException as e:
+            return {'error': f"Error retrieving opened or updated tickets: {e}"}
+
+    def get_issue_types(self, project_key):
+        """
+        Return the issue types tickets of a project can be created with, cached on disk.
+
+        Args:
+            project_key (str): Project key.
+
+        Returns:
+            dict: Issue types with 'id' and 'name', by lower-cased name.
         """
+        issue_types = self.connection.create_meta_cache.get(project_key)
+        if issue_types is not None:
+            return issue_types
+        if self.uses_legacy_createmeta():
+            return self.fetch_legacy_create_meta(project_key)
+        raw_types = self.get_create_meta_values(f"issue/createmeta/{project_key}/issuetypes")
+        issue_types = {raw_type['name'].lower(): {'id': raw_type['id'], 'name': raw_type['name']} for raw_type in raw_types}
+        self.connection.create_meta_cache.put(project_key, issue_types)
+        return issue_types
+
+    def get_issue_type_fields(self, project_key, issue_type_id):
+        """
+        Return the fields a ticket of a project and issue type can be created with, cached on disk.
+
+        Args:
+            project_key (str): Project key.
+            issue_type_id (str): Issue type id.
+
+        Returns:
+            dict: Field metadata by field id, see create_meta.field_meta.
+        """
+        from jiraclui.create_meta import field_meta
+        cache_key = f"{project_key}|{issue_type_id}"
+        fields = self.connection.create_meta_cache.get(cache_key)
+        if fields is None:
+            if self.uses_legacy_createmeta():
+                self.fetch_legacy_create_meta(project_key)
+                return self.connection.create_meta_cache.get(cache_key) or {}
+            raw_fields = self.get_create_meta_values(f"issue/createmeta/{project_key}/issuetypes/{issue_type_id}")
+            fields = {raw_field['fieldId']: field_meta(raw_field) for raw_field in raw_fields}
+            self.connection.create_meta_cache.put(cache_key, fields)
+        return fields
+
+    def fetch_legacy_create_meta(self, project_key):
+        """
+        Cache the issue types of a project and the fields of all of them, with the one
+        request of the legacy createmeta endpoint.
+
+        Args:
+            project_key (str): Project key.
+
+        Returns:
+            dict: Issue types with 'id' and 'name', by lower-cased name.
+        """
+        from jiraclui.create_meta import field_meta
+        raw = self.jira.createmeta(projectKeys=project_key, expand='projects.issuetypes.fields')
+        raw_types = raw['projects'][0]['issuetypes'] if raw.get('projects') else []
+        for raw_type in raw_types:
+            self.connection.create_meta_cache.put(
+                f"{project_key}|{raw_type['id']}",
+                {field_id: field_meta(field) for field_id, field in raw_type.get('fields', {}).items()})
+        issue_types = {raw_type['name'].lower(): {'id': raw_type['id'], 'name': raw_type['name']} for raw_type in raw_types}
+        self.connection.create_meta_cache.put(project_key, issue_types)
+        return issue_types
+
+    def uses_legacy_createmeta(self):
+        """
+        Tell whether the server only has the legacy createmeta endpoint: Jira Server before 8.4.
+        """
+        return not self.jira._is_cloud and self.jira._version < (8, 4, 0)
+
+    def get_create_meta_values(self, path):
+        """
+        Read every page of a paged createmeta endpoint.
+
+        Args:
+            path (str): REST path, relative to the API root.
+
+        Returns:
+            list: The values of all pages.
+        """
+        values = []
+        while True:
+            page = self.jira._get_json(path, params={'startAt': len(values), 'maxResults': 100})
+            values.extend(page.get('values', []))
+            if page.get('isLast', True) or not page.get('values') or len(values) >= page.get('total', len(values)):
+                return values
+
+    def prepare_manifest(self, issues):
+        """
+        Validate the issues of a manifest against the create metadata and build their fields.
+
+        Args:
+            issues (list): Manifest issues, see manifest.load_manifest.
+
+        Returns:
+            tuple: The references and fields of the issues, and a list of error messages.
+        """
+        from jiraclui.manifest import build_fields, issue_reference, issue_type_name
+        prepared = []
+        errors = []
+        for number, issue in enumerate(issues, 1):
+            reference = issue_reference(issue, number)
+            project_key = str(issue.get('project') or '').upper()
+            type_name = issue_type_name(issue)
+            if not project_key or not type_name:
+                errors.append(f"{reference}: 'project' and 'type' are required")
+                continue
+            issue_type = self.get_issue_types(project_key).get(type_name.lower())
+            if issue_type is None:
+                errors.append(f"{reference}: {project_key} has no issue type '{type_name}'")
+                continue
+            issue_type = dict(issue_type, fields=self.get_issue_type_fields(project_key, issue_type['id']))
+            fields, issue_errors = build_fields(issue, project_key, issue_type, self.jira._is_cloud)
+            errors.extend(f"{reference}: {error}" for error in issue_errors)
+            prepared.append((reference, fields))
+        return prepared, errors
+
+    def create_tickets(self, field_list, on_result=None):
+        """
+        Create many tickets through Jira's bulk create endpoint.
+
+        Tickets are sent in chunks of 'bulk_create_chunk' (default 50), without reloading
+        the created issues. When the server has no bulk create endpoint, tickets are
+        created one by one by 'bulk_workers' concurrent workers.
+
+        Args:
+            field_list (list): Fields of every ticket.
+            on_result (callable, optional): Called with the results of every chunk.
+
+        Returns:
+            list: Results in the order of field_list, dictionaries with 'key' or 'error'.
+        """
+        chunk_size = self.app_options.get("bulk_create_chunk", 50)
+        bulk_supported = True
         results = []
+        for start in range(0, len(field_list), chunk_size):
+            chunk = field_list[start:start + chunk_size]
+            chunk_results = None
+            if bulk_supported:
+                try:
+                    chunk_results = [
+                        {'key': created['issue'].key} if created['status'] == 'Success' else {'error': self.describe_errors(created['error'])}
+                        for created in self.jira.create_issues(chunk, prefetch=False)
+                    ]
+                except JIRAError as e:
+                    if e.status_code not in BULK_CREATE_UNSUPPORTED:
+                        # The chunk may have been partly created, so it is not sent again.
+                        chunk_results = [{'error': str(e)} for _ in chunk]
+                    else:
+                        bulk_supported = False
+                except Exception as e:
+                    chunk_results = [{'error': str(e)} for _ in chunk]
+            if chunk_results is None:
+                chunk_results = self.create_concurrently(chunk)
+            if on_result:
+                on_result(chunk_results)
+            results.extend(chunk_results)
+        return results
+
+    def create_concurrently(self, field_list):
+        """
+        Create tickets one by one with concurrent workers, paced by the request scheduler.
 
+        Args:
+            field_list (list): Fields of every ticket.
+
+        Returns:
+            list: Results in the order of field_list, dictionaries with 'key' or 'error'.
+        """
+        def create(fields):
+            try:
+                return {'key': self.jira.create_issue(fields=fields, prefetch=False).key}
+            except Exception as e:
+                return {'error': str(e)}
+
+        workers = max(1, min(self.app_options.get("bulk_workers", 8), len(field_list)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(create, field_list))
+
+    @staticmethod
+    def describe_errors(errors):
+        """
+        Join the field errors Jira returned for a ticket into one message.
+        """
+        if isinstance(errors, dict):
+            return "; ".join(f"{field}: {message}" for field, message in errors.items())
+        return str(errors)
+
+    def create_tickets_from_manifest(self, manifest_path):
+        """
+        Create every ticket of a YAML or CSV manifest.
+
+        The whole manifest is validated against the cached create metadata first, and
+        nothing is created if any issue is invalid.
+
+        Args:
+            manifest_path (str): Path of the manifest, see manifest.load_manifest.
+
+        Returns:
+            dict: 'keys', the created keys by issue reference ('id' in the manifest, or the
+                row number), and 'failed', the errors of the tickets that were not created
+                by reference; or a dictionary with an 'error' message if nothing was created.
+        """
+        from jiraclui.manifest import load_manifest
+        prompt_color = self.helper.get_color("prompts")
         try:
-            current_user_name = self.jira.current_user()
-
-            for project in project_names:
-                jql_query = f'project={project} AND (created >= startOfDay() OR updated >= startOfDay()) AND (assignee="{current_user_name}" OR reporter="{current_user_name}")'
-
-                issues = self.jira.search_issues(jql_query, maxResults=100, fields='key,project,summary,assignee,reporter,status')
-
-                for issue in issues:
-                    result = {
-                        'ticketNo': issue.key,
-                        'project': issue.fields.project.name,
-                        'title': issue.fields.summary,
-                        'assignee': issue.fields.assignee.displayName if issue.fields.assignee else None,
-                        'reporter': issue.fields.reporter.displayName if issue.fields.reporter else None,
-                        'status': issue.fields.status.name
-                    }
-                    results.append(result)
-            return results
-        except Exception as e:
-            self.console.print(f"[bold red]Error retrieving opened or updated tickets: {str(e)}[/bold red]")
-            return []
+            prepared, errors = self.prepare_manifest(load_manifest(manifest_path))
+        except (OSError, ValueError, JIRAError) as e:
+            self.console.print(f"[bold red]Error reading manifest: {str(e)}[/bold red]")
+            return {'error': str(e)}
+        if errors:
+            for error in errors:
+                self.console.print(f"[bold red]{error}[/bold red]")
+            return {'error': f"{len(errors)} errors in {manifest_path}, no ticket created"}
+
+        progress = {'done': 0}
+
+        def print_progress(chunk_results):
+            progress['done'] += len(chunk_results)
+            self.console.print(f"[{prompt_color}]{progress['done']}/{len(prepared)} tickets processed[/{prompt_color}]")
+
+        results = self.create_tickets([fields for _, fields in prepared], print_progress)
+        mapping = {'keys': {}, 'failed': {}}
+        for (reference, _), result in zip(prepared, results):
+            if 'key' in result:
+                mapping['keys'][reference] = result['key']
+            else:
+                mapping['failed'][reference] = result['error']
+                self.console.print(f"[bold red]{reference}: {result['error']}[/bold red]")
+        self.console.print(f"[{prompt_color}]{len(mapping['keys'])} of {len(prepared)} tickets created.[/{prompt_color}]")
+        return mapping
 
     def create_ticket_interactively(self):
         """
         Create a new Jira ticket with an interactive CLI form using questionary.
 
         Returns:
-            dict: Dictionary containing the details of the created ticket.
+            Ticket: The created ticket, or a dictionary with an 'error' message.
         """
+        from questionary import prompt
         try:
             prompt_color = self.helper.get_color("prompts")
-            project_key = input("Enter the project key: ")
+            project_key = input("Enter the project key: ").strip().upper()
 
-            project = self.jira.project(project_key)
-            issue_types = [issue_type.name for issue_type in project.issueTypes]
+            issue_types = {issue_type['name']: issue_type for issue_type in self.get_issue_types(project_key).values()}
 
             selected_issue_type = prompt({
                 'type': 'select',
                 'name': 'issue_type',
                 'message': 'Select issue type:',
-                'choices': issue_types,
+                'choices': list(issue_types),
             })['issue_type']
 
             mandatory_fields = [
@@ -183,20 +951,14 @@ class JiraClient:
 
             issue_dict = {
                 'project': {'key': project_key},
-                'issuetype': {'name': selected_issue_type},
+                'issuetype': {'id': issue_types[selected_issue_type]['id']},
                 'summary': answers['summary'],
                 'description': answers['description'],
             }
             new_issue = self.jira.create_issue(fields=issue_dict)
 
-            content = {
-                'ticketNo': new_issue.key,
-                'project': new_issue.fields.project.name,
-                'title': new_issue.fields.summary,
-                'assignee': new_issue.fields.assignee.displayName if new_issue.fields.assignee else None,
-                'reporter': new_issue.fields.reporter.displayName if new_issue.fields.reporter else None,
-                'status': new_issue.fields.status.name
-            }
+            content = Ticket.from_issue(new_issue)
+            self.connection.detail_cache.put(new_issue.key, content)
 
             self.console.print(f"[{prompt_color}]Ticket {new_issue.key} created successfully![/{prompt_color}]")
             return content
@@ -1,7 +1,12 @@
+import time
+from requests.exceptions import RequestException
 from rich.console import Console
+from jiraclui.auto_refresh import AutoRefresher
 from jiraclui.jira_client import JiraClient
 from jiraclui.jira_board import JiraBoard
 from jiraclui.helper import Helper
+from jiraclui.offline import UNREACHABLE_ERRORS, OfflineClient
+from jiraclui.ticket_store import TicketStore
 
 class JiraBoardManager:
     def __init__(self, project_names, users, api_url, api_token, app_options):
@@ -20,11 +25,174 @@ class JiraBoardManager:
         self.api_url = api_url
         self.api_token = api_token
         self.app_options = app_options
-        self.jira_client = JiraClient(api_url, api_token, app_options)
-        self.tickets_data = self.jira_client.get_jira_tickets(project_names, users)
-        self.jira_board = JiraBoard(self.tickets_data, api_url, api_token, project_names, users, self.filter_mode, self.app_options)
         self.console = Console()
         self.helper = Helper(self.app_options)
+        self.ticket_store = self.open_ticket_store()
+        self.offline = False
+        self.jira_board = None
+        self.jira_client = self.connect()
+        self.showing_all_tickets = True
+        self.load_board()
+        self.auto_refresher = self.start_auto_refresh()
+
+    def connect(self):
+        """
+        Creates the Jira client, or the offline client with the 'offline' app option or
+        when Jira cannot be reached.
+
+        Returns:
+        - JiraClient: The client, or an OfflineClient serving the local ticket store.
+        """
+        if self.app_options.get("offline"):
+            return self.go_offline()
+        try:
+            return JiraClient(self.api_url, self.api_token, self.app_options)
+        except UNREACHABLE_ERRORS as e:
+            return self.go_offline(e)
+
+    def go_offline(self, error=None):
+        """
+        Switches to offline mode, serving the board from the local ticket store.
+
+        Parameters:
+        - error (Exception): The error that made Jira unreachable, if any.
+
+        Returns:
+        - OfflineClient: The offline client.
+        """
+        if not self.ticket_store:
+            self.console.print("[bold red]Offline mode needs the local ticket store, enable the 'ticket_store' app option.[/bold red]")
+            exit(1)
+        if error is not None:
+            self.console.print(f"[bold red]Jira is unreachable, showing offline data: {error}[/bold red]")
+        self.offline = True
+        return OfflineClient(self.ticket_store, self.api_url, self.api_token, self.app_options)
+
+    def load_board(self):
+        """
+        Creates the board and loads it progressively, falling back to offline mode if Jira
+        cannot be reached while loading.
+        """
+        self.last_poll = time.time()
+        self.show_tickets([], render=False)
+        try:
+            cached_data = None if self.offline else self.stored_tickets()
+            with self.jira_client.track('refresh'):
+                self.tickets_data = self.jira_board.load_progressively(self.load_tickets, cached_data)
+        except UNREACHABLE_ERRORS as e:
+            if self.offline:
+                raise
+            self.jira_client = self.go_offline(e)
+            self.show_tickets([], render=False)
+            self.tickets_data = self.jira_board.load_progressively(self.load_tickets)
+
+    def show_tickets(self, data, render=True):
+        """
+        Shows tickets on the board, on the current client and captioned with the age of the
+        data when offline. The board is created once and then reused, so that its view keeps
+        the rendered rows between refreshes and views.
+
+        Parameters:
+        - data (list): A list of Ticket records.
+        - render (bool): False to skip printing the board.
+        """
+        caption = self.jira_client.caption(self.project_names, self.users) if self.offline else None
+        if self.jira_board is None:
+            self.jira_board = JiraBoard(data, self.api_url, self.api_token, self.project_names, self.users, self.filter_mode,
+                                        self.app_options, render=render, ticket_store=self.ticket_store,
+                                        jira_client=self.jira_client, caption=caption)
+            return
+        self.jira_board.set_data(data, self.jira_client, caption)
+        self.jira_board.filter_mode = self.filter_mode
+        if render:
+            self.jira_board.build_table()
+
+    def start_auto_refresh(self):
+        """
+        Starts the background auto refresh worker if the 'auto_refresh_seconds' app option is set.
+
+        Returns:
+        - AutoRefresher: The running worker, or None if auto refresh is disabled.
+        """
+        interval = self.app_options.get("auto_refresh_seconds", 0)
+        if not interval or self.offline:
+            return None
+        jitter = self.app_options.get("auto_refresh_jitter", interval / 10)
+        auto_refresher = AutoRefresher(self.poll_changes, self.on_tickets_changed, interval, jitter)
+        auto_refresher.start()
+        return auto_refresher
+
+    def poll_changes(self):
+        """
+        Fetches the tickets updated since the previous poll. Runs on the auto refresh worker.
+
+        Returns:
+        - list: The changed Ticket records, empty while another view than 'Get all' is shown.
+        """
+        if not self.showing_all_tickets:
+            return []
+        # The high-water mark only moves once the poll succeeded, so changes made during an outage are picked up later.
+        polled_at = time.time()
+        tickets = self.jira_client.get_updated_tickets(self.project_names, self.users, self.last_poll)
+        self.last_poll = polled_at
+        return tickets
+
+    def on_tickets_changed(self, tickets):
+        """
+        Merges polled tickets into the board and redraws it if anything changed and the
+        menu is waiting for input. Runs on the auto refresh worker.
+
+        Parameters:
+        - tickets (list): The changed Ticket records.
+        """
+        if not self.showing_all_tickets or not self.jira_board.merge_tickets(tickets):
+            return
+        if not self.filter_mode:
+            self.jira_board.display_board()
+            self.console.print("[bold]Menu:[/bold]")
+            self.helper.print_menu()
+            self.console.print("Enter your choice: ", end="")
+
+    def open_ticket_store(self):
+        """
+        Opens the local ticket store of the configured Jira server.
+
+        Returns:
+        - TicketStore: The ticket store, or None if disabled with the 'ticket_store' app option.
+        """
+        if not self.app_options.get("ticket_store", True):
+            return None
+        return TicketStore(TicketStore.path_for(self.helper.get_cache_dir(), self.api_url))
+
+    def load_tickets(self, on_page=None):
+        """
+        Loads the board tickets, through a delta sync of the local ticket store when enabled.
+
+        Parameters:
+        - on_page (callable): Optional progress callback receiving every page as it arrives.
+
+        Returns:
+        - list: A list of Ticket records.
+        """
+        if self.ticket_store:
+            return self.jira_client.sync_jira_tickets(self.ticket_store, self.project_names, self.users, on_page)
+        return self.jira_client.get_jira_tickets(self.project_names, self.users, on_page)
+
+    def stored_tickets(self):
+        """
+        Returns the tickets of the last sync, shown while the board is refreshed.
+
+        Returns:
+        - list: A list of Ticket records, empty without a ticket store.
+        """
+        if not self.ticket_store:
+            return []
+        max_table_entry = self.app_options.get("max_table_entry", 100)
+        return [
+            ticket
+            for project in self.project_names
+            for ticket in self.ticket_store.get_tickets(TicketStore.scope_for(project, self.users), max_table_entry)
+        ]
 
     def run(self):
         """
@@ -44,12 +212,18 @@ class JiraBoardManager:
         based on a specified value. Updates the board accordingly.
         """
         self.console.print("\nFilter Mode:")
-        filter_text =  self.console.input("Enter the value to filter (type '0' to exit filter mode): ").strip()
+        filter_text =  self.console.input("Enter the value to filter, prefix with '+' to refine, '>' or '<' to page, "
+                                          "'!' and a status to move the filtered tickets (type '0' to exit filter mode): ").strip()
 
         if filter_text == '0':
             self.filter_mode = False
             self.jira_board.update_filter_text("")
-            self.jira_board.display_board()
+        elif filter_text == '>':
+            self.jira_board.next_page()
+        elif filter_text == '<':
+            self.jira_board.previous_page()
+        elif filter_text.startswith('!'):
+            self.bulk_update(self.jira_board.filtered_data, filter_text[1:].strip())
         else:
             self.jira_board.update_filter_text(filter_text)
             self.jira_board.auto_show_single_ticket()
@@ -72,6 +246,9 @@ class JiraBoardManager:
             '4': self.display_ticket_details,
             '5': self.update_ticket_status,
             '6': self.create_ticket,
+            '7': self.jira_board.next_page,
+            '8': self.jira_board.previous_page,
+            '9': self.jump_to_ticket,
             'x': self.exit_program,
             'a': self.get_all_tickets,
             't': self.get_today_tickets,
@@ -79,6 +256,9 @@ class JiraBoardManager:
             'd': self.display_ticket_details,
             'u': self.update_ticket_status,
             'c': self.create_ticket,
+            'n': self.jira_board.next_page,
+            'p': self.jira_board.previous_page,
+            'j': self.jump_to_ticket,
         }
 
         selected_action = menu_actions.get(choice, self.default_action)
@@ -90,6 +270,8 @@ class JiraBoardManager:
 
         This function is associated with the 'Exit' menu option (choice '0').
         """
+        if self.auto_refresher:
+            self.auto_refresher.stop()
         self.console.clear()
         exit(0)
 
@@ -99,9 +281,8 @@ class JiraBoardManager:
 
         This function is associated with the 'Get all' menu option (choice '1').
         """
-        self.tickets_data = self.jira_client.get_jira_tickets(self.project_names, self.users)
-        self.jira_board = JiraBoard(self.tickets_data, self.api_url, self.api_token, self.project_names, self.users, self.filter_mode, self.app_options)
-        self.jira_board.update_filter_text("")
+        self.showing_all_tickets = True
+        self.load_board()
 
     def get_today_tickets(self):
         """
@@ -109,9 +290,17 @@ class JiraBoardManager:
 
         This function is associated with the 'Get Today Tickets' menu option (choice '2').
         """
-        data = self.jira_client.get_opened_or_updated_tickets_today(self.project_names)
-        self.console.clear()
-        self.jira_board = JiraBoard(data, self.api_url, self.api_token, self.project_names, self.users, self.filter_mode, self.app_options)
+        try:
+            with self.jira_client.track('today'):
+                data = self.jira_client.get_opened_or_updated_tickets_today(self.project_names)
+        except RequestException as e:
+            data = {'error': f"Error retrieving opened or updated tickets: {e}"}
+        if isinstance(data, dict):
+            self.jira_board.display_board()
+            self.console.print(f"[bold red]{data['error']}[/bold red]")
+            return
+        self.showing_all_tickets = False
+        self.show_tickets(data)
 
     def enter_filter_mode(self):
         """
@@ -128,7 +317,19 @@ class JiraBoardManager:
         This function is associated with the 'Display Ticket Details' menu option (choice '4').
         """
         ticket_number = self.console.input("Enter the ticket number: ").strip()
-        self.jira_board.display_ticket_details(ticket_number, self.filter_mode)
+        with self.jira_client.track('details'):
+            self.jira_board.display_ticket_details(ticket_number, self.filter_mode)
+
+    def jump_to_ticket(self):
+        """
+        Shows the board page holding a ticket, with the ticket highlighted.
+
+        This function is associated with the 'Jump to Ticket' menu option (choice '9').
+        """
+        ticket_number = self.console.input("Enter the ticket number to jump to: ").strip()
+        if not self.jira_board.jump_to_key(ticket_number):
+            self.jira_board.display_board()
+            self.console.print(f"[bold red]{ticket_number} is not on the board.[/bold red]")
 
     def update_ticket_status(self):
         """
@@ -136,13 +337,51 @@ class JiraBoardManager:
 
         This function is associated with the 'Update Ticket Status' menu option (choice '5').
         """
-        ticket_number_to_update = self.console.input("Enter the ticket number to update: ").strip()
-        ticket_details = self.jira_client.get_ticket_details(ticket_number_to_update)
+        ticket_number_to_update = self.console.input(
+            "Enter the ticket number to update, several separated by commas, or '*' for every ticket on the board: ").strip()
+        if ticket_number_to_update == '*':
+            self.bulk_update(self.jira_board.filtered_data)
+            return
+        if ',' in ticket_number_to_update:
+            with self.jira_client.track('bulk'):
+                tickets, missing = self.jira_client.get_tickets(ticket_number_to_update.split(','))
+            self.bulk_update(tickets, missing=missing)
+            return
+        with self.jira_client.track('update'):
+            ticket_details = self.jira_client.get_ticket_details(ticket_number_to_update)
+            updated_ticket = None if isinstance(ticket_details, dict) else self.jira_client.update_ticket_status(ticket_details)
 
-        if 'error' in ticket_details:
+        if isinstance(ticket_details, dict):
             self.console.print(f"Error: {ticket_details['error']}")
-        else:
-            self.jira_client.update_ticket_status(ticket_details)
+        elif updated_ticket:
+            self.jira_board.upsert_ticket(updated_ticket)
+
+    def bulk_update(self, tickets, target_status=None, missing=()):
+        """
+        Moves many tickets to a status concurrently, after confirmation, and shows the updated board.
+
+        Parameters:
+        - tickets (list): The Ticket records to update, e.g. the filtered board.
+        - target_status (str): Transition or status name, asked for if not given.
+        - missing (list): Keys that were asked for but not found, reported as failures.
+        """
+        if not isinstance(tickets, list) or not tickets and not missing:
+            self.console.print("[bold red]No tickets to update.[/bold red]")
+            return
+        target_status = target_status or self.console.input("Enter the status or transition name to apply: ").strip()
+        if not target_status:
+            return
+        confirm = self.console.input(f"Move {len(tickets)} tickets to '{target_status}'? Type 'y' to proceed: ").strip().lower()
+        if confirm != 'y':
+            self.jira_board.display_board()
+            return
+        with self.jira_client.track('bulk'):
+            updated_tickets = self.jira_client.bulk_update_status(tickets, target_status, missing)
+        if isinstance(self.jira_board.original_data, list):
+            board_keys = {ticket.ticket_no for ticket in self.jira_board.original_data}
+            self.jira_board.merge_tickets([ticket for ticket in updated_tickets if ticket.ticket_no in board_keys])
+        self.console.input("Press Enter to show the board: ")
+        self.jira_board.display_board()
 
     def create_ticket(self):
         """
@@ -150,11 +389,12 @@ class JiraBoardManager:
 
         This function is associated with the 'Create Ticket' menu option (choice '6').
         """
-        ticket_details = self.jira_client.create_ticket_interactively()
-        if 'error' in ticket_details:
+        with self.jira_client.track('create'):
+            ticket_details = self.jira_client.create_ticket_interactively()
+        if isinstance(ticket_details, dict):
             self.console.print(f"Error: {ticket_details['error']}")
         else:
-            self.get_all_tickets()
+            self.jira_board.upsert_ticket(ticket_details)
     def default_action(self):
         """
         Clears the console and displays the Jira board.
@@ -2,8 +2,6 @@ import argparse
 import logging
 import sys
 import yaml
-from jiraclui.jira_handler import JiraBoardManager
-from jiraclui import __version__
 from jiraclui.cli_app import Cli
 from jiraclui.logger import get_logger
 logger = get_logger(__name__)
@@ -20,10 +18,21 @@ def load_config(config_file):
     return config
 
 
+class VersionAction(argparse.Action):
+    """Print the version, which is only looked up when --version is given"""
+    def __init__(self, option_strings, dest=argparse.SUPPRESS, default=argparse.SUPPRESS, help=None):
+        super().__init__(option_strings=option_strings, dest=dest, default=default, nargs=0, help=help)
+
+    def __call__(self, parser, namespace, values, option_string=None):
+        from jiraclui import __version__
+        print(f"jiraclui {__version__}")
+        parser.exit()
+
+
 def parse_args(args):
     """Parse command line parameters"""
     parser = argparse.ArgumentParser(description="Jira CLI")
-    parser.add_argument("--version", action="version", version=f"jiraclui {__version__}")
+    parser.add_argument("--version", action=VersionAction, help="show program's version number and exit")
     parser.add_argument("-c", "--config", dest="config_file", help="Config YAML file")
     parser.add_argument("--generate-config", dest="generate_config", action="store_true",
                         help="Generate a sample config.yaml file")
@@ -31,10 +40,38 @@ def parse_args(args):
                         help="Search for a specific issue by issue number")
     parser.add_argument("-cr", "--create", dest="create_issue", action="store_true",
                         help="create new issue")
+    parser.add_argument("--create-from", dest="create_from", metavar="FILE",
+                        help="create every issue of a YAML or CSV manifest and print the created keys as JSON")
     parser.add_argument("-u", "--update", dest="update_issue",
-                        help="update issue status of specified issue")
+                        help="update issue status of specified issue, or of several comma separated issues with --to")
+    parser.add_argument("--jql", dest="update_jql",
+                        help="with --to, update the status of every issue matching this JQL query")
+    parser.add_argument("--to", dest="target_status",
+                        help="with -u or --jql, move the issues to this status or transition name without prompting")
+    parser.add_argument("--export", dest="export_format", choices=("jsonl", "csv", "columnar"),
+                        help="stream the issues of the board's projects, or of --query, in this format and exit")
+    parser.add_argument("--query", dest="export_query", metavar="JQL",
+                        help="with --export, export the issues matching this JQL query")
+    parser.add_argument("--fields", dest="export_fields",
+                        help="with --export, comma separated fields to export, 'key' or Jira field ids")
+    parser.add_argument("-o", "--output", dest="export_output", metavar="FILE",
+                        help="with --export, write to FILE instead of stdout")
     parser.add_argument("-t", "--today", dest="today_issues", action="store_true",
                         help="show today issues I was involved")
+    parser.add_argument("--refresh-session", dest="refresh_session", action="store_true",
+                        help="ignore cached server info and current user and fetch them again")
+    parser.add_argument("--offline", dest="offline", action="store_true",
+                        help="serve the board, details and today issues from the last local snapshot without contacting Jira")
+    parser.add_argument("--record", dest="record", metavar="CASSETTE",
+                        help="record every Jira response into this cassette file")
+    parser.add_argument("--replay", dest="replay", metavar="CASSETTE",
+                        help="answer every Jira request from this cassette file instead of the network")
+    parser.add_argument("--replay-latency", dest="replay_latency", metavar="MS",
+                        help="with --replay, delay every response by MS milliseconds, or 'recorded'")
+    parser.add_argument("--count-requests", dest="count_requests", action="store_true",
+                        help="print the number of Jira requests per command on exit")
+    parser.add_argument("--profile", dest="profile", nargs="?", const="-", metavar="FILE",
+                        help="time every Jira request and phase, and print a summary on exit or write it as JSON to FILE")
     parser.add_argument("-v", "--verbose", dest="loglevel", help="set loglevel to INFO",
                         action="store_const", const=logging.INFO)
     parser.add_argument("-vv", "--very-verbose", dest="loglevel", help="set loglevel to DEBUG",
@@ -60,6 +97,16 @@ def main(args):
     api_url = config.get('api_url', '') if config else ''
     api_token = config.get('api_token', '') if config else ''
     app_options = config.get('app_options', {}) if config else {}
+    if args.refresh_session:
+        app_options['refresh_session'] = True
+    if args.offline:
+        app_options['offline'] = True
+    for option in ('record', 'replay', 'replay_latency', 'count_requests', 'profile'):
+        if getattr(args, option):
+            app_options[option] = getattr(args, option)
+    if app_options.get('profile'):
+        from jiraclui.profiler import PROFILER
+        PROFILER.enable(app_options['profile'] if isinstance(app_options['profile'], str) else None)
 
     if not project_names or not api_url or not api_token:
         logger.error("Missing essential parameters. Please provide all required parameters.")
@@ -68,15 +115,26 @@ def main(args):
     if args.issue_number:
         Cli.handle_issue_number(args.issue_number, api_url, api_token, project_names, users, app_options)
 
+    if args.update_jql or (args.update_issue and ',' in args.update_issue):
+        Cli.handle_bulk_update(args.update_issue, args.update_jql, args.target_status, api_url, api_token, app_options)
+
     if args.update_issue:
-        Cli.handle_update_issue(args.update_issue, api_url, api_token, app_options)
+        Cli.handle_update_issue(args.update_issue, api_url, api_token, app_options, args.target_status)
 
     if args.today_issues:
         Cli.handle_today_issues(project_names, api_url, api_token, users, app_options)
 
+    if args.export_format:
+        Cli.handle_export(args.export_format, args.export_query, args.export_fields, args.export_output,
+                          project_names, users, api_url, api_token, app_options)
+
+    if args.create_from:
+        Cli.handle_create_from(args.create_from, api_url, api_token, app_options)
+
     if args.create_issue:
         Cli.handle_create_issue(api_url, api_token, app_options)
 
+    from jiraclui.jira_handler import JiraBoardManager
     jira_board_manager = JiraBoardManager(project_names, users, api_url, api_token, app_options)
     jira_board_manager.run()
 
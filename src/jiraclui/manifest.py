@@ -0,0 +1,156 @@
+import csv
+import datetime
+import os
+import re
+import yaml
+
+# Manifest keys that are not Jira fields: the reference of an issue in the key mapping, its project and type.
+REFERENCE_KEYS = ('id', 'ref')
+PROJECT_KEY = 'project'
+TYPE_KEYS = ('type', 'issuetype')
+# Manifest spellings of Jira field ids.
+FIELD_ALIASES = {'fix_versions': 'fixVersions', 'due': 'duedate', 'due_date': 'duedate'}
+# Schema types whose values are referenced by name.
+NAMED_TYPES = ('priority', 'version', 'component', 'resolution', 'securitylevel')
+LIST_SEPARATOR = re.compile(r'\s*[,;]\s*')
+
+
+def load_manifest(path):
+    """
+    Load the issues of a YAML or CSV manifest.
+
+    A YAML manifest is a list of issues, or a mapping with 'issues' and optional
+    'defaults' applied to every issue. A CSV manifest has one issue per row, named
+    by its header; empty cells are left out.
+
+    Args:
+        path (str): Path of the manifest, '.csv' for CSV and YAML otherwise.
+
+    Returns:
+        list: Issues as dictionaries of manifest keys and values.
+
+    Raises:
+        ValueError: If the manifest is not a list of issues.
+    """
+    with open(path, 'r', encoding='utf-8', newline='') as file:
+        if os.path.splitext(path)[1].lower() == '.csv':
+            return [{key.strip(): value for key, value in row.items() if key and value not in (None, '')}
+                    for row in csv.DictReader(file)]
+        manifest = yaml.safe_load(file)
+    defaults = {}
+    if isinstance(manifest, dict):
+        defaults = manifest.get('defaults') or {}
+        manifest = manifest.get('issues')
+    if not isinstance(manifest, list) or not all(isinstance(issue, dict) for issue in manifest):
+        raise ValueError(f"{path} must hold a list of issues, or 'issues' and 'defaults'")
+    return [{**defaults, **issue} for issue in manifest]
+
+
+def issue_reference(issue, number):
+    """
+    Return the reference of a manifest issue in the key mapping: its 'id', or its row number.
+    """
+    for key in REFERENCE_KEYS:
+        if issue.get(key) not in (None, ''):
+            return str(issue[key])
+    return str(number)
+
+
+def issue_type_name(issue):
+    """
+    Return the issue type name of a manifest issue, or None.
+    """
+    for key in TYPE_KEYS:
+        if issue.get(key):
+            return str(issue[key])
+    return None
+
+
+def resolve_field(key, fields):
+    """
+    Find the Jira field id of a manifest key, given as a field id or a field name, ignoring case.
+
+    Args:
+        key (str): Manifest key.
+        fields (dict): Field metadata of the issue type by field id.
+
+    Returns:
+        str: The field id, or None.
+    """
+    key = FIELD_ALIASES.get(key.lower(), key)
+    if key in fields:
+        return key
+    for field_id, field in fields.items():
+        if field_id.lower() == key.lower() or (field['name'] or '').lower() == key.lower():
+            return field_id
+    return None
+
+
+def format_value(value, kind, cloud):
+    """
+    Shape a manifest value the way Jira expects a field of a schema type.
+
+    YAML reads unquoted dates and timestamps as date and datetime objects, they are
+    sent as ISO strings.
+    """
+    if isinstance(value, datetime.datetime):
+        return value.strftime('%Y-%m-%dT%H:%M:%S.000%z')
+    if isinstance(value, datetime.date):
+        return value.isoformat()
+    if kind == 'user':
+        return {'accountId': value} if cloud else {'name': value}
+    if kind == 'option':
+        return {'value': value}
+    if kind in NAMED_TYPES:
+        return {'name': value}
+    if kind == 'issuelink':
+        return {'key': value}
+    if kind == 'number':
+        return float(value)
+    return value
+
+
+def build_fields(issue, project_key, issue_type, cloud=False):
+    """
+    Validate a manifest issue against the create metadata of its issue type and build its Jira fields.
+
+    Args:
+        issue (dict): Manifest issue.
+        project_key (str): Project key.
+        issue_type (dict): Issue type metadata with 'id', 'name' and 'fields' by field id.
+        cloud (bool): True for Jira Cloud, where users are given by account id.
+
+    Returns:
+        tuple: The fields to create the issue with, and a list of error messages.
+    """
+    fields = {'project': {'key': project_key}, 'issuetype': {'id': issue_type['id']}}
+    errors = []
+    for key, value in issue.items():
+        if key in REFERENCE_KEYS or key == PROJECT_KEY or key in TYPE_KEYS or value in (None, ''):
+            continue
+        field_id = resolve_field(key, issue_type['fields'])
+        if field_id is None:
+            errors.append(f"'{key}' cannot be set on {project_key} {issue_type['name']} issues")
+            continue
+        field = issue_type['fields'][field_id]
+        values = value if isinstance(value, list) else [value]
+        if field['type'] == 'array' and isinstance(value, str):
+            values = LIST_SEPARATOR.split(value.strip())
+        if field['allowed']:
+            # Allowed values are matched ignoring case and sent as Jira spells them.
+            allowed = {str(name).lower(): name for name in field['allowed'] if name is not None}
+            for single in values:
+                if str(single).lower() not in allowed:
+                    errors.append(f"'{single}' is not a valid {field['name']}, use one of: {', '.join(map(str, field['allowed']))}")
+            values = [allowed.get(str(single).lower(), single) for single in values]
+        try:
+            if field['type'] == 'array':
+                fields[field_id] = [format_value(single, field['items'], cloud) for single in values]
+            else:
+                fields[field_id] = format_value(values[0] if len(values) == 1 else value, field['type'], cloud)
+        except ValueError:
+            errors.append(f"'{value}' is not a valid {field['name']}")
+    for field_id, field in issue_type['fields'].items():
+        if field['required'] and field_id not in fields:
+            errors.append(f"missing required field '{field['name']}'")
+    return fields, errors
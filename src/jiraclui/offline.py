@@ -0,0 +1,237 @@
+import contextlib
+import time
+import requests
+from rich.console import Console
+from jiraclui.helper import Helper
+from jiraclui.session_cache import SessionCache
+from jiraclui.ticket_store import TicketStore
+
+# Errors meaning Jira cannot be reached, after which the board falls back to offline mode.
+UNREACHABLE_ERRORS = (requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+
+
+def describe_age(seconds):
+    """
+    Describe an age in seconds the way the board shows it.
+
+    Args:
+        seconds (float): Age in seconds.
+
+    Returns:
+        str: E.g. 'just now', '5 minutes ago' or '2 days ago'.
+    """
+    for unit, unit_seconds in (('day', 86400), ('hour', 3600), ('minute', 60)):
+        count = int(seconds // unit_seconds)
+        if count:
+            return f"{count} {unit}{'s' if count > 1 else ''} ago"
+    return "just now"
+
+
+class OfflineClient:
+    """
+    Read-only stand-in for JiraClient serving the local ticket store snapshot.
+
+    It is used with --offline, or when Jira cannot be reached at startup. The board,
+    filter, details and today views work from the tickets of the last sync; writes
+    are refused. No request is ever sent to Jira.
+    """
+
+    def __init__(self, ticket_store, server_url, api_key, app_options):
+        """
+        Initialize OfflineClient.
+
+        Args:
+            ticket_store (TicketStore): Local ticket store holding the snapshot.
+            server_url (str): Jira server URL.
+            api_key (str): API key, only used to find the cached current user.
+            app_options (dict): Application options.
+        """
+        self.app_options = app_options
+        self.helper = Helper(app_options)
+        self.console = Console()
+        self.ticket_store = ticket_store
+        # Any cached identity is better than none while offline, so the cache TTL is ignored.
+        session_facts = SessionCache(self.helper.get_cache_dir(), server_url, api_key, float('inf')).load()
+        self.myself_name = (session_facts.get('myself') or {}).get('displayName')
+
+    @classmethod
+    def open(cls, server_url, api_key, app_options):
+        """
+        Create an offline client on the ticket store of a Jira server.
+
+        Args:
+            server_url (str): Jira server URL.
+            api_key (str): API key for authentication.
+            app_options (dict): Application options.
+
+        Returns:
+            OfflineClient: The client.
+        """
+        cache_dir = Helper(app_options).get_cache_dir()
+        return cls(TicketStore(TicketStore.path_for(cache_dir, server_url)), server_url, api_key, app_options)
+
+    def track(self, command):
+        """
+        Return a no-op context manager, as no request is ever sent offline.
+        """
+        return contextlib.nullcontext()
+
+    def is_cloud(self):
+        """
+        Return False, as Jira is never searched offline.
+        """
+        return False
+
+    def get_jira_tickets(self, project_names, users, on_page=None):
+        """
+        Return the stored board tickets, as of the last sync.
+
+        Args:
+            project_names (list): List of project names.
+            users (list): List of user names or email addresses.
+            on_page (callable, optional): Progress callback, called once with every ticket.
+
+        Returns:
+            list: List of Ticket records.
+        """
+        max_table_entry = self.app_options.get("max_table_entry", 100)
+        tickets = [
+            ticket
+            for project in project_names
+            for ticket in self.ticket_store.get_tickets(TicketStore.scope_for(project, users), max_table_entry)
+        ]
+        if on_page:
+            on_page(None, tickets, True)
+        return tickets
+
+    def sync_jira_tickets(self, ticket_store, project_names, users, on_page=None):
+        """
+        Return the stored board tickets without syncing, see get_jira_tickets.
+        """
+        return self.get_jira_tickets(project_names, users, on_page)
+
+    def get_updated_tickets(self, project_names, users, since):
+        """
+        Return no changes, as nothing can be polled offline.
+        """
+        return []
+
+    def search_tickets(self, project_names, users, condition, limit=None):
+        """
+        Return no tickets, as Jira cannot be searched offline.
+        """
+        return []
+
+    def caption(self, project_names, users):
+        """
+        Describe how old the snapshot shown on the board is.
+
+        Args:
+            project_names (list): List of project names.
+            users (list): List of user names or email addresses.
+
+        Returns:
+            str: Caption for the board table.
+        """
+        last_sync = self.ticket_store.last_synced([TicketStore.scope_for(project, users) for project in project_names])
+        if last_sync is None:
+            return "Offline: some projects were never synced"
+        synced_at = time.strftime('%Y-%m-%d %H:%M', time.localtime(last_sync))
+        return f"Offline: data from {synced_at} ({describe_age(time.time() - last_sync)})"
+
+    def current_user_name(self):
+        """
+        Return the display name of the current user cached by a previous online run.
+
+        Returns:
+            str: The display name, or None if unknown.
+        """
+        return self.myself_name
+
+    def get_ticket_details(self, ticket_no):
+        """
+        Return the stored copy of a ticket. Descriptions are not part of the snapshot.
+
+        Args:
+            ticket_no (str): Jira ticket number.
+
+        Returns:
+            Ticket: The ticket, or a dictionary with an 'error' message.
+        """
+        ticket_no = ticket_no.strip().upper()
+        ticket = self.ticket_store.get_ticket(ticket_no)
+        if ticket is None:
+            return {'error': f"{ticket_no} is not in the offline snapshot"}
+        return ticket
+
+    def update_ticket_status(self, ticket_details, target_status=None):
+        """
+        Refuse to update a ticket while offline.
+
+        Returns:
+            None: The ticket is never updated.
+        """
+        self.console.print("[bold red]Offline: ticket status not updated.[/bold red]")
+        return None
+
+    def get_tickets(self, ticket_numbers):
+        """
+        Return the stored copies of several tickets.
+
+        Args:
+            ticket_numbers (list): Jira ticket numbers.
+
+        Returns:
+            tuple: The found Ticket records, and the keys that are not in the snapshot.
+        """
+        ticket_numbers = list(dict.fromkeys(key.strip().upper() for key in ticket_numbers if key.strip()))
+        found = {key: self.ticket_store.get_ticket(key) for key in ticket_numbers}
+        return [ticket for ticket in found.values() if ticket], [key for key, ticket in found.items() if not ticket]
+
+    def bulk_update_status(self, tickets, target_status, missing=()):
+        """
+        Refuse to update tickets while offline.
+
+        Returns:
+            list: No ticket is ever updated.
+        """
+        self.console.print("[bold red]Offline: ticket statuses not updated.[/bold red]")
+        return []
+
+    def get_opened_or_updated_tickets_today(self, project_names):
+        """
+        Return the stored tickets created or updated today that involve the current user.
+
+        The current user is only known if a previous online run cached it; otherwise
+        every stored ticket of today is returned.
+
+        Args:
+            project_names (list): List of project names.
+
+        Returns:
+            list: List of Ticket records.
+        """
+        tickets = self.ticket_store.get_tickets_since(project_names, time.strftime('%Y-%m-%d'))
+        if not self.myself_name:
+            return tickets
+        return [ticket for ticket in tickets if self.myself_name in (ticket.assignee, ticket.reporter)]
+
+    def create_tickets_from_manifest(self, manifest_path):
+        """
+        Refuse to create tickets while offline.
+
+        Returns:
+            dict: A dictionary with an 'error' message.
+        """
+        self.console.print("[bold red]Offline: tickets not created.[/bold red]")
+        return {'error': "Offline: tickets cannot be created"}
+
+    def create_ticket_interactively(self):
+        """
+        Refuse to create a ticket while offline.
+
+        Returns:
+            dict: A dictionary with an 'error' message.
+        """
+        self.console.print("[bold red]Offline: ticket not created.[/bold red]")
+        return {'error': "Offline: tickets cannot be created"}
@@ -0,0 +1,235 @@
+import atexit
+import contextlib
+import json
+import re
+import statistics
+import sys
+import threading
+import time
+from collections import defaultdict
+from urllib.parse import parse_qs, urlsplit
+
+# Path segments replaced in endpoint names, so that every issue shares one endpoint.
+ISSUE_KEY_SEGMENT = re.compile(r'/[A-Z][A-Z0-9_]*-\d+(?=/|$)')
+ID_SEGMENT = re.compile(r'(?<!/api)/\d+(?=/|$)')
+JQL_PROJECTS = re.compile(r'project\s*(?:=\s*"?([\w-]+)"?|in\s*\(([^)]*)\))', re.IGNORECASE)
+
+
+def endpoint_of(method, url):
+    """
+    Name the endpoint of a request: its method and path, with issue keys and ids replaced.
+
+    Args:
+        method (str): HTTP method.
+        url (str): Request URL.
+
+    Returns:
+        str: E.g. 'GET /rest/api/2/issue/{key}/transitions'.
+    """
+    path = ISSUE_KEY_SEGMENT.sub('/{key}', urlsplit(url).path)
+    return f"{method} {ID_SEGMENT.sub('/{id}', path)}"
+
+
+def projects_of(url, body=None):
+    """
+    Return the projects a search request selects, from the JQL of its URL or body.
+
+    Args:
+        url (str): Request URL.
+        body: Request body, for searches sent with POST.
+
+    Returns:
+        str: Comma separated project keys, or None if the request is not a project search.
+    """
+    jql = parse_qs(urlsplit(url).query).get('jql', [''])[0]
+    if not jql and body:
+        try:
+            jql = json.loads(body).get('jql', '')
+        except (ValueError, AttributeError):
+            jql = ''
+    projects = []
+    for single, several in JQL_PROJECTS.findall(jql):
+        projects.extend([single] if single else [project.strip().strip('"') for project in several.split(',')])
+    return ",".join(dict.fromkeys(projects)) or None
+
+
+def distribution(values):
+    """
+    Summarise durations in seconds as milliseconds.
+    """
+    values = sorted(values)
+    return {
+        'count': len(values),
+        'total_ms': round(sum(values) * 1000, 3),
+        'median_ms': round(statistics.median(values) * 1000, 3),
+        'p95_ms': round(values[min(len(values) - 1, int(len(values) * 0.95))] * 1000, 3),
+        'max_ms': round(values[-1] * 1000, 3),
+    }
+
+
+class Profiler:
+    """
+    Process-wide record of where jiraclui spends its time.
+
+    When enabled with --profile, the transport records every Jira request (endpoint,
+    status, latency, bytes in and out, retries, command and searched projects), and
+    phases such as connect, fetch, convert, filter and render are timed. A summary
+    is printed to stderr or exported as JSON at exit. While disabled, recording
+    costs nothing but a flag check.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.lock = threading.Lock()
+        self.requests = []
+        self.phases = defaultdict(list)
+        self.retries = defaultdict(int)
+        self.started_at = time.perf_counter()
+
+    def enable(self, export_path=None):
+        """
+        Start recording, and report at exit.
+
+        Args:
+            export_path (str, optional): File the summary is written to as JSON, '-' or None
+                to print it to stderr.
+        """
+        self.enabled = True
+        self.started_at = time.perf_counter()
+        atexit.register(self.report, export_path)
+
+    def record_request(self, method, url, status, seconds, bytes_out, bytes_in, command, body=None, retries=0):
+        """
+        Record a Jira request.
+
+        Args:
+            method (str): HTTP method.
+            url (str): Request URL.
+            status: HTTP status, or the name of the exception the request failed with.
+            seconds (float): Latency, including reading the response body.
+            bytes_out (int): Size of the request body.
+            bytes_in (int): Size of the response body.
+            command (str): Command the request was sent for, see CountingAdapter.track.
+            body: Request body, to find the projects of POST searches.
+            retries (int): Number of retries made by the connection pool.
+        """
+        record = {
+            'endpoint': endpoint_of(method, url),
+            'status': status,
+            'seconds': seconds,
+            'bytes_out': bytes_out,
+            'bytes_in': bytes_in,
+            'command': command,
+            'projects': projects_of(url, body),
+            'retries': retries,
+        }
+        with self.lock:
+            self.requests.append(record)
+
+    def record_retry(self, endpoint):
+        """
+        Count a request sent again after a failure.
+
+        Args:
+            endpoint (str): Endpoint name, see endpoint_of.
+        """
+        if self.enabled:
+            with self.lock:
+                self.retries[endpoint] += 1
+
+    @contextlib.contextmanager
+    def timed(self, name, label):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            with self.lock:
+                self.phases[f"{name}[{label}]" if label else name].append(seconds)
+
+    def phase(self, name, label=None):
+        """
+        Time a phase, e.g. with PROFILER.phase('fetch', project).
+
+        Args:
+            name (str): Phase name.
+            label (str, optional): Label telling instances apart, e.g. a project.
+
+        Returns:
+            A context manager.
+        """
+        if not self.enabled:
+            return contextlib.nullcontext()
+        return self.timed(name, label)
+
+    def summary(self):
+        """
+        Summarise the recorded requests and phases.
+
+        Returns:
+            dict: Wall time, request totals, and distributions by endpoint, command,
+                project and phase.
+        """
+        with self.lock:
+            requests = list(self.requests)
+            phases = {name: list(durations) for name, durations in self.phases.items()}
+            retries = dict(self.retries)
+
+        def group(key):
+            groups = defaultdict(list)
+            for record in requests:
+                if record[key]:
+                    groups[record[key]].append(record)
+            summary = {}
+            for name, records in sorted(groups.items()):
+                summary[name] = distribution([record['seconds'] for record in records])
+                summary[name]['bytes_in'] = sum(record['bytes_in'] for record in records)
+                summary[name]['bytes_out'] = sum(record['bytes_out'] for record in records)
+                summary[name]['errors'] = sum(1 for record in records if not isinstance(record['status'], int)
+                                              or record['status'] >= 400)
+                summary[name]['retries'] = sum(record['retries'] for record in records) + retries.get(name, 0)
+            return summary
+
+        return {
+            'wall_ms': round((time.perf_counter() - self.started_at) * 1000, 3),
+            'requests': len(requests),
+            'request_ms': round(sum(record['seconds'] for record in requests) * 1000, 3),
+            'bytes_in': sum(record['bytes_in'] for record in requests),
+            'bytes_out': sum(record['bytes_out'] for record in requests),
+            'endpoints': group('endpoint'),
+            'commands': group('command'),
+            'projects': group('projects'),
+            'phases': {name: distribution(durations) for name, durations in sorted(phases.items())},
+        }
+
+    def report(self, export_path=None):
+        """
+        Print the summary to stderr, or write it as JSON.
+
+        Args:
+            export_path (str, optional): JSON file to write, '-' or None for stderr.
+        """
+        summary = self.summary()
+        if export_path and export_path != '-':
+            with open(export_path, 'w', encoding='utf-8') as file:
+                json.dump(summary, file, indent=2)
+            return
+        lines = [f"Profile: {summary['wall_ms']:.0f} ms wall, {summary['requests']} requests taking "
+                 f"{summary['request_ms']:.0f} ms, {summary['bytes_in']} bytes in, {summary['bytes_out']} bytes out"]
+        for title, key in (("Endpoints", 'endpoints'), ("Projects", 'projects'), ("Phases", 'phases')):
+            if not summary[key]:
+                continue
+            lines.append(f"{title}:")
+            by_total = sorted(summary[key].items(), key=lambda item: item[1]['total_ms'], reverse=True)
+            for name, stats in by_total:
+                line = (f"  {name}: {stats['count']} x, total {stats['total_ms']:.1f} ms, median {stats['median_ms']:.1f} ms, "
+                        f"p95 {stats['p95_ms']:.1f} ms, max {stats['max_ms']:.1f} ms")
+                if 'bytes_in' in stats:
+                    line += f", {stats['bytes_in']} bytes in"
+                    if stats['errors'] or stats['retries']:
+                        line += f", {stats['errors']} errors, {stats['retries']} retries"
+                lines.append(line)
+        print("\n".join(lines), file=sys.stderr)
+
+
+PROFILER = Profiler()
@@ -0,0 +1,40 @@
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket: calls proceed at a sustained rate, with bursts of up to its capacity.
+
+    Callers reserve a token even when the bucket is empty and sleep until it refills,
+    so waiting callers are served in order.
+    """
+
+    def __init__(self, rate, capacity=None):
+        """
+        Initialize the bucket, full.
+
+        Args:
+            rate (float): Tokens added per second, or 0 for no limit.
+            capacity (float, optional): Maximum number of tokens, the rate by default.
+        """
+        self.rate = rate
+        self.capacity = max(1, capacity or rate or 1)
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Take a token, blocking until one is available.
+        """
+        if not self.rate:
+            return
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0
+        if wait:
+            time.sleep(wait)
@@ -0,0 +1,198 @@
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from requests.exceptions import ConnectionError, ConnectTimeout, Timeout
+from urllib3.exceptions import NewConnectionError
+from jiraclui.profiler import PROFILER, endpoint_of
+from jiraclui.rate_limit import TokenBucket
+
+# Statuses meaning Jira is throttling or temporarily unavailable.
+RETRY_STATUSES = (429, 503)
+# Throttled requests were not processed, so they are retried whatever their method.
+THROTTLED_STATUS = 429
+# Gateway errors, only retried for requests that are safe to send twice.
+IDEMPOTENT_RETRY_STATUSES = (502, 504)
+IDEMPOTENT_METHODS = ('GET', 'HEAD', 'OPTIONS', 'PUT', 'DELETE')
+
+
+def retry_after_seconds(response):
+    """
+    Read the Retry-After header of a response.
+
+    Args:
+        response (requests.Response): The response.
+
+    Returns:
+        float: Seconds to wait, or None if the header is missing or invalid.
+    """
+    value = response.headers.get('Retry-After')
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def is_connect_error(error):
+    """
+    Tell whether a request failed before reaching Jira: a connect timeout or a refused or unresolvable host.
+
+    Args:
+        error (Exception): The error a request failed with.
+
+    Returns:
+        bool: True if no connection could be made.
+    """
+    if isinstance(error, ConnectTimeout):
+        return True
+    reason = error.args[0] if error.args else None
+    return isinstance(getattr(reason, 'reason', reason), NewConnectionError)
+
+
+class RequestScheduler:
+    """
+    Central scheduler of the requests sent to Jira.
+
+    Every request of the shared session goes through it: at most 'max_concurrent_requests'
+    (default 8) are in flight, they start at a sustained 'requests_per_second' (default
+    20) with bursts of 'request_burst', and throttled or failed requests are retried up
+    to 'max_retries' times (default 4). A Retry-After header is honoured and pauses
+    every request, not only the throttled one; otherwise retries back off exponentially
+    from 'retry_backoff' seconds, with jitter, up to 'max_retry_delay' seconds.
+    A server that cannot be connected to is not retried, so that an unreachable Jira is
+    detected within the connect timeout. Other connection errors and gateway errors
+    are only retried for idempotent requests, and
+    other requests (creates, transitions) are only retried on 429 or with a Retry-After.
+    """
+
+    def __init__(self, max_concurrent=8, rate=20, burst=None, max_retries=4, backoff=0.5, max_delay=60):
+        """
+        Initialize the scheduler.
+
+        Args:
+            max_concurrent (int): Maximum number of requests in flight, or 0 for no limit.
+            rate (float): Sustained requests per second, or 0 for no limit.
+            burst (float, optional): Size of the bursts above the rate, the rate by default.
+            max_retries (int): Number of retries of a request.
+            backoff (float): Delay of the first retry without Retry-After, in seconds.
+            max_delay (float): Maximum delay of a retry, in seconds.
+        """
+        self.slots = threading.BoundedSemaphore(max_concurrent) if max_concurrent else None
+        self.bucket = TokenBucket(rate, burst)
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_delay = max_delay
+        self.paused_until = 0
+        self.lock = threading.Lock()
+
+    @classmethod
+    def from_options(cls, app_options):
+        """
+        Create the scheduler configured by the application options.
+
+        Args:
+            app_options (dict): Application options.
+
+        Returns:
+            RequestScheduler: The scheduler.
+        """
+        return cls(app_options.get("max_concurrent_requests", 8), app_options.get("requests_per_second", 20),
+                   app_options.get("request_burst"), app_options.get("max_retries", 4),
+                   app_options.get("retry_backoff", 0.5), app_options.get("max_retry_delay", 60))
+
+    def wait_for_turn(self):
+        """
+        Wait out a pause requested by Jira, then for a token of the bucket.
+        """
+        while True:
+            with self.lock:
+                pause = self.paused_until - time.monotonic()
+            if pause <= 0:
+                break
+            time.sleep(pause)
+        self.bucket.acquire()
+
+    def pause(self, seconds):
+        """
+        Hold every request back for a number of seconds.
+        """
+        with self.lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+    def retry_delay(self, request, response, error, retry):
+        """
+        Decide whether a request is retried, and after how long.
+
+        Args:
+            request (requests.PreparedRequest): The request.
+            response (requests.Response): Its response, or None if it failed.
+            error (Exception): The connection error it failed with, or None.
+            retry (int): Number of retries already made.
+
+        Returns:
+            float: Seconds to wait before the retry, or None to give up.
+        """
+        if retry >= self.max_retries:
+            return None
+        idempotent = request.method.upper() in IDEMPOTENT_METHODS
+        retry_after = retry_after_seconds(response) if response is not None else None
+        if error is not None:
+            retryable = idempotent and not is_connect_error(error)
+        elif idempotent:
+            retryable = response.status_code in RETRY_STATUSES + IDEMPOTENT_RETRY_STATUSES
+        else:
+            # A 503 without Retry-After may come after a create or transition was applied.
+            retryable = response.status_code == THROTTLED_STATUS or (
+                response.status_code in RETRY_STATUSES and retry_after is not None)
+        if not retryable:
+            return None
+        if retry_after is not None:
+            delay = min(retry_after, self.max_delay)
+            self.pause(delay)
+            return delay
+        delay = min(self.max_delay, self.backoff * 2 ** retry)
+        return delay / 2 + random.uniform(0, delay / 2)
+
+    def send(self, request, attempt):
+        """
+        Send a request through the scheduler.
+
+        Args:
+            request (requests.PreparedRequest): The request.
+            attempt (callable): Sends the request once and returns its response.
+
+        Returns:
+            requests.Response: The final response, possibly still an error.
+
+        Raises:
+            ConnectionError: If the last attempt could not reach Jira.
+        """
+        retry = 0
+        while True:
+            self.wait_for_turn()
+            response = error = None
+            if self.slots:
+                self.slots.acquire()
+            try:
+                response = attempt()
+            except (ConnectionError, Timeout) as e:
+                error = e
+            finally:
+                if self.slots:
+                    self.slots.release()
+            delay = self.retry_delay(request, response, error, retry)
+            if delay is None:
+                if error is not None:
+                    raise error
+                return response
+            if response is not None:
+                response.close()
+            PROFILER.record_retry(endpoint_of(request.method, request.url))
+            retry += 1
+            time.sleep(delay)
@@ -0,0 +1,65 @@
+import hashlib
+import json
+import os
+import time
+
+
+class SessionCache:
+    """
+    On-disk cache of session facts, such as server info and the current user.
+
+    Entries are stored per Jira server and API token fingerprint, so changing the
+    token never serves another identity. The token itself is never written.
+    """
+
+    def __init__(self, cache_dir, server_url, api_key, ttl):
+        """
+        Initialize the session cache.
+
+        Args:
+            cache_dir (str): Directory holding the cache files.
+            server_url (str): Jira server URL.
+            api_key (str): API key for authentication.
+            ttl (int): Number of seconds a cached entry stays valid.
+        """
+        fingerprint = hashlib.sha256(f"{server_url}\0{api_key}".encode('utf-8')).hexdigest()[:16]
+        self.path = os.path.join(cache_dir, f"session-{fingerprint}.json")
+        self.ttl = ttl
+
+    def load(self):
+        """
+        Return the cached session facts.
+
+        Returns:
+            dict: The cached facts, or an empty dictionary if missing, unreadable or expired.
+        """
+        try:
+            with open(self.path, 'r', encoding='utf-8') as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or time.time() - data.get('saved_at', 0) > self.ttl:
+            return {}
+        return data
+
+    def save(self, data):
+        """
+        Store session facts, readable by the current user only.
+
+        Args:
+            data (dict): Facts to store.
+        """
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        data = dict(data, saved_at=time.time())
+        file_descriptor = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(file_descriptor, 'w', encoding='utf-8') as file:
+            json.dump(data, file)
+
+    def clear(self):
+        """
+        Remove the cached facts.
+        """
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
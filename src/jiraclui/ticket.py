@@ -0,0 +1,155 @@
+import sys
+
+
+def intern_value(value):
+    """
+    Intern a repeated string value so that all tickets share one copy of it.
+
+    Args:
+        value (str): Value to intern, or None.
+
+    Returns:
+        str: The interned value, or None.
+    """
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+class Ticket:
+    """
+    A Jira ticket as used by the client, the board, the filter and the ticket store.
+
+    Tickets are compact __slots__ records. Values repeated across many tickets
+    (project, assignee, reporter and status) are interned, so a large dataset
+    keeps a single copy of each of them.
+    """
+
+    __slots__ = ('ticket_no', 'project', 'title', 'assignee', 'reporter', 'status', 'description', 'created', 'updated',
+                 'project_key', 'issue_type')
+
+    # Field labels shown in the details view, in display order.
+    DETAIL_FIELDS = (
+        ('ticketNo', 'ticket_no'),
+        ('project', 'project'),
+        ('title', 'title'),
+        ('description', 'description'),
+        ('assignee', 'assignee'),
+        ('reporter', 'reporter'),
+        ('status', 'status'),
+    )
+
+    def __init__(self, ticket_no, project, title, assignee, reporter, status, description=None, created=None, updated=None,
+                 project_key=None, issue_type=None):
+        """
+        Initialize a Ticket.
+
+        Args:
+            ticket_no (str): Issue key.
+            project (str): Project name.
+            title (str): Issue summary.
+            assignee (str): Display name of the assignee, or None.
+            reporter (str): Display name of the reporter, or None.
+            status (str): Status name.
+            description (str, optional): Issue description, only loaded for details.
+            created (str, optional): Creation timestamp as returned by Jira.
+            updated (str, optional): Last update timestamp as returned by Jira.
+            project_key (str, optional): Project key.
+            issue_type (str, optional): Issue type name.
+        """
+        self.ticket_no = ticket_no
+        self.project = intern_value(project)
+        self.title = title
+        self.assignee = intern_value(assignee)
+        self.reporter = intern_value(reporter)
+        self.status = intern_value(status)
+        self.description = description
+        self.created = created
+        self.updated = updated
+        self.project_key = intern_value(project_key)
+        self.issue_type = intern_value(issue_type)
+
+    @classmethod
+    def from_issue(cls, issue):
+        """
+        Create a Ticket from a jira Issue resource.
+
+        Args:
+            issue (jira.Issue): Issue returned by the Jira API.
+
+        Returns:
+            Ticket: The ticket.
+        """
+        fields = issue.fields
+        return cls(
+            issue.key,
+            fields.project.name,
+            fields.summary,
+            fields.assignee.displayName if fields.assignee else None,
+            fields.reporter.displayName if fields.reporter else None,
+            fields.status.name,
+            description=getattr(fields, 'description', None),
+            created=getattr(fields, 'created', None),
+            updated=getattr(fields, 'updated', None),
+            project_key=fields.project.key,
+            issue_type=fields.issuetype.name if getattr(fields, 'issuetype', None) else None,
+        )
+
+    @classmethod
+    def from_json(cls, raw_issue):
+        """
+        Create a Ticket from a raw issue of a search result.
+
+        Args:
+            raw_issue (dict): Issue as returned in the JSON of a search.
+
+        Returns:
+            Ticket: The ticket.
+        """
+        fields = raw_issue['fields']
+        return cls(
+            raw_issue['key'],
+            fields['project']['name'],
+            fields.get('summary'),
+            fields['assignee']['displayName'] if fields.get('assignee') else None,
+            fields['reporter']['displayName'] if fields.get('reporter') else None,
+            fields['status']['name'],
+            description=fields.get('description'),
+            created=fields.get('created'),
+            updated=fields.get('updated'),
+            project_key=fields['project'].get('key'),
+            issue_type=fields['issuetype']['name'] if fields.get('issuetype') else None,
+        )
+
+    def replace(self, **changes):
+        """
+        Return a copy of the ticket with some fields changed.
+
+        Args:
+            **changes: New field values, by attribute name.
+
+        Returns:
+            Ticket: The updated copy.
+        """
+        values = {attribute: getattr(self, attribute) for attribute in self.__slots__}
+        values.update(changes)
+        return Ticket(**values)
+
+    def search_values(self):
+        """
+        Return the values a board filter is matched against.
+
+        Returns:
+            tuple: Key, project, title, assignee, reporter and status.
+        """
+        return (self.ticket_no, self.project, self.title, self.assignee, self.reporter, self.status)
+
+    def details(self):
+        """
+        Return the labelled fields shown in the details view.
+
+        Returns:
+            list: (label, value) pairs.
+        """
+        return [(label, getattr(self, attribute)) for label, attribute in self.DETAIL_FIELDS]
+
+    def __repr__(self):
+        return f"Ticket({self.ticket_no!r}, status={self.status!r})"
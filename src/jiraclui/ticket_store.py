@@ -0,0 +1,239 @@
+import hashlib
+import os
+import sqlite3
+import threading
+from jiraclui.ticket import Ticket
+
+TICKET_COLUMNS = ('scope, ticket_no, project, title, assignee, reporter, status, created, updated, '
+                  'project_key, issue_type')
+# Columns read back as the positional arguments of Ticket; descriptions are not stored.
+SELECTED_COLUMNS = 'ticket_no, project, title, assignee, reporter, status, NULL, created, updated, project_key, issue_type'
+
+
+class TicketStore:
+    """
+    Local SQLite store of Jira tickets with a per-scope sync high-water mark.
+
+    A scope is one project combined with the configured users filter, so every
+    project is synchronised independently. Tickets are keyed by issue key
+    inside their scope.
+    """
+
+    def __init__(self, db_path):
+        """
+        Open (and create if needed) the ticket store.
+
+        Args:
+            db_path (str): Path of the SQLite database file.
+        """
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.db_path = db_path
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        with self.conn:
+            self.conn.execute(
+                'CREATE TABLE IF NOT EXISTS tickets ('
+                'scope TEXT NOT NULL, ticket_no TEXT NOT NULL, project TEXT, title TEXT, '
+                'assignee TEXT, reporter TEXT, status TEXT, created TEXT, updated TEXT, '
+                'project_key TEXT, issue_type TEXT, '
+                'PRIMARY KEY (scope, ticket_no))'
+            )
+            self.conn.execute(
+                'CREATE TABLE IF NOT EXISTS sync_state ('
+                'scope TEXT PRIMARY KEY, last_sync REAL, last_full_sync REAL)'
+            )
+            self.migrate()
+
+    def migrate(self):
+        """
+        Add the columns of newer versions to a store created by an older one.
+
+        Tickets stored without them are only completed by a full sync, so every scope
+        is made to run one next.
+        """
+        columns = {row[1] for row in self.conn.execute('PRAGMA table_info(tickets)')}
+        missing = [column for column in ('project_key', 'issue_type') if column not in columns]
+        for column in missing:
+            self.conn.execute(f'ALTER TABLE tickets ADD COLUMN {column} TEXT')
+        if missing:
+            self.conn.execute('UPDATE sync_state SET last_full_sync = NULL')
+
+    @staticmethod
+    def path_for(cache_dir, server_url):
+        """
+        Build the database path of a Jira server's ticket store.
+
+        Args:
+            cache_dir (str): Directory holding the cache files.
+            server_url (str): Jira server URL.
+
+        Returns:
+            str: Path of the SQLite database file.
+        """
+        server_id = hashlib.sha1(server_url.encode('utf-8')).hexdigest()[:12]
+        return os.path.join(cache_dir, f"tickets-{server_id}.db")
+
+    @staticmethod
+    def scope_for(project, users):
+        """
+        Build the scope name for a project and users filter.
+
+        Args:
+            project (str): Project key.
+            users (list): List of user names or email addresses.
+
+        Returns:
+            str: Scope name.
+        """
+        return f"{project}|{','.join(sorted(users or []))}"
+
+    def get_sync_state(self, scope):
+        """
+        Return the sync timestamps recorded for a scope.
+
+        Args:
+            scope (str): Scope name.
+
+        Returns:
+            tuple: (last_sync, last_full_sync) as epoch seconds, or (None, None).
+        """
+        with self.lock:
+            row = self.conn.execute(
+                'SELECT last_sync, last_full_sync FROM sync_state WHERE scope = ?', (scope,)
+            ).fetchone()
+        return row if row else (None, None)
+
+    def last_synced(self, scopes):
+        """
+        Return the time of the oldest last sync among scopes, i.e. the age of the data they hold together.
+
+        Args:
+            scopes (list): Scope names.
+
+        Returns:
+            float: Epoch seconds, or None if any scope was never synced.
+        """
+        sync_times = [self.get_sync_state(scope)[0] for scope in scopes]
+        if not sync_times or None in sync_times:
+            return None
+        return min(sync_times)
+
+    def merge_tickets(self, scope, tickets, synced_at, full_sync=False):
+        """
+        Merge fetched tickets into a scope and move its high-water mark.
+
+        Args:
+            scope (str): Scope name.
+            tickets (list): Ticket records, including 'created' and 'updated'.
+            synced_at (float): Epoch seconds at which the fetch was started.
+            full_sync (bool): True if tickets is the complete scope, replacing what is stored.
+        """
+        rows = [
+            (scope, ticket.ticket_no, ticket.project, ticket.title, ticket.assignee,
+             ticket.reporter, ticket.status, ticket.created, ticket.updated, ticket.project_key, ticket.issue_type)
+            for ticket in tickets
+        ]
+        with self.lock, self.conn:
+            if full_sync:
+                self.conn.execute('DELETE FROM tickets WHERE scope = ?', (scope,))
+            self.conn.executemany(
+                f'INSERT OR REPLACE INTO tickets ({TICKET_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)', rows)
+            if full_sync:
+                last_full_sync = synced_at
+            else:
+                row = self.conn.execute(
+                    'SELECT last_full_sync FROM sync_state WHERE scope = ?', (scope,)
+                ).fetchone()
+                last_full_sync = row[0] if row else None
+            self.conn.execute(
+                'INSERT OR REPLACE INTO sync_state VALUES (?, ?, ?)', (scope, synced_at, last_full_sync)
+            )
+
+    def update_ticket(self, ticket):
+        """
+        Overwrite the stored copies of a ticket after a write, in every scope holding it.
+
+        Tickets not stored yet are left to the next sync, which knows their scope.
+
+        Args:
+            ticket (Ticket): The updated ticket.
+        """
+        with self.lock, self.conn:
+            self.conn.execute(
+                'UPDATE tickets SET project = ?, title = ?, assignee = ?, reporter = ?, status = ?, '
+                'project_key = COALESCE(?, project_key), issue_type = COALESCE(?, issue_type) WHERE ticket_no = ?',
+                (ticket.project, ticket.title, ticket.assignee, ticket.reporter, ticket.status,
+                 ticket.project_key, ticket.issue_type, ticket.ticket_no)
+            )
+
+    def get_tickets(self, scope, limit=None):
+        """
+        Return the stored tickets of a scope, newest created first.
+
+        Args:
+            scope (str): Scope name.
+            limit (int, optional): Maximum number of tickets to return.
+
+        Returns:
+            list: List of Ticket records.
+        """
+        query = f'SELECT {SELECTED_COLUMNS} FROM tickets WHERE scope = ? ORDER BY created DESC'
+        params = (scope,)
+        if limit:
+            query += ' LIMIT ?'
+            params += (limit,)
+        with self.lock:
+            rows = self.conn.execute(query, params).fetchall()
+        return [Ticket(*row) for row in rows]
+
+    def get_ticket(self, ticket_no):
+        """
+        Return the stored copy of a ticket, from whichever scope holds it.
+
+        Args:
+            ticket_no (str): Issue key.
+
+        Returns:
+            Ticket: The ticket without description, or None if it is not stored.
+        """
+        with self.lock:
+            row = self.conn.execute(
+                f'SELECT {SELECTED_COLUMNS} FROM tickets WHERE ticket_no = ? LIMIT 1', (ticket_no,)
+            ).fetchone()
+        return Ticket(*row) if row else None
+
+    def get_tickets_since(self, projects, since):
+        """
+        Return the stored tickets of projects created or updated since a date, most recently updated first.
+
+        Args:
+            projects (list): Project keys.
+            since (str): ISO date or timestamp, compared with the stored Jira timestamps.
+
+        Returns:
+            list: List of Ticket records, each ticket once even if several scopes hold it.
+        """
+        placeholders = ", ".join("?" for _ in projects)
+        query = ('SELECT ticket_no, project, title, assignee, reporter, status, NULL, created, MAX(updated), '
+                 'project_key, issue_type FROM tickets WHERE (created >= ? OR updated >= ?) '
+                 f"AND substr(scope, 1, instr(scope, '|') - 1) IN ({placeholders}) "
+                 'GROUP BY ticket_no ORDER BY MAX(updated) DESC')
+        with self.lock:
+            rows = self.conn.execute(query, (since, since, *projects)).fetchall()
+        return [Ticket(*row) for row in rows]
+
+    def clear(self):
+        """
+        Remove every stored ticket and sync state.
+        """
+        with self.lock, self.conn:
+            self.conn.execute('DELETE FROM tickets')
+            self.conn.execute('DELETE FROM sync_state')
+
+    def close(self):
+        """
+        Close the underlying database connection.
+        """
+        self.conn.close()
@@ -0,0 +1,28 @@
+from jiraclui.cache import JsonFileCache
+
+
+class TransitionCache(JsonFileCache):
+    """
+    On-disk cache of workflow transitions per project, issue type and source status.
+
+    Tickets sharing these three values share their available transitions, so
+    resolving a transition for many tickets costs a single transitions request.
+    Values are lists of transitions as dictionaries with 'id', 'name' and 'to'.
+    """
+
+    value_name = 'transitions'
+
+    @staticmethod
+    def key_for(ticket):
+        """
+        Build the cache key of a ticket.
+
+        Args:
+            ticket (Ticket): The ticket.
+
+        Returns:
+            str: The cache key, or None if the ticket lacks its project key or issue type.
+        """
+        if not ticket.project_key or not ticket.issue_type:
+            return None
+        return f"{ticket.project_key}|{ticket.issue_type}|{ticket.status}"
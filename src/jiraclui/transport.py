@@ -0,0 +1,278 @@
+import atexit
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+from requests.adapters import HTTPAdapter
+from requests.exceptions import RequestException
+from requests.models import Response
+from requests.structures import CaseInsensitiveDict
+from jiraclui.profiler import PROFILER
+from jiraclui.scheduler import RequestScheduler
+
+# Response headers that are not recorded: they describe the original transfer or carry secrets.
+SKIPPED_HEADERS = ('content-encoding', 'content-length', 'transfer-encoding', 'connection', 'set-cookie')
+
+
+class CassetteMiss(RequestException):
+    """
+    Raised in replay mode for a request that the cassette does not hold.
+    """
+
+
+def request_key(request):
+    """
+    Build the key a request is recorded and replayed under.
+
+    Query parameters are sorted, so equivalent URLs match.
+
+    Args:
+        request (requests.PreparedRequest): The request.
+
+    Returns:
+        str: Method, normalised URL and body.
+    """
+    url = urlsplit(request.url)
+    query = urlencode(sorted(parse_qsl(url.query, keep_blank_values=True)))
+    body = request.body.decode('utf-8') if isinstance(request.body, bytes) else (request.body or '')
+    return f"{request.method} {urlunsplit(url._replace(query=query))} {body}"
+
+
+class CountingAdapter(HTTPAdapter):
+    """
+    HTTP adapter counting the requests sent per command.
+
+    Every transport of the shared Jira session derives from it, so the number of
+    requests behind a command can be reported with --count-requests or asserted on.
+    With --profile, every request is also recorded by the profiler. Requests go
+    through the scheduler, when one is set, and every retry is counted.
+    """
+
+    def __init__(self, pool_size):
+        """
+        Initialize the adapter.
+
+        Args:
+            pool_size (int): Size of the connection pool.
+        """
+        super().__init__(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.counts = Counter()
+        self.command = 'startup'
+        self.counts_lock = threading.Lock()
+        self.scheduler = None
+
+    @contextmanager
+    def track(self, command):
+        """
+        Count the requests sent inside the block under a command name.
+
+        Args:
+            command (str): Command name, e.g. 'issue', 'today' or 'refresh'.
+        """
+        previous, self.command = self.command, command
+        try:
+            yield
+        finally:
+            self.command = previous
+
+    def send(self, request, **kwargs):
+        if self.scheduler is None:
+            return self.send_once(request, **kwargs)
+        return self.scheduler.send(request, lambda: self.send_once(request, **kwargs))
+
+    def send_once(self, request, **kwargs):
+        """
+        Send a request once, counting and profiling it.
+        """
+        with self.counts_lock:
+            self.counts[self.command] += 1
+        if not PROFILER.enabled:
+            return self.deliver(request, **kwargs)
+        return self.profile(request, **kwargs)
+
+    def profile(self, request, **kwargs):
+        """
+        Send a request and record its endpoint, status, latency, sizes and retries.
+        """
+        body = request.body or b''
+        bytes_out = len(body.encode('utf-8') if isinstance(body, str) else body)
+        command = self.command
+        start = time.perf_counter()
+        try:
+            response = self.deliver(request, **kwargs)
+            # The body is read here, so that the latency includes its transfer.
+            content = response.content
+        except Exception as e:
+            PROFILER.record_request(request.method, request.url, type(e).__name__, time.perf_counter() - start,
+                                    bytes_out, 0, command, request.body)
+            raise
+        retries = getattr(getattr(response.raw, 'retries', None), 'history', ())
+        content_length = response.headers.get('Content-Length')
+        PROFILER.record_request(request.method, request.url, response.status_code, time.perf_counter() - start, bytes_out,
+                                int(content_length) if content_length and content_length.isdigit() else len(content or b''),
+                                command, request.body, len(retries))
+        return response
+
+    def deliver(self, request, **kwargs):
+        """
+        Send a request, or answer it locally in derived transports.
+        """
+        return super().send(request, **kwargs)
+
+    def report(self):
+        """
+        Print the request counts per command to stderr.
+        """
+        total = sum(self.counts.values())
+        lines = [f"  {command}: {count}" for command, count in sorted(self.counts.items())]
+        print("\n".join([f"Jira requests: {total}"] + lines), file=sys.stderr)
+
+
+class RecordingAdapter(CountingAdapter):
+    """
+    HTTP adapter sending requests to Jira and recording every response into a cassette file.
+
+    Responses are kept in memory and the cassette is written once, when the adapter is
+    closed or at exit.
+    """
+
+    def __init__(self, pool_size, cassette_path):
+        """
+        Initialize the adapter.
+
+        Args:
+            pool_size (int): Size of the connection pool.
+            cassette_path (str): Path of the JSON cassette, overwritten.
+        """
+        super().__init__(pool_size)
+        self.cassette_path = cassette_path
+        self.interactions = []
+        self.saved = 0
+        self.lock = threading.Lock()
+        atexit.register(self.save)
+
+    def deliver(self, request, **kwargs):
+        response = super().deliver(request, **kwargs)
+        interaction = {
+            'request': request_key(request),
+            'status': response.status_code,
+            'reason': response.reason,
+            'headers': {name: value for name, value in response.headers.items() if name.lower() not in SKIPPED_HEADERS},
+            'body': response.content.decode(response.encoding or 'utf-8', errors='replace'),
+            'elapsed': response.elapsed.total_seconds(),
+        }
+        with self.lock:
+            self.interactions.append(interaction)
+        return response
+
+    def save(self):
+        """
+        Write the cassette atomically, if anything was recorded since it was last written.
+        """
+        with self.lock:
+            if self.saved == len(self.interactions):
+                return
+            os.makedirs(os.path.dirname(self.cassette_path) or '.', exist_ok=True)
+            temp_path = f"{self.cassette_path}.{os.getpid()}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as file:
+                json.dump({'interactions': self.interactions}, file, indent=1)
+            os.replace(temp_path, self.cassette_path)
+            self.saved = len(self.interactions)
+
+    def close(self):
+        self.save()
+        super().close()
+
+
+class ReplayAdapter(CountingAdapter):
+    """
+    HTTP adapter answering every request from a cassette file, without any network access.
+
+    Identical requests are answered with their recorded responses in recording order;
+    the last one is repeated once they are used up.
+    """
+
+    def __init__(self, pool_size, cassette_path, latency=None):
+        """
+        Initialize the adapter.
+
+        Args:
+            pool_size (int): Size of the connection pool.
+            cassette_path (str): Path of the JSON cassette.
+            latency: Simulated latency per request: milliseconds, 'recorded' to replay the
+                recorded response times, or None for none.
+        """
+        super().__init__(pool_size)
+        with open(cassette_path, 'r', encoding='utf-8') as file:
+            interactions = json.load(file)['interactions']
+        self.responses = {}
+        for interaction in interactions:
+            self.responses.setdefault(interaction['request'], []).append(interaction)
+        self.latency = latency
+        self.lock = threading.Lock()
+
+    def deliver(self, request, **kwargs):
+        key = request_key(request)
+        with self.lock:
+            recorded = self.responses.get(key)
+            if not recorded:
+                raise CassetteMiss(f"No recorded response for {key}", request=request)
+            interaction = recorded.pop(0) if len(recorded) > 1 else recorded[0]
+        if self.latency == 'recorded':
+            time.sleep(interaction.get('elapsed', 0))
+        elif self.latency:
+            time.sleep(float(self.latency) / 1000)
+        return self.build_response(request, interaction)
+
+    @staticmethod
+    def build_response(request, interaction):
+        """
+        Build the response of a recorded interaction.
+
+        Args:
+            request (requests.PreparedRequest): The request being answered.
+            interaction (dict): The recorded interaction.
+
+        Returns:
+            requests.Response: The response.
+        """
+        response = Response()
+        response.status_code = interaction['status']
+        response.reason = interaction.get('reason')
+        response.headers = CaseInsensitiveDict(interaction.get('headers', {}))
+        response._content = interaction['body'].encode('utf-8')
+        response.encoding = 'utf-8'
+        response.url = request.url
+        response.request = request
+        return response
+
+
+def create_transport(app_options):
+    """
+    Create the transport of the shared Jira session from the application options.
+
+    'record' or 'replay' name a cassette file, 'replay_latency' sets the simulated
+    latency, and 'count_requests' prints the request counts per command on exit.
+    Requests are scheduled by a RequestScheduler configured by the same options.
+
+    Args:
+        app_options (dict): Application options.
+
+    Returns:
+        CountingAdapter: The adapter to mount on the session.
+    """
+    pool_size = app_options.get("connection_pool_size", 10)
+    if app_options.get("replay"):
+        transport = ReplayAdapter(pool_size, app_options["replay"], app_options.get("replay_latency"))
+    elif app_options.get("record"):
+        transport = RecordingAdapter(pool_size, app_options["record"])
+    else:
+        transport = CountingAdapter(pool_size)
+    transport.scheduler = RequestScheduler.from_options(app_options)
+    if app_options.get("count_requests"):
+        atexit.register(transport.report)
+    return transport
@@ -1,10 +1,98 @@
 """
-    Dummy conftest.py for jiraclui.
+    Shared fixtures for the jiraclui tests.
 
-    If you don't know what this is for, just leave it empty.
     Read more about conftest.py under:
     - https://docs.pytest.org/en/stable/fixture.html
     - https://docs.pytest.org/en/stable/writing_plugins.html
 """
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+import pytest
 
-# import pytest
+SERVER_INFO = {'versionNumbers': [9, 4, 0], 'deploymentType': 'Server', 'version': '9.4.0'}
+MYSELF = {'name': 'alice', 'key': 'JIRAUSER10000', 'displayName': 'Alice'}
+PROJECTS = {'PRA': 'Project A', 'PRB': 'Project B'}
+
+
+def raw_issue(key, summary=None):
+    project = key.split('-')[0]
+    return {'id': key.split('-')[1], 'key': key, 'self': f'/rest/api/2/issue/{key}', 'fields': {
+        'project': {'key': project, 'name': PROJECTS.get(project, project)},
+        'summary': summary or f'Summary of {key}',
+        'assignee': {'displayName': 'Alice'},
+        'reporter': {'displayName': 'Bob'},
+        'status': {'name': 'Open'},
+        'issuetype': {'name': 'Task'},
+        'description': None,
+        'created': '2026-10-01T10:00:00.000+0000',
+        'updated': '2026-10-02T10:00:00.000+0000',
+    }}
+
+
+class FakeJiraHandler(BaseHTTPRequestHandler):
+    """
+    Answers the few Jira Server REST endpoints jiraclui reads, with issues PRA-1.. and PRB-1..
+
+    Searches are recorded in the server's 'queries'. Summaries can be changed through its
+    'summaries', and a search for recent updates only returns the keys in its 'changed'.
+    """
+
+    issues_per_project = 3
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        self.server.paths.append(url.path)
+        issue = re.fullmatch(r'/rest/api/2/issue/([A-Z]+-\d+)', url.path)
+        if url.path == '/rest/api/2/serverInfo':
+            self.reply(SERVER_INFO)
+        elif url.path == '/rest/api/2/myself':
+            self.reply(MYSELF)
+        elif url.path == '/rest/api/2/field':
+            self.reply([{'id': field, 'name': field.capitalize(), 'custom': False, 'clauseNames': [field]}
+                        for field in ('summary', 'status', 'assignee', 'reporter', 'project', 'issuetype')])
+        elif issue:
+            self.reply(raw_issue(issue.group(1), self.server.summaries.get(issue.group(1))))
+        elif url.path == '/rest/api/2/search':
+            query = parse_qs(url.query)
+            jql = query['jql'][0]
+            self.server.queries.append(jql)
+            projects = [project for project in PROJECTS if project in jql]
+            keys = [f'{project}-{number}' for project in projects for number in range(1, self.issues_per_project + 1)]
+            if 'updated >=' in jql:
+                keys = [key for key in keys if key in self.server.changed]
+            start_at = int(query.get('startAt', ['0'])[0])
+            end = start_at + int(query.get('maxResults', ['50'])[0])
+            self.reply({'startAt': start_at, 'total': len(keys),
+                        'issues': [raw_issue(key, self.server.summaries.get(key)) for key in keys[start_at:end]]})
+        else:
+            self.reply({'errorMessages': ['Not found']}, 404)
+
+    def reply(self, body, status=200):
+        data = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def jira_server():
+    """A fake Jira Server on a loopback port; yields it with its 'url' and the request 'paths' it served."""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FakeJiraHandler)
+    server.paths = []
+    server.queries = []
+    server.summaries = {}
+    server.changed = set()
+    server.url = f'http://127.0.0.1:{server.server_address[1]}'
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
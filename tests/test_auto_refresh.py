@@ -0,0 +1,27 @@
+from types import SimpleNamespace
+import pytest
+
+pytest.importorskip("jira")
+from jiraclui.jira_handler import JiraBoardManager  # noqa: E402
+
+
+def test_failed_polls_keep_the_high_water_mark():
+    calls = []
+
+    def get_updated_tickets(project_names, users, since):
+        calls.append(since)
+        if len(calls) == 1:
+            raise ConnectionError("VPN down")
+        return []
+
+    manager = JiraBoardManager.__new__(JiraBoardManager)
+    manager.showing_all_tickets = True
+    manager.project_names, manager.users = ['PRA'], []
+    manager.last_poll = 100.0
+    manager.jira_client = SimpleNamespace(get_updated_tickets=get_updated_tickets)
+
+    with pytest.raises(ConnectionError):
+        manager.poll_changes()
+    assert manager.last_poll == 100.0
+    manager.poll_changes()
+    assert calls == [100.0, 100.0] and manager.last_poll > 100.0
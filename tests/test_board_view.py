@@ -0,0 +1,55 @@
+from rich.console import Console
+from jiraclui.board_view import BoardView
+from jiraclui.ticket import Ticket
+
+
+def make_ticket(key, title="Fix login", status="Open"):
+    return Ticket(key, 'Project A', title, 'Alice', 'Bob', status)
+
+
+def render(view, width=80):
+    console = Console(width=width, color_system=None, record=True)
+    console.print(view)
+    return console.export_text()
+
+
+def test_renders_one_line_per_row_with_caption():
+    view = BoardView("yellow")
+    view.set_page([make_ticket('PRA-1'), make_ticket('PRA-2', title="A title far too long " * 5)], "page 1/3")
+    lines = render(view, width=60).splitlines()
+
+    assert len(lines) == 7
+    assert all(len(line) == 60 for line in lines[:6])
+    assert "PRA-2" in lines[4] and lines[4].rstrip().endswith("│") and "…" in lines[4]
+    assert lines[6].strip() == "page 1/3"
+
+
+def test_rows_are_rendered_again_only_when_their_ticket_changes():
+    view = BoardView("yellow")
+    tickets = [make_ticket('PRA-1'), make_ticket('PRA-2')]
+    view.set_page(tickets)
+    render(view)
+    first, second = (view.rendered[key][1] for key in ('PRA-1', 'PRA-2'))
+
+    view.set_page([tickets[0], make_ticket('PRA-2', status="Done")])
+    output = render(view)
+
+    assert view.rendered['PRA-1'][1] is first
+    assert view.rendered['PRA-2'][1] is not second
+    assert "Done" in output
+
+
+def test_rendered_rows_survive_a_change_of_column_widths():
+    view = BoardView("yellow")
+    view.set_page([make_ticket('PRA-1'), make_ticket('PRA-2')])
+    render(view)
+    first = view.rendered['PRA-1'][1]
+
+    # Another page with a longer title widens the Title column, and a narrow terminal truncates it.
+    view.set_page([make_ticket('PRA-1'), make_ticket('PRA-3', title="A much longer title than before")])
+    wide = render(view)
+    narrow = render(view, width=40)
+
+    assert view.rendered['PRA-1'][1] is first
+    assert "Fix login" in wide and "A much longer title than before" in wide
+    assert all(len(line) <= 40 for line in narrow.splitlines()) and "…" in narrow
@@ -0,0 +1,41 @@
+from jiraclui import cache
+from jiraclui.cache import JsonFileCache, TTLCache
+
+
+def test_least_recently_used_entry_is_evicted():
+    detail_cache = TTLCache(2, 60)
+    detail_cache.put("PRA-1", 1)
+    detail_cache.put("PRA-2", 2)
+    assert detail_cache.get("PRA-1") == 1
+    detail_cache.put("PRA-3", 3)
+    assert detail_cache.get("PRA-2") is None
+    assert detail_cache.get("PRA-1") == 1
+    assert len(detail_cache) == 2
+
+
+def test_entries_expire_and_can_be_invalidated(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+    detail_cache = TTLCache(10, 30)
+    detail_cache.put("PRA-1", 1)
+    detail_cache.put("PRA-2", 2)
+    detail_cache.invalidate("PRA-2")
+    assert detail_cache.get("PRA-2", "missing") == "missing"
+    now[0] += 31
+    assert detail_cache.get("PRA-1") is None
+
+
+def test_json_file_cache_persists_expires_and_invalidates(tmp_path, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache.time, "time", lambda: now[0])
+    path = str(tmp_path / "nested" / "cache.json")
+    file_cache = JsonFileCache(path, 60)
+    file_cache.put("PRA", {"types": [1, 2]})
+    file_cache.put("PRB", [3])
+
+    reloaded = JsonFileCache(path, 60)
+    assert reloaded.get("PRA") == {"types": [1, 2]}
+    reloaded.invalidate("PRB")
+    assert JsonFileCache(path, 60).get("PRB") is None
+    now[0] += 61
+    assert reloaded.get("PRA") is None
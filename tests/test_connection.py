@@ -0,0 +1,36 @@
+import pytest
+
+pytest.importorskip("jira")
+from jiraclui.connection import JiraConnection  # noqa: E402
+
+
+@pytest.mark.parametrize("app_options, timeout", [({}, (5, 30)), ({'timeout': 10}, 10), ({'timeout': [2, 60]}, (2, 60))])
+def test_requests_time_out_by_default(tmp_path, jira_server, app_options, timeout):
+    connection = JiraConnection(jira_server.url, 'token', dict(app_options, cache_dir=str(tmp_path)))
+    try:
+        assert connection.jira._session.timeout == timeout
+        assert jira_server.paths == ['/rest/api/2/serverInfo']
+    finally:
+        connection.session.close()
+
+
+def connect(jira_server, tmp_path, api_key='token', **app_options):
+    connection = JiraConnection(jira_server.url, api_key, dict(app_options, cache_dir=str(tmp_path)))
+    user = connection.current_user()
+    connection.session.close()
+    return user
+
+
+def test_server_info_and_current_user_are_cached_between_runs(tmp_path, jira_server):
+    assert connect(jira_server, tmp_path) == 'alice'
+    assert jira_server.paths == ['/rest/api/2/serverInfo', '/rest/api/2/myself']
+
+    assert connect(jira_server, tmp_path) == 'alice'
+    assert len(jira_server.paths) == 2
+
+
+@pytest.mark.parametrize("second_run", [{'api_key': 'other token'}, {'session_cache_ttl': 0}, {'refresh_session': True}])
+def test_a_new_token_an_expired_entry_or_a_refresh_fetches_the_session_again(tmp_path, jira_server, second_run):
+    connect(jira_server, tmp_path)
+    assert connect(jira_server, tmp_path, **second_run) == 'alice'
+    assert jira_server.paths == ['/rest/api/2/serverInfo', '/rest/api/2/myself'] * 2
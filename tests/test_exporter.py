@@ -0,0 +1,60 @@
+import csv
+import io
+import json
+import pytest
+from jiraclui.exporter import ColumnarWriter, field_value, open_writer, read_columnar
+
+FIELDS = ['key', 'status', 'assignee', 'labels']
+
+
+def raw_issue(number):
+    return {'key': f'PRA-{number}', 'fields': {
+        'status': {'name': 'Done' if number % 2 else 'Open'},
+        'assignee': {'displayName': 'Alice', 'name': 'alice'} if number % 3 else None,
+        'labels': ['web', 'release'] if number % 2 else [],
+    }}
+
+
+def rows(numbers):
+    return [[field_value(raw_issue(number), field) for field in FIELDS] for number in numbers]
+
+
+def test_field_values_are_reduced_to_names():
+    assert rows([1]) == [['PRA-1', 'Done', 'Alice', ['web', 'release']]]
+    assert rows([3]) == [['PRA-3', 'Done', None, ['web', 'release']]]
+
+
+def test_jsonl_and_csv_writers():
+    file = io.StringIO()
+    writer = open_writer('jsonl', file, FIELDS)
+    writer.write_rows(rows([1, 2]))
+    writer.close()
+    assert [json.loads(line) for line in file.getvalue().splitlines()][1] == \
+        {'key': 'PRA-2', 'status': 'Open', 'assignee': 'Alice', 'labels': []}
+
+    file = io.StringIO()
+    writer = open_writer('csv', file, FIELDS)
+    writer.write_rows(rows([1, 3]))
+    writer.close()
+    assert list(csv.reader(io.StringIO(file.getvalue()))) == [
+        FIELDS, ['PRA-1', 'Done', 'Alice', 'web, release'], ['PRA-3', 'Done', '', 'web, release']]
+
+    with pytest.raises(ValueError):
+        open_writer('parquet', file, FIELDS)
+
+
+def test_columnar_row_groups_round_trip():
+    file = io.StringIO()
+    writer = ColumnarWriter(file, FIELDS, row_group_size=4)
+    writer.write_rows(rows(range(1, 4)))
+    writer.write_rows(rows(range(4, 11)))
+    # Full row groups are written as soon as they fill up.
+    assert len(file.getvalue().splitlines()) == 3 and len(writer.rows) == 2
+    writer.close()
+
+    lines = file.getvalue().splitlines()
+    assert [json.loads(line)['rows'] for line in lines[1:]] == [4, 4, 2]
+    columns = json.loads(lines[1])['columns']
+    assert columns['status'] == {'dictionary': ['Done', 'Open'], 'indices': [0, 1, 0, 1]}
+    assert 'values' in columns['key']
+    assert list(read_columnar(io.StringIO(file.getvalue()))) == [dict(zip(FIELDS, row)) for row in rows(range(1, 11))]
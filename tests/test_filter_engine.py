@@ -0,0 +1,52 @@
+from jiraclui.filter_engine import FilterIndex
+from jiraclui.ticket import Ticket
+
+
+def make_tickets():
+    return [
+        Ticket('PRA-1', 'Alpha', 'Fix login page', 'Alice', None, 'In Progress'),
+        Ticket('PRA-2', 'Alpha', 'Refactor progress bar', None, 'Bob', 'Open'),
+        Ticket('PRB-10', 'Beta', 'Login timeout', 'Bob', 'Alice', 'Done'),
+    ]
+
+
+def keys(tickets):
+    return [ticket.ticket_no for ticket in tickets]
+
+
+def test_search_is_case_insensitive_substring():
+    index = FilterIndex(make_tickets())
+    assert keys(index.search("LOGIN")) == ['PRA-1', 'PRB-10']
+    assert keys(index.search("ogres")) == ['PRA-1', 'PRA-2']
+    assert keys(index.search("s pro")) == []
+    assert keys(index.search("in progress")) == ['PRA-1']
+    assert keys(index.search("")) == ['PRA-1', 'PRA-2', 'PRB-10']
+
+
+def test_search_never_stacks_on_previous_result():
+    index = FilterIndex(make_tickets())
+    assert keys(index.search("alice")) == ['PRA-1', 'PRB-10']
+    assert keys(index.search("bob")) == ['PRA-2', 'PRB-10']
+    assert keys(index.search("bob ")) == []
+
+
+def test_match_does_not_span_fields():
+    index = FilterIndex(make_tickets())
+    assert index.search("pra-1alpha") == []
+
+
+def test_refine_narrows_previous_result():
+    index = FilterIndex(make_tickets())
+    index.search("alice")
+    assert keys(index.refine("done")) == ['PRB-10']
+    assert keys(index.search("alpha")) == ['PRA-1', 'PRA-2']
+
+
+def test_upsert_patches_and_inserts_without_rebuilding():
+    index = FilterIndex(make_tickets())
+    assert keys(index.search("done")) == ['PRB-10']
+    index.upsert(Ticket('PRA-2', 'Alpha', 'Refactor progress bar', None, 'Bob', 'Done'))
+    index.upsert(Ticket('PRC-1', 'Gamma', 'New ticket', None, 'Carol', 'Done'))
+    assert keys(index.search("done")) == ['PRC-1', 'PRA-2', 'PRB-10']
+    assert keys(index.search("open")) == []
+    assert keys(index.search("")) == ['PRC-1', 'PRA-1', 'PRA-2', 'PRB-10']
@@ -0,0 +1,140 @@
+import contextlib
+import pytest
+from jiraclui.filter_engine import FilterIndex
+from jiraclui.filter_query import is_structured, to_jql
+from jiraclui.jira_board import JiraBoard
+from jiraclui.ticket import Ticket
+
+
+def make_tickets():
+    return [
+        Ticket('PRA-1', 'Alpha', 'Fix login page', 'Alice', 'bot', 'In Progress', project_key='PRA', issue_type='Bug'),
+        Ticket('PRA-2', 'Alpha', 'Refactor progress bar', None, 'Bob', 'Open', project_key='PRA', issue_type='Task'),
+        Ticket('PRA-15', 'Alpha', 'Login timeout', 'Bob', 'Alice', 'Reopened', project_key='PRA', issue_type='Bug'),
+        Ticket('PRB-10', 'Beta', 'Time out on export', 'Alice', 'Carol', 'In Progress', project_key='PRB', issue_type='Story'),
+    ]
+
+
+def keys(tickets):
+    return [ticket.ticket_no for ticket in tickets]
+
+
+def search(query, current_user=lambda: 'Alice'):
+    return keys(FilterIndex(make_tickets()).search(query, current_user))
+
+
+def test_plain_text_is_not_a_query():
+    assert not is_structured("in progress")
+    assert not is_structured("PRA-12")
+    assert is_structured('status:open')
+    assert is_structured('-bot')
+    assert is_structured('(Status:open')
+    assert not is_structured('error: timeout')
+    assert not is_structured('"timeout" error: retry')
+    assert not is_structured('fix (login')
+    assert search('error: timeout') == []
+    assert search('timeout') == ['PRA-15']
+
+
+def test_field_terms_negation_and_me():
+    assert search('status:"In Progress" assignee:me -reporter:bot') == ['PRB-10']
+    assert search('status:open') == ['PRA-2']
+    assert search('status:*open*') == ['PRA-2', 'PRA-15']
+    assert search('project:prb') == ['PRB-10']
+    assert search('assignee:me', current_user=lambda: None) == []
+    assert search('title:login -type:bug') == []
+
+
+def test_or_parentheses_and_regex():
+    assert search('(status:open OR status:reopened) type:task') == ['PRA-2']
+    assert search('status:open OR assignee:Bob') == ['PRA-2', 'PRA-15']
+    assert search('title:/time ?out/') == ['PRA-15', 'PRB-10']
+    assert search('/^carol$/') == ['PRB-10']
+
+
+def test_key_ranges_and_exact_keys():
+    assert search('key:PRA-2..PRA-15') == ['PRA-2', 'PRA-15']
+    assert search('key:pra-2..') == ['PRA-2', 'PRA-15']
+    assert search('key:PRA-1') == ['PRA-1']
+    assert search('key:PRA-1*') == ['PRA-1', 'PRA-15']
+
+
+def test_invalid_queries_raise_value_error():
+    for query in ('status:', 'status:open colour:red', '(status:open', 'title:/[/', 'key:PRA-1..PRB-2'):
+        with pytest.raises(ValueError):
+            FilterIndex(make_tickets()).search(query)
+
+
+def test_column_indexes_follow_upserts_and_refine():
+    index = FilterIndex(make_tickets())
+    index.upsert(Ticket('PRA-2', 'Alpha', 'Refactor progress bar', None, 'Bob', 'Done', project_key='PRA', issue_type='Task'))
+    index.upsert(Ticket('PRA-30', 'Alpha', 'New one', 'Alice', 'Bob', 'Open', project_key='PRA', issue_type='Bug'))
+    assert keys(index.search('status:open')) == ['PRA-30']
+    assert keys(index.search('status:done OR key:PRA-16..')) == ['PRA-30', 'PRA-2']
+    index.search('alice')
+    assert keys(index.refine('-status:"in progress"')) == ['PRA-30', 'PRA-15']
+
+
+def test_upserts_after_a_structured_query_update_the_column_indexes():
+    index = FilterIndex(make_tickets())
+    assert keys(index.search('status:open')) == ['PRA-2']
+    index.upsert(Ticket('PRA-2', 'Alpha', 'Refactor progress bar', None, 'Bob', 'Done', project_key='PRA', issue_type='Task'))
+    index.upsert(Ticket('PRA-30', 'Alpha', 'New one', 'Alice', 'Bob', 'Open', project_key='PRA', issue_type='Bug'))
+    assert keys(index.search('status:open')) == ['PRA-30']
+    assert keys(index.search('key:PRA-10..PRA-40')) == ['PRA-30', 'PRA-15']
+
+
+def test_queries_are_pushed_down_as_jql():
+    assert to_jql('alice') == 'text ~ "alice*"'
+    assert to_jql('status:"In Progress" assignee:me -reporter:bot') == (
+        '(status = "In Progress") AND (assignee = currentUser()) AND (NOT (reporter = "bot") OR reporter is EMPTY)')
+    assert to_jql('-status:done -assignee:""') == '(NOT (status = "done")) AND (NOT (assignee is EMPTY))'
+    assert to_jql('-(assignee:bob status:open)') is None
+    assert to_jql('key:PRA-10..') == '(project = "PRA" AND key >= "PRA-10")'
+    assert to_jql('type:bug* title:deploy') == '(summary ~ "deploy*")'
+    assert to_jql('status:open OR title:/x/') is None
+    assert to_jql('-title:deploy') is None
+
+
+def test_people_are_matched_locally_on_jira_cloud():
+    assert to_jql('assignee:Alice status:open', cloud=True) == '(status = "open")'
+    assert to_jql('assignee:me -reporter:bot', cloud=True) == '(assignee = currentUser())'
+
+
+class SearchClient:
+    def __init__(self, tickets):
+        self.tickets = tickets
+        self.searches = []
+
+    def track(self, command):
+        return contextlib.nullcontext()
+
+    def is_cloud(self):
+        return False
+
+    def current_user_name(self):
+        return 'Alice'
+
+    def search_tickets(self, project_names, users, condition, limit=None):
+        self.searches.append((project_names, condition))
+        return self.tickets
+
+
+def test_truncated_boards_push_filters_down_and_cache_them(tmp_path):
+    remote = [Ticket('PRA-99', 'Alpha', 'Login fails', 'Alice', 'Bob', 'Open', project_key='PRA'),
+              Ticket('PRA-98', 'Alpha', 'Unrelated', 'Bob', 'Bob', 'Open', project_key='PRA'),
+              Ticket('PRA-1', 'Alpha', 'Fix login page', 'Alice', 'bot', 'In Progress', project_key='PRA')]
+    client = SearchClient(remote)
+    app_options = {'cache_dir': str(tmp_path), 'max_table_entry': 3, 'board_page_size': 20}
+    board = JiraBoard(make_tickets(), "https://jira.example.com", "token", ['PRA', 'PRB'], [], True,
+                      app_options, render=False, jira_client=client)
+    board.display_board = lambda: None
+
+    assert board.truncated_projects() == ['PRA']
+    board.update_filter_text('login')
+    assert keys(board.filtered_data) == ['PRA-1', 'PRA-15', 'PRA-99']
+    assert board.remote_matches == [remote[0]]
+    board.update_filter_text('login')
+    assert client.searches == [(['PRA'], '(text ~ "login*")')]
+    board.update_filter_text('title:/login/')
+    assert len(client.searches) == 1
@@ -0,0 +1,161 @@
+import io
+import pytest
+from rich.console import Console
+
+pytest.importorskip("jira")
+from jiraclui import jira_board  # noqa: E402
+from jiraclui.jira_board import RESERVED_LINES, JiraBoard  # noqa: E402
+from jiraclui.offline import OfflineClient  # noqa: E402
+from jiraclui.ticket import Ticket  # noqa: E402
+from jiraclui.ticket_store import TicketStore  # noqa: E402
+
+
+def make_board(tmp_path, tickets, users=(), **app_options):
+    app_options = dict(app_options, cache_dir=str(tmp_path))
+    client = OfflineClient(TicketStore(str(tmp_path / "tickets.db")), "https://jira.example.com", "token", app_options)
+    board = JiraBoard(tickets, "https://jira.example.com", "token", ['PRA'], list(users), False, app_options,
+                      render=False, jira_client=client)
+    board.console = Console(file=io.StringIO(), width=120)
+    return board
+
+
+def test_filtering_keeps_the_rendered_rows_of_the_board(tmp_path):
+    tickets = [Ticket(f'PRA-{number}', 'Project A', f'Title {number}', 'Alice' if number % 2 else 'Bob', 'Carol', 'Open',
+                      project_key='PRA', issue_type='Task') for number in range(1, 7)]
+    board = make_board(tmp_path, tickets, board_page_size=10)
+    board.build_table()
+    view = board.view
+    cells = view.rendered['PRA-1'][1]
+
+    board.update_filter_text('alice')
+    board.update_filter_text('')
+
+    assert board.view is view
+    assert view.rendered['PRA-1'][1] is cells
+
+
+def test_truncated_projects_are_found_from_store_tickets(tmp_path):
+    store = TicketStore(str(tmp_path / "store.db"))
+    scope = TicketStore.scope_for('PRA', [])
+    store.merge_tickets(scope, [Ticket(f'PRA-{number}', 'Project A', f'Title {number}', None, 'Carol', 'Open',
+                                       created=f'2026-10-0{number}', project_key='PRA', issue_type='Task')
+                                for number in range(1, 4)], 0, full_sync=True)
+    tickets = store.get_tickets(scope)
+
+    assert make_board(tmp_path, tickets, max_table_entry=3).truncated_projects() == ['PRA']
+    assert make_board(tmp_path, tickets, max_table_entry=4).truncated_projects() == []
+
+
+def make_ticket(key, assignee='Alice', status='Open'):
+    project_key = key.split('-')[0]
+    return Ticket(key, f'Project {project_key[-1]}', f'Title of {key}', assignee, 'Carol', status,
+                  project_key=project_key, issue_type='Task')
+
+
+def test_written_tickets_only_join_the_board_if_its_query_returns_them(tmp_path):
+    board = make_board(tmp_path, [make_ticket('PRA-1')], users=['alice.smith@example.com'], board_page_size=10)
+
+    board.upsert_ticket(make_ticket('PRA-1', status='Done'))
+    board.upsert_ticket(make_ticket('PRB-7'))
+    board.upsert_ticket(make_ticket('PRA-8', assignee='Bob'))
+    board.upsert_ticket(make_ticket('PRA-9', assignee='Alice Smith'))
+
+    assert [(ticket.ticket_no, ticket.status) for ticket in board.original_data] == [('PRA-9', 'Open'), ('PRA-1', 'Done')]
+
+
+def test_pages_are_clamped_and_keys_are_found_on_later_pages(tmp_path):
+    board = make_board(tmp_path, [make_ticket(f'PRA-{number}') for number in range(1, 13)], board_page_size=5)
+    board.build_table()
+    assert board.page_count() == 3
+
+    board.previous_page()
+    assert board.page == 0 and [ticket.ticket_no for ticket in board.view.tickets][0] == 'PRA-1'
+    for _ in range(4):
+        board.next_page()
+    assert board.page == 2
+    assert [ticket.ticket_no for ticket in board.view.tickets] == ['PRA-11', 'PRA-12']
+    assert board.view.caption == "Rows 11-12 of 12, page 3/3"
+
+    board.show_page(0)
+    assert board.jump_to_key(' pra-7 ')
+    assert board.page == 1 and board.view.highlight_key == 'PRA-7'
+    assert not board.jump_to_key('PRA-99')
+    assert board.page == 1 and board.view.highlight_key == 'PRA-7'
+    board.next_page()
+    assert board.view.highlight_key is None
+
+
+def test_the_page_size_follows_the_terminal_height(tmp_path):
+    board = make_board(tmp_path, [make_ticket('PRA-1')])
+    board.console = Console(file=io.StringIO(), width=120, height=40)
+    assert board.page_size() == 40 - RESERVED_LINES
+    board.console = Console(file=io.StringIO(), width=120, height=3)
+    assert board.page_size() == 5
+
+
+class RecordingLive:
+    """Stands in for rich's Live, recording the rows and caption of the table at every refresh."""
+
+    frames = []
+
+    def __init__(self, table, **kwargs):
+        self.table = table
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def refresh(self):
+        rows = [cell for cell in self.table.columns[0].cells]
+        RecordingLive.frames.append((rows, self.table.caption))
+
+
+def test_progressive_loads_show_rows_as_pages_arrive(tmp_path, monkeypatch):
+    monkeypatch.setattr(jira_board, "Live", RecordingLive)
+    RecordingLive.frames = []
+    tickets = [make_ticket(f'PRA-{number}') for number in range(1, 5)]
+    synced = tickets + [make_ticket('PRA-5')]
+
+    def load_tickets(on_page):
+        on_page('PRA', tickets[:2], False)
+        on_page('PRA', tickets[2:], True)
+        on_page('PRB', [], True)
+        return synced
+
+    board = make_board(tmp_path, [], board_page_size=3)
+    board.project_names = ['PRA', 'PRB']
+    assert board.load_progressively(load_tickets) == synced
+
+    assert [rows for rows, _ in RecordingLive.frames] == [[], ['PRA-1', 'PRA-2'], ['PRA-1', 'PRA-2', 'PRA-3'],
+                                                          ['PRA-1', 'PRA-2', 'PRA-3']]
+    assert RecordingLive.frames[3][1] == "Loading tickets... 4 received, 2/2 projects done"
+    assert board.original_data == synced and board.filtered_data == synced
+    assert [ticket.ticket_no for ticket in board.view.tickets] == ['PRA-1', 'PRA-2', 'PRA-3']
+
+
+def test_progressive_loads_show_cached_rows_until_the_sync_ends(tmp_path, monkeypatch):
+    monkeypatch.setattr(jira_board, "Live", RecordingLive)
+    RecordingLive.frames = []
+    cached = [make_ticket('PRA-1', status='Open')]
+    synced = [make_ticket('PRA-2'), make_ticket('PRA-1', status='Done')]
+
+    def load_tickets(on_page):
+        on_page('PRA', synced, True)
+        return synced
+
+    board = make_board(tmp_path, [], board_page_size=3)
+    board.load_progressively(load_tickets, cached)
+
+    assert [rows for rows, _ in RecordingLive.frames] == [['PRA-1'], ['PRA-1']]
+    assert [(ticket.ticket_no, ticket.status) for ticket in board.view.tickets] == [('PRA-2', 'Open'), ('PRA-1', 'Done')]
+
+
+def test_a_refinement_without_a_filter_is_a_new_filter(tmp_path):
+    board = make_board(tmp_path, [make_ticket('PRA-1', assignee='Alice'), make_ticket('PRA-2', assignee='Bob')])
+
+    board.update_filter_text('+bob')
+    assert board.filter_text == 'bob' and [ticket.ticket_no for ticket in board.filtered_data] == ['PRA-2']
+    board.update_filter_text('+title')
+    assert board.filter_refinements == ['title'] and [ticket.ticket_no for ticket in board.filtered_data] == ['PRA-2']
@@ -0,0 +1,336 @@
+import json
+import threading
+import time
+from types import SimpleNamespace
+import pytest
+import requests
+from jiraclui.cache import TTLCache
+from jiraclui.create_meta import CreateMetaCache
+from jiraclui.manifest import load_manifest
+from jiraclui.ticket import Ticket
+from jiraclui.ticket_store import TicketStore
+from jiraclui.transition_cache import TransitionCache
+
+pytest.importorskip("jira")
+from jira.exceptions import JIRAError  # noqa: E402
+from jiraclui.jira_client import JiraClient  # noqa: E402
+
+
+class FakeJira:
+    def __init__(self, rejected=(), rejection=(400, "Transition id '31' is not valid for this issue.")):
+        self.rejected = set(rejected)
+        self.rejection = rejection
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def transitions(self, ticket_no):
+        with self.lock:
+            self.calls.append(('transitions', ticket_no))
+        return [{'id': '31', 'name': 'Close', 'to': {'name': 'Done'}}]
+
+    def transition_issue(self, ticket_no, transition_id):
+        with self.lock:
+            self.calls.append(('transition', ticket_no))
+        if ticket_no in self.rejected:
+            raise JIRAError(status_code=self.rejection[0], text=self.rejection[1])
+
+
+def make_client(tmp_path, jira, **app_options):
+    client = JiraClient.__new__(JiraClient)
+    client.app_options = app_options
+    client.jira = jira
+    client.connection = SimpleNamespace(
+        transition_cache=TransitionCache(str(tmp_path / "transitions.json"), 3600),
+        detail_cache=TTLCache(16, 60),
+    )
+    return client
+
+
+def make_ticket(key, status='Open'):
+    return Ticket(key, 'Project A', 'Title', 'Alice', 'Bob', status, project_key='PRA', issue_type='Task')
+
+
+def test_ticket_details_are_cached_under_the_canonical_key(tmp_path):
+    issues = []
+    fields = SimpleNamespace(project=SimpleNamespace(name='Project A', key='PRA'), summary='Title', description=None,
+                             assignee=None, reporter=None, status=SimpleNamespace(name='Open'),
+                             issuetype=SimpleNamespace(name='Task'), created=None, updated=None)
+    jira = SimpleNamespace(issue=lambda key: issues.append(key) or SimpleNamespace(key=key.upper(), fields=fields))
+    client = make_client(tmp_path, jira)
+
+    assert client.get_ticket_details(' pra-1').ticket_no == 'PRA-1'
+    client.get_ticket_details('PRA-1')
+    assert issues == ['PRA-1']
+    # A transition drops the entry by the ticket's own key, which must also refresh lower-case lookups.
+    client.connection.detail_cache.invalidate('PRA-1')
+    client.get_ticket_details('pra-1')
+    assert issues == ['PRA-1', 'PRA-1']
+
+
+def test_bulk_transition_looks_up_each_workflow_state_once(tmp_path):
+    jira = FakeJira(rejected={'PRA-3'})
+    client = make_client(tmp_path, jira, bulk_workers=4)
+    tickets = [make_ticket(f'PRA-{number}') for number in range(1, 21)]
+    reported = []
+
+    results = client.bulk_transition(tickets, 'done', reported.append)
+
+    assert [result['ticket_no'] for result in results] == [ticket.ticket_no for ticket in tickets]
+    assert [result['ticket_no'] for result in results if 'error' in result] == ['PRA-3']
+    assert results[0]['ticket'].status == 'Done' and results[0]['transition'] == 'Close'
+    assert len(reported) == 20
+    # One transitions lookup, then one transition request per ticket, plus the retry of PRA-3 with fresh transitions.
+    assert [call for call in jira.calls if call[0] == 'transitions'] == [('transitions', 'PRA-1'), ('transitions', 'PRA-3')]
+    assert len([call for call in jira.calls if call[0] == 'transition']) == 21
+
+
+@pytest.mark.parametrize("rejection", [(403, "Forbidden"), (400, "Field 'resolution' is required")])
+def test_only_stale_cached_transitions_are_looked_up_again(tmp_path, rejection):
+    jira = FakeJira(rejected={'PRA-1'}, rejection=rejection)
+    client = make_client(tmp_path, jira)
+    ticket = make_ticket('PRA-1')
+    cache = client.connection.transition_cache
+    cache.put(cache.key_for(ticket), [{'id': '31', 'name': 'Close', 'to': 'Done'}])
+
+    with pytest.raises(JIRAError) as error:
+        client.transition_ticket(ticket, 'done')
+    assert error.value.status_code == rejection[0]
+    assert jira.calls == [('transition', 'PRA-1')]
+    assert cache.get(cache.key_for(ticket)) is not None
+
+
+def test_cached_transitions_are_dropped_when_they_cannot_be_checked_again(tmp_path):
+    class UnreachableJira(FakeJira):
+        def transitions(self, ticket_no):
+            raise JIRAError(status_code=503, text="Service Unavailable")
+
+    client = make_client(tmp_path, UnreachableJira(rejected={'PRA-1'}))
+    ticket = make_ticket('PRA-1')
+    cache = client.connection.transition_cache
+    cache.put(cache.key_for(ticket), [{'id': '31', 'name': 'Close', 'to': 'Done'}])
+
+    with pytest.raises(JIRAError):
+        client.transition_ticket(ticket, 'done')
+    assert cache.get(cache.key_for(ticket)) is None
+
+
+class FakeCreateJira:
+    def __init__(self, bulk_status=None, bulk_error=None):
+        self.bulk_status = bulk_status
+        self.bulk_error = bulk_error
+        self.bulk_calls = []
+        self.single_calls = 0
+        self.lock = threading.Lock()
+        self._is_cloud = False
+        self._version = (8, 20, 0)
+
+    def create_issues(self, field_list, prefetch=True):
+        assert prefetch is False
+        if self.bulk_status:
+            raise JIRAError(status_code=self.bulk_status, text="Not found")
+        if self.bulk_error:
+            raise self.bulk_error
+        self.bulk_calls.append(len(field_list))
+        return [{'status': 'Error', 'error': {'summary': 'too long'}, 'issue': None} if fields['summary'] == 'bad'
+                else {'status': 'Success', 'issue': SimpleNamespace(key=f"PRA-{fields['summary']}")}
+                for fields in field_list]
+
+    def create_issue(self, fields, prefetch=True):
+        with self.lock:
+            self.single_calls += 1
+        return SimpleNamespace(key=f"PRA-{fields['summary']}")
+
+    def _get_json(self, path, params=None):
+        if path.endswith('/issuetypes'):
+            return {'values': [{'id': '3', 'name': 'Task'}], 'isLast': True}
+        return {'values': [
+            {'fieldId': 'summary', 'name': 'Summary', 'required': True, 'schema': {'type': 'string'}},
+            {'fieldId': 'priority', 'name': 'Priority', 'required': False, 'schema': {'type': 'priority'},
+             'allowedValues': [{'name': 'High'}, {'name': 'Low'}]},
+            {'fieldId': 'labels', 'name': 'Labels', 'required': False, 'schema': {'type': 'array', 'items': 'string'}},
+            {'fieldId': 'duedate', 'name': 'Due Date', 'required': False, 'schema': {'type': 'date'}},
+        ], 'isLast': True}
+
+
+def make_create_client(tmp_path, jira, **app_options):
+    client = make_client(tmp_path, jira, **app_options)
+    client.connection.create_meta_cache = CreateMetaCache(str(tmp_path / "createmeta.json"), 3600)
+    return client
+
+
+def test_manifests_are_validated_against_cached_create_metadata(tmp_path):
+    manifest = tmp_path / "release.yaml"
+    manifest.write_text(
+        "defaults: {project: pra, type: task}\n"
+        "issues:\n"
+        "  - {id: login, summary: Fix login, priority: high, labels: 'release, web'}\n"
+        "  - {summary: Notes, priority: Urgent, colour: red}\n"
+        "  - {description: No summary}\n"
+        "  - {summary: Ship, due: 2026-10-20}\n")
+    client = make_create_client(tmp_path, FakeCreateJira())
+
+    prepared, errors = client.prepare_manifest(load_manifest(str(manifest)))
+
+    assert prepared[0] == ('login', {'project': {'key': 'PRA'}, 'issuetype': {'id': '3'}, 'summary': 'Fix login',
+                                     'priority': {'name': 'High'}, 'labels': ['release', 'web']})
+    assert [error.split(':')[0] for error in errors] == ['2', '2', '3', '3']
+    # YAML reads the due date as a date, it is sent as a JSON string.
+    assert json.loads(json.dumps(prepared[-1][1]))['duedate'] == '2026-10-20'
+    assert "missing required field 'Summary'" in errors[-1]
+    assert client.connection.create_meta_cache.get('PRA|3')['priority']['allowed'] == ['High', 'Low']
+
+
+def test_create_tickets_in_chunks_and_falls_back_to_concurrent_creates(tmp_path):
+    field_list = [{'summary': str(number)} for number in range(1, 6)] + [{'summary': 'bad'}]
+    jira = FakeCreateJira()
+    results = make_create_client(tmp_path, jira, bulk_create_chunk=4).create_tickets(field_list)
+    assert jira.bulk_calls == [4, 2]
+    assert [result.get('key') for result in results] == ['PRA-1', 'PRA-2', 'PRA-3', 'PRA-4', 'PRA-5', None]
+    assert results[-1]['error'] == 'summary: too long'
+
+    jira = FakeCreateJira(bulk_status=404)
+    results = make_create_client(tmp_path, jira, bulk_create_chunk=4).create_tickets(field_list[:5])
+    assert jira.single_calls == 5
+    assert [result['key'] for result in results] == ['PRA-1', 'PRA-2', 'PRA-3', 'PRA-4', 'PRA-5']
+
+    jira = FakeCreateJira(bulk_error=TypeError("Object of type date is not JSON serializable"))
+    results = make_create_client(tmp_path, jira, bulk_create_chunk=4).create_tickets(field_list[:5])
+    assert [result['error'] for result in results] == ["Object of type date is not JSON serializable"] * 5
+
+
+class FakeSearchJira:
+    def __init__(self, total):
+        self.total = total
+        self.requests = []
+        self._is_cloud = False
+
+    def search_issues(self, jql_query, startAt, maxResults, fields, json_result, validate_query):
+        self.requests.append((startAt, fields))
+        issues = [{'key': f'PRA-{number}', 'fields': {'status': {'name': 'Open'}}}
+                  for number in range(startAt + 1, min(startAt + maxResults, self.total) + 1)]
+        return {'issues': issues, 'total': self.total}
+
+
+class SlowProjectsJira:
+    """Jira Server search answering each project after its own delay, counting the searches in flight."""
+
+    def __init__(self, delays):
+        self.delays = delays
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.finished = []
+        self._is_cloud = False
+
+    def search_issues(self, jql_query, startAt, maxResults, fields, json_result, validate_query):
+        project = jql_query.split('=')[1].split()[0]
+        with self.lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(self.delays[project])
+        with self.lock:
+            self.in_flight -= 1
+            self.finished.append(project)
+        issues = [{'key': f'{project}-{number}', 'fields': {
+            'project': {'key': project, 'name': project}, 'summary': 'Title', 'status': {'name': 'Open'}}}
+            for number in (2, 1)]
+        return {'issues': issues, 'total': 2}
+
+
+class FakeCloudSearchJira:
+    """Jira Cloud search: token paging, no total, and startAt rejected."""
+
+    def __init__(self, total):
+        self.total = total
+        self.tokens = []
+        self._is_cloud = True
+
+    def search_issues(self, *args, **kwargs):
+        raise JIRAError("The `search` API is deprecated in Jira Cloud.")
+
+    def enhanced_search_issues(self, jql_query, nextPageToken, maxResults, fields, json_result):
+        self.tokens.append(nextPageToken)
+        start_at = int(nextPageToken or 0)
+        end = min(start_at + maxResults, self.total)
+        page = {'issues': [{'key': f'PRA-{number}', 'fields': {}} for number in range(start_at + 1, end + 1)],
+                'isLast': end >= self.total}
+        if end < self.total:
+            page['nextPageToken'] = str(end)
+        return page
+
+
+def test_projects_are_fetched_concurrently_and_merged_in_configured_order(tmp_path):
+    jira = SlowProjectsJira({'PRA': 0.15, 'PRB': 0.1, 'PRC': 0.0, 'PRD': 0.0})
+    client = make_client(tmp_path, jira, fetch_workers=2, max_table_entry=10)
+
+    tickets = client.get_jira_tickets(['PRA', 'PRB', 'PRC', 'PRD'], [])
+
+    assert jira.finished.index('PRA') > jira.finished.index('PRC')
+    assert jira.max_in_flight == 2
+    assert [ticket.ticket_no for ticket in tickets] == [
+        'PRA-2', 'PRA-1', 'PRB-2', 'PRB-1', 'PRC-2', 'PRC-1', 'PRD-2', 'PRD-1']
+
+
+def test_cloud_searches_follow_page_tokens_until_the_last_page(tmp_path):
+    jira = FakeCloudSearchJira(250)
+    client = make_client(tmp_path, jira, page_size=100)
+
+    assert [len(page) for page in client.iter_search_pages('project = PRA')] == [100, 100, 50]
+    assert jira.tokens == [None, '100', '200']
+    assert sum(len(page) for page in client.iter_search_pages('project = PRA', limit=150)) == 150
+
+
+class PageCountingWriter:
+    def __init__(self):
+        self.pages = []
+
+    def write_rows(self, rows):
+        self.pages.append(len(list(rows)))
+
+
+def test_export_streams_every_page_to_the_writer(tmp_path):
+    jira = FakeSearchJira(250)
+    writer = PageCountingWriter()
+
+    count = make_client(tmp_path, jira, page_size=100).export_tickets('project = PRA', writer, ['key', 'status'])
+
+    assert count == 250
+    assert writer.pages == [100, 100, 50]
+    assert jira.requests == [(0, 'key,status'), (100, 'key,status'), (200, 'key,status')]
+
+
+def test_today_tickets_report_connection_errors(tmp_path):
+    client = make_client(tmp_path, FakeSearchJira(0))
+
+    def current_user():
+        raise requests.exceptions.ConnectionError("Connection refused")
+    client.connection.current_user = current_user
+
+    assert client.get_opened_or_updated_tickets_today(['PRA']) == {
+        'error': "Error retrieving opened or updated tickets: Connection refused"}
+
+
+def test_a_second_sync_sends_one_delta_search_and_patches_the_store(tmp_path, jira_server):
+    from jiraclui.connection import JiraConnection
+    client = JiraClient(jira_server.url, 'token', {'cache_dir': str(tmp_path), 'max_table_entry': 50, 'fetch_workers': 1})
+    store = TicketStore(str(tmp_path / "tickets.db"))
+    try:
+        first = client.sync_jira_tickets(store, ['PRA', 'PRB'], [])
+        full_queries = list(jira_server.queries)
+        jira_server.summaries['PRB-2'] = 'Renamed'
+        jira_server.changed = {'PRB-2'}
+
+        second = client.sync_jira_tickets(store, ['PRA', 'PRB'], [])
+        stored = store.get_tickets(TicketStore.scope_for('PRB', []))
+    finally:
+        JiraConnection.close_all()
+        store.close()
+
+    assert sorted(ticket.ticket_no for ticket in first) == ['PRA-1', 'PRA-2', 'PRA-3', 'PRB-1', 'PRB-2', 'PRB-3']
+    assert len(full_queries) == 2 and not any('updated' in query for query in full_queries)
+    # The overlap is added to the minutes since the last sync, here none.
+    assert jira_server.queries[2:] == [
+        '((project=PRA AND updated >= "-2m") OR (project=PRB AND updated >= "-2m"))']
+    assert sorted(ticket.ticket_no for ticket in second) == sorted(ticket.ticket_no for ticket in first)
+    assert {ticket.ticket_no: ticket.title for ticket in second}['PRB-2'] == 'Renamed'
+    assert len(stored) == 3
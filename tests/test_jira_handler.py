@@ -0,0 +1,77 @@
+import contextlib
+import time
+import pytest
+import requests
+
+pytest.importorskip("jira")
+from jiraclui import jira_handler  # noqa: E402
+from jiraclui.jira_handler import JiraBoardManager  # noqa: E402
+from jiraclui.offline import OfflineClient  # noqa: E402
+from jiraclui.ticket import Ticket  # noqa: E402
+from jiraclui.ticket_store import TicketStore  # noqa: E402
+
+API_URL = "https://jira.example.com"
+
+
+def store_snapshot(tmp_path):
+    today = time.strftime('%Y-%m-%d')
+    store = TicketStore(TicketStore.path_for(str(tmp_path), API_URL))
+    store.merge_tickets(TicketStore.scope_for('PRA', []), [
+        Ticket('PRA-2', 'Project A', 'Made today', 'Alice', 'Bob', 'Open', created=f'{today}T09:00:00.000+0000',
+               updated=f'{today}T09:00:00.000+0000', project_key='PRA', issue_type='Task'),
+        Ticket('PRA-1', 'Project A', 'Made last year', 'Alice', 'Bob', 'Done', created='2025-01-01T09:00:00.000+0000',
+               updated='2025-01-02T09:00:00.000+0000', project_key='PRA', issue_type='Task'),
+    ], time.time() - 3600, full_sync=True)
+    store.close()
+
+
+class UnreachableClient:
+    def __init__(self, *args):
+        raise requests.exceptions.ConnectionError("Connection refused")
+
+
+class FailingLoadClient:
+    def __init__(self, *args):
+        pass
+
+    def track(self, command):
+        return contextlib.nullcontext()
+
+    def sync_jira_tickets(self, *args):
+        raise requests.exceptions.ConnectTimeout("Connect timeout")
+
+
+@pytest.mark.parametrize("client_class", [UnreachableClient, FailingLoadClient])
+def test_an_unreachable_jira_falls_back_to_the_offline_snapshot(tmp_path, monkeypatch, capsys, client_class):
+    store_snapshot(tmp_path)
+    monkeypatch.setattr(jira_handler, "JiraClient", client_class)
+
+    manager = JiraBoardManager(['PRA'], [], API_URL, "token", {'cache_dir': str(tmp_path), 'board_page_size': 10})
+
+    assert manager.offline and isinstance(manager.jira_client, OfflineClient)
+    assert "Jira is unreachable, showing offline data" in capsys.readouterr().out
+    assert [ticket.ticket_no for ticket in manager.jira_board.original_data] == ['PRA-2', 'PRA-1']
+    assert manager.jira_board.caption.startswith("Offline: data from ") and manager.jira_board.caption.endswith("(1 hour ago)")
+
+    manager.get_today_tickets()
+    assert [ticket.ticket_no for ticket in manager.jira_board.original_data] == ['PRA-2']
+
+    monkeypatch.setattr(manager.console, "input", lambda prompt: "pra-1")
+    monkeypatch.setattr("builtins.input", lambda prompt: "n")
+    manager.display_ticket_details()
+    assert "Made last year" in capsys.readouterr().out
+
+
+def test_refreshes_and_views_reuse_the_board_and_its_rendered_rows(tmp_path):
+    store_snapshot(tmp_path)
+    manager = JiraBoardManager(['PRA'], [], API_URL, "token", {'cache_dir': str(tmp_path), 'offline': True})
+    board = manager.jira_board
+    cells = board.view.rendered['PRA-2'][1]
+
+    manager.jira_board.update_filter_text('last year')
+    manager.get_today_tickets()
+    manager.get_all_tickets()
+
+    assert manager.jira_board is board and board.filter_text == ""
+    assert [ticket.ticket_no for ticket in board.original_data] == ['PRA-2', 'PRA-1']
+    assert board.view.rendered['PRA-2'][1] is cells
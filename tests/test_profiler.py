@@ -0,0 +1,46 @@
+import json
+import pytest
+from jiraclui.profiler import PROFILER, Profiler, endpoint_of, projects_of
+
+requests = pytest.importorskip("requests")
+
+from jiraclui.transport import ReplayAdapter  # noqa: E402
+
+SEARCH_URL = "https://jira.example.com/rest/api/2/search"
+
+
+def test_endpoints_and_projects_of_requests():
+    assert endpoint_of("POST", "https://jira.example.com/rest/api/2/issue/PRA-12/transitions?expand=x") == \
+        "POST /rest/api/2/issue/{key}/transitions"
+    assert endpoint_of("GET", "https://jira.example.com/rest/api/2/issue/10042") == "GET /rest/api/2/issue/{id}"
+    assert projects_of(f"{SEARCH_URL}?jql=project%3DPRA+AND+status%3DOpen") == "PRA"
+    assert projects_of(SEARCH_URL, json.dumps({'jql': 'project in (PRA, "PRB") ORDER BY created'})) == "PRA,PRB"
+    assert projects_of(f"{SEARCH_URL}?jql=key+in+(PRA-1)") is None
+
+
+def test_profiled_requests_and_phases_are_summarised(tmp_path, monkeypatch):
+    cassette = tmp_path / "cassette.json"
+    cassette.write_text(json.dumps({'interactions': [{
+        'request': f"GET {SEARCH_URL}?jql=project%3DPRA ", 'status': 200,
+        'headers': {'Content-Type': 'application/json'}, 'body': '{"total": 0}', 'elapsed': 0.0,
+    }]}))
+    adapter = ReplayAdapter(2, str(cassette))
+    session = requests.Session()
+    session.mount("https://", adapter)
+    profiler = Profiler()
+    profiler.enabled = True
+    monkeypatch.setattr(PROFILER, 'enabled', True)
+    monkeypatch.setattr(PROFILER, 'record_request', profiler.record_request)
+
+    with adapter.track('refresh'), profiler.phase('fetch', 'PRA'):
+        session.get(f"{SEARCH_URL}?jql=project%3DPRA")
+        session.get(f"{SEARCH_URL}?jql=project%3DPRA")
+    summary = profiler.summary()
+
+    assert summary['requests'] == 2 and summary['bytes_in'] == 24
+    assert summary['endpoints']['GET /rest/api/2/search']['count'] == 2
+    assert summary['commands']['refresh']['count'] == 2
+    assert summary['projects']['PRA']['errors'] == 0
+    assert summary['phases']['fetch[PRA]']['count'] == 1
+    profiler.report(str(tmp_path / "profile.json"))
+    assert json.loads((tmp_path / "profile.json").read_text())['requests'] == 2
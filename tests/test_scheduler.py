@@ -0,0 +1,105 @@
+import io
+import socket
+import time
+import pytest
+
+requests = pytest.importorskip("requests")
+
+from jiraclui.rate_limit import TokenBucket  # noqa: E402
+from jiraclui.scheduler import RequestScheduler, retry_after_seconds  # noqa: E402
+from jiraclui.transport import create_transport  # noqa: E402
+
+
+def make_request(method="GET"):
+    return requests.Request(method, "https://jira.example.com/rest/api/2/search").prepare()
+
+
+def make_response(status, headers=None):
+    response = requests.models.Response()
+    response.status_code = status
+    response.raw = io.BytesIO()
+    response.headers.update(headers or {})
+    return response
+
+
+def attempts(*outcomes):
+    outcomes = list(outcomes)
+    sent = []
+
+    def attempt():
+        sent.append(len(sent))
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+    return attempt, sent
+
+
+def test_throttled_requests_are_retried_after_retry_after():
+    scheduler = RequestScheduler(rate=0, backoff=0.001)
+    attempt, sent = attempts(make_response(429, {'Retry-After': '0.05'}), make_response(503), make_response(200))
+
+    start = time.monotonic()
+    response = scheduler.send(make_request(), attempt)
+
+    assert response.status_code == 200 and len(sent) == 3
+    assert time.monotonic() - start >= 0.05
+
+
+def test_retries_give_up_and_spare_non_idempotent_requests():
+    scheduler = RequestScheduler(rate=0, max_retries=2, backoff=0.001)
+    attempt, sent = attempts(*[make_response(503)] * 3)
+    assert scheduler.send(make_request(), attempt).status_code == 503 and len(sent) == 3
+
+    attempt, sent = attempts(requests.exceptions.ConnectionError("reset"), make_response(200))
+    with pytest.raises(requests.exceptions.ConnectionError):
+        scheduler.send(make_request("POST"), attempt)
+    assert len(sent) == 1
+
+    attempt, sent = attempts(make_response(502), make_response(201))
+    assert scheduler.send(make_request("POST"), attempt).status_code == 502
+
+
+def test_non_idempotent_requests_are_only_retried_when_throttled():
+    scheduler = RequestScheduler(rate=0, backoff=0.001)
+    attempt, sent = attempts(make_response(503), make_response(201))
+    assert scheduler.send(make_request("POST"), attempt).status_code == 503 and len(sent) == 1
+
+    attempt, sent = attempts(make_response(503, {'Retry-After': '0'}), make_response(429), make_response(201))
+    assert scheduler.send(make_request("POST"), attempt).status_code == 201 and len(sent) == 3
+
+
+def test_retry_after_dates_and_token_bucket():
+    assert retry_after_seconds(make_response(429, {'Retry-After': '3'})) == 3
+    assert retry_after_seconds(make_response(429, {'Retry-After': 'Wed, 21 Oct 2015 07:28:00 GMT'})) == 0
+    assert retry_after_seconds(make_response(429)) is None
+
+    bucket = TokenBucket(rate=100, capacity=2)
+    start = time.monotonic()
+    for _ in range(4):
+        bucket.acquire()
+    assert 0.015 <= time.monotonic() - start < 0.5
+
+
+def test_an_unreachable_server_fails_at_once():
+    with socket.socket() as listener:
+        listener.bind(('127.0.0.1', 0))
+        port = listener.getsockname()[1]
+    transport = create_transport({})
+    session = requests.Session()
+    session.mount("http://", transport)
+
+    start = time.monotonic()
+    with pytest.raises(requests.exceptions.ConnectionError):
+        session.get(f"http://127.0.0.1:{port}/rest/api/2/serverInfo", timeout=(5, 30))
+
+    # Refused connections are not retried, so no backoff delays the offline fallback.
+    assert time.monotonic() - start < 0.5
+    assert transport.counts['startup'] == 1
+
+
+def test_read_errors_of_idempotent_requests_are_still_retried():
+    scheduler = RequestScheduler(rate=0, backoff=0.001)
+    attempt, sent = attempts(requests.exceptions.ConnectionError("reset"), requests.exceptions.ReadTimeout(),
+                             make_response(200))
+    assert scheduler.send(make_request(), attempt).status_code == 200 and len(sent) == 3
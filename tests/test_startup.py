@@ -0,0 +1,61 @@
+import json
+import os
+import subprocess
+import sys
+
+HEAVY_MODULES = ("jira", "requests", "oauthlib", "rich", "questionary", "sqlite3")
+
+
+def import_time_report(code):
+    """Run code in a fresh interpreter with -X importtime and return {module: cumulative_us}."""
+    env = dict(os.environ)
+    src_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [src_dir, env.get("PYTHONPATH")]))
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code],
+                            env=env, capture_output=True, text=True, check=False)
+    report = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, module = line[len("import time:"):].split("|")
+        if cumulative.strip().isdigit():
+            report[module.strip()] = int(cumulative)
+    return report
+
+
+def test_cli_entry_point_does_not_import_heavy_dependencies():
+    report = import_time_report("import jiraclui.main; jiraclui.main.parse_args(['-i', 'PRA-1'])")
+    assert "jiraclui.main" in report
+    loaded = sorted(module for module in report if module.split(".")[0] in HEAVY_MODULES)
+    assert not loaded, (
+        f"jiraclui.main imported {loaded} at startup "
+        f"(cumulative import time {report['jiraclui.main']} us)"
+    )
+
+
+# Modules only the board, bulk, create and export commands need.
+LAZY_MODULES = ("sqlite3", "questionary", "jiraclui.ticket_store", "jiraclui.offline", "jiraclui.jira_handler",
+                "jiraclui.manifest", "jiraclui.create_meta", "jiraclui.transition_cache", "jiraclui.exporter")
+
+
+def test_issue_lookup_does_not_import_board_or_store_modules(tmp_path, jira_server):
+    config = tmp_path / "config.yaml"
+    config.write_text(json.dumps({'project_names': ['PRA'], 'api_url': jira_server.url, 'api_token': 'token',
+                                  'app_options': {'cache_dir': str(tmp_path / "cache")}}))
+    code = (
+        "import json, sys\n"
+        "import jiraclui.main\n"
+        "try:\n"
+        f"    jiraclui.main.main(['-c', {str(config)!r}, '-i', 'PRA-1'])\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        f"print(json.dumps(sorted(name for name in {LAZY_MODULES!r} if name in sys.modules)))\n"
+    )
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(
+        filter(None, [os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"),
+                      os.environ.get("PYTHONPATH")])))
+    result = subprocess.run([sys.executable, "-c", code], env=env, capture_output=True, text=True, check=False)
+
+    assert "Summary of PRA-1" in result.stdout, result.stderr
+    assert json.loads(result.stdout.splitlines()[-1]) == []
+    assert jira_server.paths == ['/rest/api/2/serverInfo', '/rest/api/2/issue/PRA-1']
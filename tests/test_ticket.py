@@ -0,0 +1,26 @@
+from jiraclui.ticket import Ticket
+
+
+def test_from_json_interns_repeated_values():
+    raw_issues = [
+        {'key': f'PRA-{number}', 'fields': {
+            'project': {'name': 'Project ' + 'A'},
+            'summary': 'Title',
+            'assignee': {'displayName': ''.join(['Ali', 'ce'])},
+            'reporter': None,
+            'status': {'name': ''.join(['Do', 'ne'])},
+        }}
+        for number in range(2)
+    ]
+    first, second = (Ticket.from_json(raw_issue) for raw_issue in raw_issues)
+    assert first.status is second.status
+    assert first.assignee is second.assignee
+    assert first.project is second.project
+    assert first.reporter is None
+    assert not hasattr(first, '__dict__')
+
+
+def test_details_keep_display_order():
+    ticket = Ticket('PRA-1', 'Alpha', 'Title', None, 'Bob', 'Open', description='Text')
+    assert [label for label, _ in ticket.details()] == ['ticketNo', 'project', 'title', 'description', 'assignee', 'reporter', 'status']
+    assert ticket.search_values() == ('PRA-1', 'Alpha', 'Title', None, 'Bob', 'Open')
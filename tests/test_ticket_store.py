@@ -0,0 +1,92 @@
+import sqlite3
+from jiraclui.ticket import Ticket
+from jiraclui.ticket_store import TicketStore
+from jiraclui.transition_cache import TransitionCache
+
+
+def make_ticket(key, status="Open", created="2024-01-01T10:00:00.000+0000"):
+    return Ticket(key, 'Project A', f'Title {key}', None, 'Bob', status, created=created, updated=created)
+
+
+def test_delta_merge_updates_existing_tickets(tmp_path):
+    store = TicketStore(str(tmp_path / "tickets.db"))
+    scope = TicketStore.scope_for('PRA', [])
+    assert store.get_sync_state(scope) == (None, None)
+
+    store.merge_tickets(scope, [make_ticket('PRA-1'), make_ticket('PRA-2', created="2024-01-02T10:00:00.000+0000")], 100.0, full_sync=True)
+    store.merge_tickets(scope, [make_ticket('PRA-1', status="Done")], 200.0)
+
+    assert store.get_sync_state(scope) == (200.0, 100.0)
+    tickets = store.get_tickets(scope)
+    assert [ticket.ticket_no for ticket in tickets] == ['PRA-2', 'PRA-1']
+    assert tickets[1].status == "Done"
+    assert tickets[0].updated == "2024-01-02T10:00:00.000+0000"
+
+
+def test_full_sync_replaces_scope(tmp_path):
+    store = TicketStore(str(tmp_path / "tickets.db"))
+    scope = TicketStore.scope_for('PRA', ['bob'])
+    other = TicketStore.scope_for('PRB', ['bob'])
+    store.merge_tickets(scope, [make_ticket('PRA-1')], 100.0, full_sync=True)
+    store.merge_tickets(other, [make_ticket('PRB-1')], 100.0, full_sync=True)
+    store.merge_tickets(scope, [make_ticket('PRA-3')], 300.0, full_sync=True)
+
+    assert [ticket.ticket_no for ticket in store.get_tickets(scope)] == ['PRA-3']
+    assert len(store.get_tickets(other, limit=1)) == 1
+
+
+def test_update_ticket_patches_every_scope(tmp_path):
+    store = TicketStore(str(tmp_path / "tickets.db"))
+    scopes = [TicketStore.scope_for('PRA', []), TicketStore.scope_for('PRA', ['bob'])]
+    for scope in scopes:
+        store.merge_tickets(scope, [make_ticket('PRA-1')], 100.0, full_sync=True)
+    store.update_ticket(make_ticket('PRA-1', status="Done"))
+    store.update_ticket(make_ticket('PRA-9', status="Done"))
+
+    assert [ticket.status for scope in scopes for ticket in store.get_tickets(scope)] == ["Done", "Done"]
+
+
+def test_offline_reads(tmp_path):
+    store = TicketStore(str(tmp_path / "tickets.db"))
+    scopes = [TicketStore.scope_for('PRA', []), TicketStore.scope_for('PRB', [])]
+    assert store.last_synced(scopes) is None
+    store.merge_tickets(scopes[0], [make_ticket('PRA-1'), make_ticket('PRA-2', created="2024-03-05T09:00:00.000+0000")], 100.0, full_sync=True)
+    store.merge_tickets(scopes[1], [make_ticket('PRB-1', created="2024-03-05T10:00:00.000+0000")], 200.0, full_sync=True)
+    store.merge_tickets(TicketStore.scope_for('PRA', ['bob']), [make_ticket('PRA-2', created="2024-03-05T09:00:00.000+0000")], 200.0, full_sync=True)
+
+    assert store.last_synced(scopes) == 100.0
+    assert store.get_ticket('PRA-1').title == 'Title PRA-1'
+    assert store.get_ticket('PRA-9') is None
+    assert [ticket.ticket_no for ticket in store.get_tickets_since(['PRA'], '2024-03-05')] == ['PRA-2']
+    assert [ticket.ticket_no for ticket in store.get_tickets_since(['PRA', 'PRB'], '2024-03-05')] == ['PRB-1', 'PRA-2']
+
+
+def test_project_key_and_issue_type_round_trip_to_the_transition_cache_key(tmp_path):
+    store = TicketStore(str(tmp_path / "tickets.db"))
+    scope = TicketStore.scope_for('PRA', [])
+    ticket = Ticket('PRA-1', 'Project A', 'Title', None, 'Bob', 'Open', created='2024-01-01', updated='2024-01-01',
+                    project_key='PRA', issue_type='Bug')
+    store.merge_tickets(scope, [ticket], 100.0, full_sync=True)
+
+    for stored in (store.get_tickets(scope)[0], store.get_ticket('PRA-1'), store.get_tickets_since(['PRA'], '2024')[0]):
+        assert (stored.project_key, stored.issue_type) == ('PRA', 'Bug')
+        assert TransitionCache.key_for(stored) == 'PRA|Bug|Open'
+
+
+def test_stores_of_older_versions_are_migrated_and_fully_synced(tmp_path):
+    path = str(tmp_path / "tickets.db")
+    conn = sqlite3.connect(path)
+    with conn:
+        conn.execute('CREATE TABLE tickets (scope TEXT NOT NULL, ticket_no TEXT NOT NULL, project TEXT, title TEXT, '
+                     'assignee TEXT, reporter TEXT, status TEXT, created TEXT, updated TEXT, PRIMARY KEY (scope, ticket_no))')
+        conn.execute('CREATE TABLE sync_state (scope TEXT PRIMARY KEY, last_sync REAL, last_full_sync REAL)')
+        conn.execute("INSERT INTO tickets VALUES ('PRA|', 'PRA-1', 'Project A', 'Title', NULL, 'Bob', 'Open', '2024', '2024')")
+        conn.execute("INSERT INTO sync_state VALUES ('PRA|', 200.0, 100.0)")
+    conn.close()
+
+    store = TicketStore(path)
+
+    assert store.get_sync_state('PRA|') == (200.0, None)
+    assert store.get_ticket('PRA-1').project_key is None
+    store.merge_tickets('PRA|', [make_ticket('PRA-1')], 300.0)
+    assert store.get_ticket('PRA-1').title == 'Title PRA-1'
@@ -0,0 +1,78 @@
+import json
+import pytest
+
+requests = pytest.importorskip("requests")
+
+from jiraclui.transport import CassetteMiss, ReplayAdapter  # noqa: E402
+
+SEARCH_URL = "https://jira.example.com/rest/api/2/search"
+
+
+def replay_session(tmp_path, interactions):
+    cassette = tmp_path / "cassette.json"
+    cassette.write_text(json.dumps({'interactions': interactions}))
+    adapter = ReplayAdapter(2, str(cassette))
+    session = requests.Session()
+    session.mount("https://", adapter)
+    return session, adapter
+
+
+def interaction(body, status=200):
+    return {
+        'request': f"GET {SEARCH_URL}?jql=project%3DPRA&startAt=0 ",
+        'status': status,
+        'headers': {'Content-Type': 'application/json'},
+        'body': json.dumps(body),
+        'elapsed': 0.0,
+    }
+
+
+def test_replay_serves_recorded_responses_in_order(tmp_path):
+    session, adapter = replay_session(tmp_path, [interaction({'total': 1}), interaction({'total': 2})])
+    # Query parameters are matched regardless of their order.
+    url = f"{SEARCH_URL}?startAt=0&jql=project%3DPRA"
+
+    assert session.get(url).json() == {'total': 1}
+    assert session.get(url).json() == {'total': 2}
+    assert session.get(url).json() == {'total': 2}
+    with pytest.raises(CassetteMiss):
+        session.get(f"{SEARCH_URL}?jql=project%3DPRB")
+
+
+def test_requests_are_counted_per_command(tmp_path):
+    session, adapter = replay_session(tmp_path, [interaction({'total': 1})])
+    url = f"{SEARCH_URL}?jql=project%3DPRA&startAt=0"
+
+    session.get(url)
+    with adapter.track('refresh'):
+        session.get(url)
+        session.get(url)
+
+    assert adapter.counts == {'startup': 1, 'refresh': 2}
+
+
+def test_a_recorded_board_load_replays_without_network_and_counts_its_requests(tmp_path, jira_server):
+    pytest.importorskip("jira")
+    from jiraclui.connection import JiraConnection
+    from jiraclui.jira_client import JiraClient
+
+    cassette = str(tmp_path / "board.json")
+    # One fetch worker, so that the field list jira caches is requested once whatever the thread timing.
+    options = {'max_table_entry': 50, 'page_size': 2, 'fetch_workers': 1}
+
+    def load_board(**app_options):
+        client = JiraClient(jira_server.url, 'token', dict(options, **app_options))
+        with client.track('refresh'):
+            tickets = client.get_jira_tickets(['PRA', 'PRB'], [])
+        counts = dict(client.connection.transport.counts)
+        JiraConnection.close_all()
+        return sorted(ticket.ticket_no for ticket in tickets), counts
+
+    recorded, _ = load_board(record=cassette, cache_dir=str(tmp_path / "record"))
+    served = len(jira_server.paths)
+    replayed, counts = load_board(replay=cassette, cache_dir=str(tmp_path / "replay"))
+
+    assert replayed == recorded == ['PRA-1', 'PRA-2', 'PRA-3', 'PRB-1', 'PRB-2', 'PRB-3']
+    assert len(jira_server.paths) == served
+    # Server info, then the field list jira reads before its first search, and two pages per project.
+    assert counts == {'startup': 1, 'refresh': 5}